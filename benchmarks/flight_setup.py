@@ -0,0 +1,53 @@
+import argparse
+import copy
+import time
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+
+
+def time_flight_setup(rows: int, columns: int, flights: int):
+    """
+    Times the creation of many flights on one aircraft.
+
+    Args:
+        rows (int): The number of rows of the aircraft.
+        columns (int): The number of seats per row.
+        flights (int): The number of flights to create.
+
+    Returns:
+        dict: The seconds spent creating the flights (with their seat sale), and the seconds
+        spent copying the aircraft with `copy.deepcopy` the same number of times, for reference.
+    """
+    aircraft = Aircraft(rows, columns)
+
+    start = time.perf_counter()
+    for seed in range(flights):
+        Flight(aircraft, seed=seed)
+    flight_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(flights):
+        copy.deepcopy(aircraft)
+    deepcopy_seconds = time.perf_counter() - start
+
+    return {"flight_setup": flight_seconds, "deepcopy": deepcopy_seconds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Times the setup of many flights on one aircraft.")
+    parser.add_argument("--rows", type=int, default=30, help="number of rows of the aircraft")
+    parser.add_argument("--columns", type=int, default=6, help="number of seats per row")
+    parser.add_argument("--flights", type=int, default=10000, help="number of flights to create")
+    args = parser.parse_args()
+
+    result = time_flight_setup(args.rows, args.columns, args.flights)
+    print(
+        f"{args.flights} flights on {args.rows}x{args.columns}: {result['flight_setup']:.2f} s "
+        f"({result['flight_setup'] / args.flights * 1e6:.0f} us per flight) | "
+        f"deepcopy of the aircraft alone: {result['deepcopy']:.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import gc
+import tracemalloc
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+from models.passenger import Passenger
+
+
+def _traced_bytes(build):
+    """
+    Returns the memory still allocated once `build` returns, and the object it built.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    built = build()
+    allocated = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return allocated, built
+
+
+def measure_memory(rows: int, columns: int, seed: int = 0):
+    """
+    Measures the memory used per passenger and per seat.
+
+    Args:
+        rows (int): The number of rows of the aircraft.
+        columns (int): The number of seats per row.
+        seed (int): The seed of the flight.
+
+    Returns:
+        dict: The bytes allocated per passenger (with their seat assignment) and per seat
+        (with the layout of the aircraft).
+    """
+    aircraft_bytes, aircraft = _traced_bytes(lambda: Aircraft(rows, columns))
+    flight = Flight(Aircraft(1, 1), seed=seed)
+
+    def create_passengers():
+        passengers = [Passenger(flight, True) for _ in range(len(aircraft.seats))]
+        for passenger, seat in zip(passengers, aircraft.seats):
+            passenger.seat = seat
+        return passengers
+
+    passenger_bytes, passengers = _traced_bytes(create_passengers)
+    return {
+        "bytes_per_passenger": passenger_bytes / len(passengers),
+        "bytes_per_seat": aircraft_bytes / len(aircraft.seats),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures the memory used per simulated passenger and seat.")
+    parser.add_argument("--rows", type=int, default=60, help="number of rows of the aircraft")
+    parser.add_argument("--columns", type=int, default=10, help="number of seats per row")
+    args = parser.parse_args()
+
+    result = measure_memory(args.rows, args.columns)
+    print(
+        f"{args.rows}x{args.columns}: {result['bytes_per_passenger']:.0f} bytes per passenger | "
+        f"{result['bytes_per_seat']:.0f} bytes per seat"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+from pathlib import Path
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+
+# Cabin sizes (rows, columns), from narrow-body to large wide-body
+CABINS = [(30, 6), (45, 6), (60, 10), (80, 10), (120, 12)]
+
+# Seed of every flight of the suite, so numbers are comparable across commits
+SEED = 2024
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+MAIN_PATH = Path(__file__).resolve().parent.parent / "main.py"
+
+
+def _layout_generation(rows, columns):
+    """Generates the layout of an aircraft."""
+    return None, lambda _: Aircraft(rows, columns)
+
+
+def _sell_seats(rows, columns):
+    """Creates a flight, which copies the layout and sells its seats."""
+    aircraft = Aircraft(rows, columns)
+    return aircraft, lambda aircraft: Flight(aircraft, seed=SEED)
+
+
+def _aisle_grouping(rows, columns):
+    """Groups the passengers of a flight by aisle."""
+    flight = Flight(Aircraft(rows, columns), seed=SEED)
+    return flight, lambda flight: flight.get_passengers_by_aisle()
+
+
+def _single_tick(rows, columns):
+    """Simulates one tick in the middle of the boarding (the most crowded phase)."""
+    flight = Flight(Aircraft(rows, columns), seed=SEED)
+    ticks = flight.boarding_ticks()
+    for _ in range(rows * 2):
+        next(ticks)
+    return ticks, next
+
+
+def _headless_boarding(rows, columns):
+    """Boards a flight to completion with the object engine."""
+    flight = Flight(Aircraft(rows, columns), seed=SEED)
+    return flight, lambda flight: flight.run_headless()
+
+
+def _vectorized_boarding(rows, columns):
+    """Boards a flight to completion with the NumPy engine."""
+    flight = Flight(Aircraft(rows, columns), seed=SEED)
+    return flight, lambda flight: flight.run_headless("vectorized")
+
+
+def _headless_startup(rows, columns):
+    """Starts a process running one headless boarding from the command line (imports included)."""
+    command = [sys.executable, str(MAIN_PATH), "--headless", "--rows", str(rows), "--columns", str(columns),
+               "--seed", str(SEED)]
+    return command, lambda command: subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+# Benchmarks, by name. Each one takes a cabin size and returns the state to run on (built
+# outside of the timed section) and the function to time.
+BENCHMARKS = {
+    "layout_generation": _layout_generation,
+    "sell_seats": _sell_seats,
+    "aisle_grouping": _aisle_grouping,
+    "single_tick": _single_tick,
+    "headless_boarding": _headless_boarding,
+    "vectorized_boarding": _vectorized_boarding,
+    "headless_startup": _headless_startup,
+}
+
+
+def run_benchmark(name: str, rows: int, columns: int, repeats: int):
+    """
+    Times one benchmark on one cabin size, after one untimed warm-up run (imports, caches).
+    Each run gets a fresh state.
+
+    Args:
+        name (str): The name of the benchmark in BENCHMARKS.
+        rows (int): The number of rows of the aircraft.
+        columns (int): The number of seats per row.
+        repeats (int): The number of timed runs.
+
+    Returns:
+        dict: The median and minimum durations in seconds, and the number of repeats.
+    """
+    state, function = BENCHMARKS[name](rows, columns)
+    function(state)
+
+    durations = []
+    for _ in range(repeats):
+        state, function = BENCHMARKS[name](rows, columns)
+        start = time.perf_counter()
+        function(state)
+        durations.append(time.perf_counter() - start)
+    return {"median": statistics.median(durations), "min": min(durations), "repeats": repeats}
+
+
+def run_suite(cabins=CABINS, names=None, repeats: int = 5):
+    """
+    Runs the benchmarks over the cabin sizes.
+
+    Args:
+        cabins (list): The cabin sizes (rows, columns).
+        names (list, optional): The benchmarks to run. Defaults to all of them.
+        repeats (int): The number of timed runs of each benchmark.
+
+    Returns:
+        dict: The results keyed by "<benchmark>/<rows>x<columns>".
+    """
+    results = {}
+    # Overbooked flights warn when seats run out, which would clutter the report
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for name in names or BENCHMARKS:
+            for rows, columns in cabins:
+                results[f"{name}/{rows}x{columns}"] = run_benchmark(name, rows, columns, repeats)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float):
+    """
+    Compares results with a baseline.
+
+    Args:
+        results (dict): The results of `run_suite`.
+        baseline (dict): The results of a previous run.
+        threshold (float): The relative slowdown of the median above which a benchmark regressed.
+
+    Returns:
+        list: The (key, ratio) of each regressed benchmark.
+    """
+    regressions = []
+    for key, result in results.items():
+        if key in baseline:
+            ratio = result["median"] / baseline[key]["median"]
+            if ratio > 1 + threshold:
+                regressions.append((key, ratio))
+    return regressions
+
+
+def speedups(results: dict, engine: str = "vectorized_boarding", reference: str = "headless_boarding"):
+    """
+    Computes how much faster a boarding engine is than another one on each cabin size.
+
+    Args:
+        results (dict): The results of `run_suite`.
+        engine (str): The benchmark of the engine to assess.
+        reference (str): The benchmark of the engine it is compared with.
+
+    Returns:
+        dict: The ratio of the reference median to the engine median, keyed by "<rows>x<columns>",
+        for the cabin sizes both benchmarks ran on (above 1 when the engine is faster).
+    """
+    ratios = {}
+    for key, result in results.items():
+        name, cabin = key.split("/")
+        if name == engine and f"{reference}/{cabin}" in results:
+            ratios[cabin] = results[f"{reference}/{cabin}"]["median"] / result["median"]
+    return ratios
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the boarding hot paths.")
+    parser.add_argument("--output", type=Path, default=Path("bench_output.json"), help="JSON file of the results")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="JSON file of the baseline results")
+    parser.add_argument("--threshold", type=float, default=0.25, help="relative slowdown reported as a regression")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--quick", action="store_true", help="only run the two smallest cabins")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args()
+
+    cabins = CABINS[:2] if args.quick else CABINS
+    results = run_suite(cabins, args.only, args.repeats)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": SEED,
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+
+    baseline = json.loads(args.baseline.read_text())["results"] if args.baseline.exists() else {}
+    for key, result in results.items():
+        reference = f" | baseline {baseline[key]['median'] * 1e3:10.3f} ms" if key in baseline else ""
+        print(f"{key:>30} | median {result['median'] * 1e3:10.3f} ms{reference}")
+    for cabin, ratio in speedups(results).items():
+        print(f"{'vectorized speedup/' + cabin:>30} | {ratio:10.2f}x the speed of the object engine")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    for key, ratio in regressions:
+        print(f"Regression: {key} is {ratio:.2f}x slower than the baseline")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
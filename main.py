@@ -1,13 +1,72 @@
+import argparse
+import warnings
+
 from models.flight import Flight
 from models.aircraft import Aircraft
+from models.strategies import STRATEGIES
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Simulates the boarding of a flight.")
+    parser.add_argument("--rows", type=int, default=10, help="number of rows of the aircraft")
+    parser.add_argument("--columns", type=int, default=10, help="number of seats per row")
+    parser.add_argument("--seed", type=int, help="seed of the first flight (random when omitted)")
+    parser.add_argument("--strategy", choices=list(STRATEGIES), default="random", help="boarding strategy")
+    parser.add_argument("--engine", choices=["objects", "vectorized", "events"], default="objects",
+                        help="boarding engine of the headless runs")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--headless", action="store_true", help="run without rendering and print the results")
+    mode.add_argument("--render", action="store_true", help="animate the boarding in the terminal (default)")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between two rendered ticks")
+    parser.add_argument("--runs", type=int, default=1, help="number of headless runs, on consecutive seeds")
+    parser.add_argument("--output", help="path of the result files of the headless runs, without extension")
+    parser.add_argument("--format", choices=["csv", "npz"], default="csv", help="format of the result files")
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    if not args.headless and (args.runs > 1 or args.output):
+        parser.error("--runs and --output need --headless")
+    return args
+
+
+def run_headless(args):
+    """
+    Runs the headless boardings of the command line, printing one line per run and writing
+    the results when an output path is given.
+    """
+    aircraft = Aircraft(args.rows, args.columns)
+    writer = None
+    if args.output:
+        from utils.manifest import ResultWriter  # Only needed when results are written
+
+        writer = ResultWriter(args.output, args.format)
+    try:
+        for run in range(args.runs):
+            seed = None if args.seed is None else args.seed + run
+            flight = Flight(aircraft, seed=seed)
+            result = flight.run_headless(args.engine, args.strategy)
+            print(f"run {run} | {len(result.seat_times)} passengers | {result.ticks:g} {result.unit} | "
+                  f"{result.total_congestion:g} {result.unit} blocked")
+            if writer:
+                writer.add_run(str(run if seed is None else seed), f"{args.rows}x{args.columns}", flight, result)
+    finally:
+        if writer:
+            writer.close()
+
 
-def main():
-    rows = 10
-    columns = 10
-    aircraft = Aircraft(rows, columns)
+def main(argv=None):
+    args = parse_arguments(argv)
+    with warnings.catch_warnings():
+        # Flights overbook by default (load factor up to 1.03): passengers left without a seat
+        # are part of the model, not something to warn about on every run of the command line
+        warnings.filterwarnings("ignore", message="No more seats available", category=RuntimeWarning)
+        if args.headless:
+            run_headless(args)
+            return
 
-    flight = Flight(aircraft)
-    flight.boarding_simulation()
+        aircraft = Aircraft(args.rows, args.columns)
+        flight = Flight(aircraft, seed=args.seed)
+        flight.boarding_simulation(args.interval, args.strategy)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,25 +1,81 @@
+from collections import namedtuple
+from functools import lru_cache
+
 from .seat import Seat  # Importing the Seat class (assumed to handle individual seat details)
+from .cabin_config import CabinConfig, column_labels  # Importing the cabin configurations
+
+BLOCKED_CELL = "#"  # Marker of a layout cell without a seat (missing seat, galley, exit row space)
+
+# Static geometry of a layout column: its closest aisle, and the direction of a passenger
+# walking from the aisle to it (-1 left, 1 right, 0 for an aisle)
+ColumnGeometry = namedtuple("ColumnGeometry", ("aisle", "direction"))
+
+
+@lru_cache(maxsize=64)
+def column_geometry(nearest_aisle: tuple):
+    """
+    Computes the geometry of each column of a layout. The result only depends on the aisle
+    positions, so it is cached and shared by all the aircraft of the same type.
+
+    Args:
+        nearest_aisle (tuple): The closest aisle of each layout column (see `CabinConfig.nearest_aisle`).
+
+    Returns:
+        tuple: The ColumnGeometry of each layout column.
+    """
+    return tuple(
+        ColumnGeometry(aisle, (column > aisle) - (column < aisle))
+        for column, aisle in enumerate(nearest_aisle)
+    )
+
 
 class Aircraft:
     """
     A class to represent an aircraft, including its seating layout, capacity, and seat management.
+
+    The aircraft is a read-only template: its layout, seats and labels are shared by all the
+    flights using it, and each flight boards on its own copy of the grid (see `new_layout`).
+
+    Standard aircraft are built from a number of rows and columns. Any other cabin (several
+    aisles, missing seats, several doors) is built from a `CabinConfig` with `from_cabin`.
     """
     
-    def __init__(self, rows: int, columns: int):
+    def __init__(self, rows: int, columns: int, cabin: CabinConfig = None):
         """
         Initializes an Aircraft object.
 
         Args:
             rows (int): The number of rows in the aircraft.
             columns (int): The number of columns in the aircraft.
+            cabin (CabinConfig, optional): The cabin configuration to follow instead of a standard layout.
         """
         self._rows = rows  # Number of rows in the aircraft
         self._columns = columns  # Number of columns in the aircraft
         self._capacity = rows * columns  # Total capacity (rows * columns)
-        self._layout = []  # Holds the seating layout (list of lists)
+        self._layout = ()  # Holds the seating layout (tuple of rows, labels last)
         self._seats = []  # Holds the list of added Seat objects
+        self._column_index = {}  # Maps each seat letter to its column index in the layout
+        self._aisle_positions = []  # Column indices of the aisles
+        self._seat_aisle = {}  # Maps each seat to the column index of its closest aisle
+        self._geometry = ()  # Geometry of each layout column, shared by the aircraft of the same type
+        self._closest_seats = {}  # Maps each aisle to the seats closest to it
+        self._cabin = cabin  # Compiled cabin configuration of the layout
         self.generate_layout()  # Generate the initial layout based on rows and columns
 
+    @classmethod
+    def from_cabin(cls, cabin: CabinConfig):
+        """
+        Creates an aircraft from a compiled cabin configuration (see `models.cabin_config`).
+
+        Args:
+            cabin (CabinConfig): The cabin configuration.
+
+        Returns:
+            Aircraft: The aircraft.
+        """
+        labels = cabin.labels
+        return cls(cabin.rows, len(labels) - labels.count("-"), cabin)
+
     # Getter and setter for rows
     @property
     def rows(self):
@@ -28,6 +84,8 @@ class Aircraft:
     @rows.setter
     def rows(self, new_val: int):
         self._rows = new_val
+        self._cabin = None  # Back to a standard layout
+        self.generate_layout()
 
     # Getter and setter for columns
     @property
@@ -37,6 +95,8 @@ class Aircraft:
     @columns.setter
     def columns(self, new_val: int):
         self._columns = new_val
+        self._cabin = None  # Back to a standard layout
+        self.generate_layout()
 
     # Getter for capacity (no setter as capacity is derived from rows and columns)
     @property
@@ -53,6 +113,80 @@ class Aircraft:
     def seats(self):
         return self._seats
 
+    # Getter for the compiled cabin configuration (geometry tables, doors)
+    @property
+    def cabin(self):
+        return self._cabin
+
+    def new_layout(self):
+        """
+        Creates a mutable copy of the layout grid for one flight, in O(cells).
+        Seats and labels are shared with the aircraft, only the rows are copied.
+
+        Returns:
+            list: The seating rows as lists, followed by the labels.
+        """
+        return [list(row) for row in self._layout[:-1]] + [self._layout[-1]]
+
+    # Getter for the aisle positions (column indices)
+    @property
+    def aisle_positions(self):
+        return self._aisle_positions
+
+    def column_of(self, letter: str):
+        """
+        Returns the column index of a seat letter in the layout.
+
+        Args:
+            letter (str): The seat letter.
+
+        Returns:
+            int: The column index.
+        """
+        return self._column_index[letter]
+
+    def aisle_of(self, seat):
+        """
+        Returns the aisle closest to a seat.
+
+        Args:
+            seat (Seat): A seat of this aircraft.
+
+        Returns:
+            int: The column index of the aisle.
+        """
+        return self._seat_aisle[seat]
+
+    # Getter for the geometry of each layout column
+    @property
+    def geometry(self):
+        return self._geometry
+
+    def seat_named(self, name: str):
+        """
+        Returns the seat with a given name, written letter first ("A12", as `Seat.name`) or
+        number first ("12A", as on boarding passes).
+
+        Args:
+            name (str): The seat name.
+
+        Returns:
+            Seat: The seat.
+
+        Raises:
+            KeyError: If the aircraft has no such seat.
+        """
+        name = name.strip().upper()
+        letters = name.strip("0123456789")
+        number = name[len(letters):] if name.startswith(letters) else name[:-len(letters) or None]
+        column = self._column_index.get(letters)
+        row = int(number) - 1 if number.isdigit() else -1
+        # Resolved on the layout grid: aisles and blocked cells hold no Seat
+        seat = self._layout[row][column] if column is not None and 0 <= row < self._rows else None
+        if not isinstance(seat, Seat):
+            raise KeyError(f"No seat {name} in this aircraft")
+        return seat
+
     def add_seat(self, seat):
         """
         Adds a Seat object to the list of seats.
@@ -110,37 +244,71 @@ class Aircraft:
         layout.append(labels)  # Append the labels to the layout for reference
         return layout
 
+    def _generate_cabin_layout(self, cabin: CabinConfig):
+        """
+        Generates the seating layout of a cabin configuration.
+
+        Args:
+            cabin (CabinConfig): The cabin configuration.
+
+        Returns:
+            list: The seating layout, blocked cells holding BLOCKED_CELL.
+        """
+        layout = []
+        for i in range(cabin.rows):
+            row = []
+            for j, label in enumerate(cabin.labels):
+                if label == "-":
+                    row.append("|")
+                elif (i, j) in cabin.blocked:
+                    row.append(BLOCKED_CELL)
+                else:
+                    row.append(Seat(label, i + 1, self))
+            layout.append(row)
+        layout.append(list(cabin.labels))  # Append the labels to the layout for reference
+        return layout
+
     def generate_layout(self):
         """
-        Generates the seating layout based on the number of columns.
-        Uses single-aisle for <=6 columns and double-aisle for more.
+        Generates the seating layout. Standard aircraft use a single aisle for <=6 columns
+        and a double aisle for more; other aircraft follow their cabin configuration.
         """
-        labels = [chr(65 + i) for i in range(self.columns)]  # Generate column labels (e.g., A, B, C...)
-        if self.columns <= 6:
-            # Use single-aisle layout for narrow planes
-            layout = self._generate_single_aisle_layout(labels)
+        self._seats = []
+        if self._cabin is not None:
+            layout = self._generate_cabin_layout(self._cabin)
         else:
-            # Use double-aisle layout for wider planes
-            layout = self._generate_double_aisle_layout(labels)
-        self._layout = layout  # Store the generated layout
+            labels = column_labels(self.columns)  # Generate column labels (e.g., A, B, C...)
+            if self.columns <= 6:
+                # Use single-aisle layout for narrow planes
+                layout = self._generate_single_aisle_layout(labels)
+            else:
+                # Use double-aisle layout for wider planes
+                layout = self._generate_double_aisle_layout(labels)
+            self._cabin = CabinConfig(f"{self._rows}x{self._columns}", self._rows, layout[-1])
+        self._capacity = len(self._seats)
+        self._layout = tuple(tuple(row) for row in layout)  # Store the generated layout, read-only
+        self._build_index()
+
+    def _build_index(self):
+        """
+        Builds the lookup tables of the layout: seat letter to column, seat to closest aisle,
+        and aisle to closest seats. They are computed once, when the layout is generated.
+        """
+        labels = self._layout[-1]
+        self._column_index = {label: index for index, label in enumerate(labels) if label != "-"}
+        self._aisle_positions = [index for index, label in enumerate(labels) if label == "-"]
+        closest_aisle = self._cabin.nearest_aisle  # Precomputed with the cabin configuration
+        self._seat_aisle = {seat: closest_aisle[self._column_index[seat.letter]] for seat in self._seats}
+        self._geometry = column_geometry(closest_aisle)
+        self._closest_seats = {aisle: [] for aisle in self._aisle_positions}
+        for seat in self._seats:
+            self._closest_seats[self._seat_aisle[seat]].append(seat)
 
     def get_closest_seats_for_each_aisle(self):
         """
-        Finds the closest seats to each aisle and groups them.
+        Groups the seats by their closest aisle, using the index built with the layout.
 
         Returns:
             dict: A mapping of aisle positions (column indices) to the closest seats.
         """
-        # Find the positions of aisles based on the layout labels
-        aisle_positions = [index for index, label in enumerate(self._layout[-1]) if label == "-"]
-        aisle_seat_map = {aisle: [] for aisle in aisle_positions}  # Initialize aisle-to-seat map
-
-        # Iterate through each seat to find its closest aisle
-        for seat in self._seats:
-            seat_row = seat.number - 1  # Determine the seat's row
-            seat_col = self._layout[-1].index(seat.letter)  # Determine the seat's column
-            # Find the closest aisle to the current seat
-            closest_aisle = min(aisle_positions, key=lambda aisle: abs(aisle - seat_col))
-            aisle_seat_map[closest_aisle].append(seat)  # Map the seat to the closest aisle
-
-        return aisle_seat_map
+        return {aisle: list(seats) for aisle, seats in self._closest_seats.items()}
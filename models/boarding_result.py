@@ -0,0 +1,60 @@
+# Unit of the boarding times of each engine of `Flight.run_headless`, stored on its results
+TIME_UNITS = {"objects": "ticks", "vectorized": "ticks", "events": "seconds"}
+
+
+class BoardingResult:
+    """
+    Represents the outcome of a boarding run.
+
+    Attributes (Properties):
+    - ticks (int): The total number of ticks needed to seat every passenger (seconds, as a float,
+      for the "events" engine)
+    - seat_times (dict): The tick at which each passenger sat down, keyed by passenger identifier
+    - aisle_congestion (dict): For each aisle (column index), the number of blocked passengers per row
+    - total_congestion (int): The total number of ticks passengers spent blocked in the aisles
+    - unit (str): The unit of the times, "ticks", or "seconds" for the "events" engine
+    """
+
+    def __init__(self, ticks: int, seat_times: dict, aisle_congestion: dict, unit: str = "ticks"):
+        """
+        Initializes a BoardingResult instance.
+
+        Parameters:
+        - ticks (int): Total number of ticks of the run
+        - seat_times (dict): Tick at which each passenger sat down, keyed by passenger identifier
+        - aisle_congestion (dict): Blocked passenger counts per aisle and row
+        - unit (str): Unit of the times, one of the values of TIME_UNITS
+        """
+        self._ticks = ticks
+        self._seat_times = dict(seat_times)
+        self._aisle_congestion = {aisle: list(counts) for aisle, counts in aisle_congestion.items()}
+        self._unit = unit
+
+    # Property for controlled access to the total number of ticks
+    @property
+    def ticks(self):
+        return self._ticks
+
+    # Property for controlled access to the seat times
+    @property
+    def seat_times(self):
+        return self._seat_times
+
+    # Property for controlled access to the aisle congestion counts
+    @property
+    def aisle_congestion(self):
+        return self._aisle_congestion
+
+    # Property for the total number of blocked passenger ticks
+    @property
+    def total_congestion(self):
+        return sum(sum(counts) for counts in self._aisle_congestion.values())
+
+    # Property for controlled access to the unit of the times
+    @property
+    def unit(self):
+        return self._unit
+
+    # Custom representation of the BoardingResult instance for debugging/logging
+    def __repr__(self):
+        return f"BoardingResult(ticks={self._ticks}, passengers={len(self._seat_times)})"
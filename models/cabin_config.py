@@ -0,0 +1,292 @@
+# The standard library modules only needed to load configuration files (hashlib, json, re,
+# pathlib) are imported by the functions using them, to keep the import of the models fast.
+
+# Version of the compiled format stored in the cache, part of the cache key
+COMPILED_VERSION = 1
+
+DEFAULT_CACHE_DIR = ".cabin_cache"
+
+# Aircraft already loaded in this process, by content hash. Aircraft are read-only templates,
+# so flights of the same aircraft type share one instance. Entries are never evicted: there is
+# one per distinct configuration file, and `load_aircraft(..., shared=False)` bypasses it.
+_loaded_aircraft = {}
+
+SEAT_NAME = r"^([A-Z]+)(\d+)$"  # Pattern of a seat name, e.g. "B12"
+
+
+def column_labels(count: int):
+    """
+    Builds seat column labels past the 26 letters of the alphabet: A to Z, then AA, AB, ...
+
+    Args:
+        count (int): The number of labels.
+
+    Returns:
+        list: The labels.
+    """
+    labels = []
+    for index in range(count):
+        label = ""
+        index += 1
+        while index:
+            index, remainder = divmod(index - 1, 26)
+            label = chr(65 + remainder) + label
+        labels.append(label)
+    return labels
+
+
+class CabinConfig:
+    """
+    Represents a compiled cabin configuration: the grid of an aircraft and the geometry tables
+    derived from it once.
+
+    Attributes (Properties):
+    - name (str): The name of the configuration
+    - rows (int): The number of rows
+    - labels (tuple): The label of each layout column, "-" for the aisles
+    - blocked (frozenset): The (row, column) indices of the cells without a seat
+    - doors (tuple): The rows (1-based) where passengers enter the aisles
+    - nearest_aisle (tuple): The column index of the closest aisle of each layout column
+    - distance_to_aisle (tuple): The number of columns between each layout column and its aisle
+    - door_distance (tuple): For each row index, the number of rows to each door
+    """
+
+    def __init__(self, name, rows, labels, blocked=(), doors=(1,)):
+        """
+        Initializes a CabinConfig and precomputes its geometry tables.
+
+        Args:
+            name (str): The name of the configuration.
+            rows (int): The number of rows.
+            labels (iterable): The label of each layout column, "-" for the aisles.
+            blocked (iterable): The (row, column) indices of the cells without a seat.
+            doors (iterable): The rows (1-based) where passengers enter the aisles.
+        """
+        self._name = name
+        self._rows = rows
+        self._labels = tuple(labels)
+        self._blocked = frozenset((row, column) for row, column in blocked)
+        self._doors = tuple(doors)
+        aisles = [index for index, label in enumerate(self._labels) if label == "-"]
+        self._nearest_aisle = tuple(min(aisles, key=lambda aisle: abs(aisle - column)) for column in range(len(self._labels)))
+        self._distance_to_aisle = tuple(abs(aisle - column) for column, aisle in enumerate(self._nearest_aisle))
+        self._door_distance = tuple(tuple(abs(row + 1 - door) for door in self._doors) for row in range(rows))
+
+    # Property for controlled access to the name
+    @property
+    def name(self):
+        return self._name
+
+    # Property for controlled access to the number of rows
+    @property
+    def rows(self):
+        return self._rows
+
+    # Property for controlled access to the column labels
+    @property
+    def labels(self):
+        return self._labels
+
+    # Property for controlled access to the cells without a seat
+    @property
+    def blocked(self):
+        return self._blocked
+
+    # Property for controlled access to the door rows
+    @property
+    def doors(self):
+        return self._doors
+
+    # Property for controlled access to the closest aisle of each column
+    @property
+    def nearest_aisle(self):
+        return self._nearest_aisle
+
+    # Property for controlled access to the distance of each column to its aisle
+    @property
+    def distance_to_aisle(self):
+        return self._distance_to_aisle
+
+    # Property for controlled access to the distance of each row to each door
+    @property
+    def door_distance(self):
+        return self._door_distance
+
+    def to_dict(self):
+        """
+        Returns the compiled configuration as a JSON-serializable dict.
+        """
+        return {
+            "version": COMPILED_VERSION,
+            "name": self._name,
+            "rows": self._rows,
+            "labels": list(self._labels),
+            "blocked": sorted(self._blocked),
+            "doors": list(self._doors),
+            "nearest_aisle": list(self._nearest_aisle),
+            "distance_to_aisle": list(self._distance_to_aisle),
+            "door_distance": [list(distances) for distances in self._door_distance],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuilds a compiled configuration from `to_dict`, reusing its tables instead of
+        computing them again.
+        """
+        cabin = cls.__new__(cls)
+        cabin._name = data["name"]
+        cabin._rows = data["rows"]
+        cabin._labels = tuple(data["labels"])
+        cabin._blocked = frozenset(tuple(cell) for cell in data["blocked"])
+        cabin._doors = tuple(data["doors"])
+        cabin._nearest_aisle = tuple(data["nearest_aisle"])
+        cabin._distance_to_aisle = tuple(data["distance_to_aisle"])
+        cabin._door_distance = tuple(tuple(distances) for distances in data["door_distance"])
+        return cabin
+
+    def __repr__(self):
+        seats = self._rows * (len(self._labels) - self._labels.count("-")) - len(self._blocked)
+        return f"CabinConfig(name={self._name!r}, rows={self._rows}, seats={seats}, doors={self._doors})"
+
+
+def parse_config(data: dict):
+    """
+    Compiles a declarative cabin configuration.
+
+    The configuration holds:
+    - name (str, optional): The name of the aircraft type
+    - rows (int): The number of rows
+    - columns (list | str): The layout columns from left to right, "|" marking an aisle. A
+      string uses one character per column; a list allows labels such as "AA". Labels default
+      to A, B, ... when the columns are given as a number of seats per aisle block, e.g. [3, 3]
+    - blocks (list, optional): Seat blocks, each with "rows" ([first, last], 1-based) and
+      "seats" (the labels present in these rows); the other seats of these rows are blocked
+    - blocked (list, optional): Names of single missing seats, e.g. "B12"
+    - doors (list, optional): The rows where passengers enter the aisles. Defaults to [1]
+
+    Args:
+        data (dict): The parsed JSON or TOML document.
+
+    Returns:
+        CabinConfig: The compiled configuration.
+
+    Raises:
+        ValueError: If the configuration is invalid.
+    """
+    import re
+
+    rows = data.get("rows")
+    if not isinstance(rows, int) or rows < 1:
+        raise ValueError("'rows' must be a positive integer")
+
+    columns = data.get("columns")
+    if isinstance(columns, str):
+        columns = list(columns)
+    elif isinstance(columns, list) and columns and all(isinstance(block, int) for block in columns):
+        labels = iter(column_labels(sum(columns)))
+        blocks, columns = columns, []
+        for index, size in enumerate(blocks):
+            if index:
+                columns.append("|")
+            columns.extend(next(labels) for _ in range(size))
+    if not isinstance(columns, list) or not columns:
+        raise ValueError("'columns' must be a string, a list of labels or a list of block sizes")
+    labels = ["-" if column == "|" else str(column) for column in columns]
+    seat_labels = [label for label in labels if label != "-"]
+    if "-" not in labels or not seat_labels:
+        raise ValueError("'columns' must contain seats and at least one aisle ('|')")
+    if len(set(seat_labels)) != len(seat_labels):
+        raise ValueError("'columns' labels must be unique")
+    column_index = {label: index for index, label in enumerate(labels) if label != "-"}
+
+    blocked = set()
+    for block in data.get("blocks", []):
+        try:
+            (first, last), present = block["rows"], set(block["seats"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"Invalid seat block: {block}") from None
+        unknown = present - set(column_index)
+        if unknown or not 1 <= first <= last <= rows:
+            raise ValueError(f"Invalid seat block: {block}")
+        for row in range(first - 1, last):
+            blocked.update((row, column) for label, column in column_index.items() if label not in present)
+
+    for name in data.get("blocked", []):
+        match = re.match(SEAT_NAME, name)
+        if not match or match.group(1) not in column_index or not 1 <= int(match.group(2)) <= rows:
+            raise ValueError(f"Invalid blocked seat: {name}")
+        blocked.add((int(match.group(2)) - 1, column_index[match.group(1)]))
+
+    doors = data.get("doors", [1])
+    if not doors or not all(isinstance(door, int) and 1 <= door <= rows for door in doors):
+        raise ValueError(f"'doors' must be rows between 1 and {rows}")
+
+    return CabinConfig(data.get("name", "custom"), rows, labels, blocked, sorted(set(doors)))
+
+
+def _read_document(path, content: bytes):
+    """
+    Parses a JSON or TOML configuration file, according to its extension.
+    """
+    import json
+
+    if path.suffix == ".toml":
+        import tomllib  # Python 3.11+, only needed for TOML files
+
+        return tomllib.loads(content.decode())
+    return json.loads(content)
+
+
+def load_cabin(path, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Loads a cabin configuration file (JSON or TOML), compiling it only once: the compiled
+    configuration is cached on disk under the hash of the file's content.
+
+    Args:
+        path (str): The path of the configuration file.
+        cache_dir (str, optional): The directory of the compiled configurations, None to disable the cache.
+
+    Returns:
+        tuple: The compiled CabinConfig and the content hash of the file.
+    """
+    import hashlib
+    import json
+    from pathlib import Path
+
+    path = Path(path)
+    content = path.read_bytes()
+    key = hashlib.sha256(content + f"|{COMPILED_VERSION}".encode()).hexdigest()
+    cached = Path(cache_dir) / f"{key}.json" if cache_dir is not None else None
+    if cached is not None and cached.exists():
+        return CabinConfig.from_dict(json.loads(cached.read_text())), key
+
+    cabin = parse_config(_read_document(path, content))
+    if cached is not None:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        cached.write_text(json.dumps(cabin.to_dict()))
+    return cabin, key
+
+
+def load_aircraft(path, cache_dir=DEFAULT_CACHE_DIR, shared=True):
+    """
+    Loads the aircraft described by a cabin configuration file. Files with the same content
+    give the same Aircraft instance within a process, kept for the lifetime of the process.
+
+    Args:
+        path (str): The path of the configuration file (JSON or TOML).
+        cache_dir (str, optional): The directory of the compiled configurations, None to disable the cache.
+        shared (bool): Whether to reuse and keep the instance of this process. A process loading
+            many distinct files once each can pass False to build a new, unretained aircraft.
+
+    Returns:
+        Aircraft: The aircraft.
+    """
+    from .aircraft import Aircraft
+
+    cabin, key = load_cabin(path, cache_dir)
+    if not shared:
+        return Aircraft.from_cabin(cabin)
+    if key not in _loaded_aircraft:
+        _loaded_aircraft[key] = Aircraft.from_cabin(cabin)
+    return _loaded_aircraft[key]
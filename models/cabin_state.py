@@ -0,0 +1,233 @@
+import numpy as np
+
+EMPTY = -1  # Marker of an empty cell in the occupancy grid
+
+
+class CabinState:
+    """
+    Represents the boarding state of a cabin stored in integer NumPy arrays.
+
+    It reproduces the tick logic of `Flight.boarding` with a fixed number of array operations
+    per tick, whatever the size of the cabin, instead of a Python dispatch on every cell of the
+    layout. Only the passengers standing in the aisles or moving across the seats are visited:
+    the aisles are kept in a flat grid of their own, one lane of `rows + 1` cells per aisle
+    (the last cell of each lane stays empty and separates it from the next one), and the
+    passengers moving across the seats in a compact index array.
+
+    Attributes (Properties):
+    - occupancy (ndarray): Grid (rows x layout columns) holding the index of the passenger
+      standing in each aisle cell or seated in each seat cell, or -1 when empty (built on access)
+    - target_row (ndarray): Row index of the seat of each passenger
+    - target_column (ndarray): Column index of the seat of each passenger
+    - baggage (ndarray): Number of ticks each passenger still needs to stow their baggage
+    - blockers (ndarray): Number of seated passengers each passenger had to cross
+    - seated_tick (ndarray): Tick at which each passenger sat down (0 while not seated)
+    - tick (int): The number of ticks simulated so far
+    """
+
+    def __init__(self, aircraft, passengers_by_aisle: dict, orders: dict):
+        """
+        Initializes a CabinState from the boarding queues of a flight.
+
+        Args:
+            aircraft (Aircraft): The aircraft being boarded.
+            passengers_by_aisle (dict): The boarding queue of each aisle (column index),
+                in boarding order.
+            orders (dict): The column processing order of each aisle, as used by `Flight.boarding`.
+        """
+        labels = aircraft.layout[-1]
+        rows, columns = aircraft.rows, len(labels)
+        self._rows, self._columns = rows, columns
+        self._lane = rows + 1  # Cells per aisle lane in the aisle grid, the last one always empty
+        self._aisles = np.array(list(passengers_by_aisle), dtype=np.int64)
+        # Rank of each seat column in the processing order of `Flight.boarding`: passengers
+        # moving towards a column processed later in the tick act again within that tick
+        self._rank = np.zeros(columns, dtype=np.int64)
+        seat_order = [column for aisle in passengers_by_aisle for column in orders[aisle][:-1]]
+        self._rank[seat_order] = np.arange(len(seat_order))
+        queues = list(passengers_by_aisle.values())
+        passengers = [passenger for queue in queues for passenger in queue]
+        count = len(passengers)
+
+        self._passengers = passengers
+        self._target_row = np.array([p.seat.number - 1 for p in passengers], dtype=np.int64)
+        self._target_column = np.array([aircraft.column_of(p.seat.letter) for p in passengers], dtype=np.int64)
+        self._baggage = np.array([p.stow_remaining for p in passengers], dtype=np.int64)
+        self._blockers = np.zeros(count, dtype=np.int64)
+        self._seated_tick = np.zeros(count, dtype=np.int64)
+        self._tick = 0
+
+        # Each aisle boards its queue from a contiguous slice of the passenger arrays
+        sizes = np.array([len(queue) for queue in queues], dtype=np.int64)
+        self._queue_next = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(np.int64)
+        self._queue_end = self._queue_next + sizes
+        lane = np.repeat(np.arange(len(queues), dtype=np.int64), sizes)
+        aisle_of = self._aisles[lane]
+        self._direction = np.where(self._target_column < aisle_of, -1, 1)
+        self._remaining = count
+
+        # Aisle grid: the passenger standing in each aisle cell, lane by lane
+        self._aisle_cells = np.full(len(queues) * self._lane, EMPTY, dtype=np.int64)
+        self._entry = np.arange(len(queues), dtype=np.int64) * self._lane  # Door cell of each lane
+        self._stop_cell = lane * self._lane + self._target_row  # Aisle cell of each passenger's seat row
+        self._congestion = np.zeros(len(queues) * self._lane, dtype=np.int64)
+
+        # Seat grid (flat, rows x layout columns): the passenger seated in each cell
+        self._seat_cells = np.full(rows * columns, EMPTY, dtype=np.int64)
+        self._seat_cell = self._target_row * columns + self._target_column  # Cell of each passenger's seat
+        self._exit_cell = self._target_row * columns + aisle_of + self._direction  # First cell off the aisle
+        self._cell = np.zeros(count, dtype=np.int64)  # Current seat cell of the passengers moving across seats
+        self._in_seats = np.zeros(0, dtype=np.int64)  # Passengers moving across the seats
+
+    # Property for controlled access to the occupancy grid
+    @property
+    def occupancy(self):
+        occupancy = self._seat_cells.reshape(self._rows, self._columns).copy()
+        lanes = self._aisle_cells.reshape(len(self._aisles), self._lane)[:, :self._rows]
+        occupancy[:, self._aisles] = lanes.T
+        return occupancy
+
+    # Property for controlled access to the target rows
+    @property
+    def target_row(self):
+        return self._target_row
+
+    # Property for controlled access to the target columns
+    @property
+    def target_column(self):
+        return self._target_column
+
+    # Property for controlled access to the baggage timers
+    @property
+    def baggage(self):
+        return self._baggage
+
+    # Property for controlled access to the blocker counts
+    @property
+    def blockers(self):
+        return self._blockers
+
+    # Property for controlled access to the seating ticks
+    @property
+    def seated_tick(self):
+        return self._seated_tick
+
+    # Property for controlled access to the number of simulated ticks
+    @property
+    def tick(self):
+        return self._tick
+
+    # Property for controlled access to the passengers, in array order
+    @property
+    def passengers(self):
+        return self._passengers
+
+    # Property telling whether every passenger is seated
+    @property
+    def is_complete(self):
+        return self._remaining == 0
+
+    def aisle_congestion(self):
+        """
+        Returns the blocked passenger counts in the format of `BoardingResult.aisle_congestion`.
+
+        Returns:
+            dict: For each aisle that saw congestion, the number of blocked passengers per row.
+        """
+        lanes = self._congestion.reshape(len(self._aisles), self._lane)[:, :self._rows]
+        return {int(aisle): lanes[index].tolist() for index, aisle in enumerate(self._aisles) if lanes[index].any()}
+
+    def _move_in_seats(self):
+        """
+        Advances every passenger moving across the seats by one cell, or seats them when they
+        stand at their own seat, in one masked update. The few passengers who stepped into a
+        column processed later in the tick by `Flight.boarding` are updated once more.
+        """
+        moving = self._in_seats
+        acting = moving
+        while acting.size:
+            cells = self._cell[acting]
+            arrived = cells == self._seat_cell[acting]
+            if arrived.any():
+                sitting = acting[arrived]
+                self._seated_tick[sitting] = self._tick
+                self._seat_cells[cells[arrived]] = sitting
+                self._remaining -= sitting.size
+                moving = moving[self._seated_tick[moving] == 0]
+                acting, cells = acting[~arrived], cells[~arrived]
+            entered = cells + self._direction[acting]
+            self._cell[acting] = entered
+            # A passenger seated earlier in the tick blocks the way only when their column was
+            # processed before the one the mover steps from
+            occupant = self._seat_cells[entered]
+            from_rank, to_rank = self._rank[cells % self._columns], self._rank[entered % self._columns]
+            self._blockers[acting] += (occupant != EMPTY) & (
+                (self._seated_tick[occupant] < self._tick) | (to_rank < from_rank)
+            )
+            acting = acting[to_rank > from_rank]
+        self._in_seats = moving
+
+    def _move_in_aisles(self):
+        """
+        Advances the passengers standing in the aisles, exactly like the back-to-front row loop
+        of `Flight.boarding`: a walking passenger moves forward when the cell ahead is empty or
+        is freed during this tick. Only the occupied aisle cells are visited.
+        """
+        flat = self._aisle_cells
+        cells = np.flatnonzero(flat != EMPTY)  # Sorted by lane, then from the front to the back
+        if not cells.size:
+            return
+        passengers = flat[cells]
+        walking = cells != self._stop_cell[passengers]
+        stowing = ~walking & (self._baggage[passengers] > 0)
+        exiting = ~(walking | stowing)
+
+        # A run of walking passengers, each one right behind the next, takes the outcome of the
+        # first cell ahead of it that is not a walking passenger with someone right in front:
+        # a free cell lets the whole run move, a stowing passenger blocks it
+        count = cells.size
+        followed = np.zeros(count, dtype=bool)
+        followed[:-1] = cells[1:] == cells[:-1] + 1
+        index = np.arange(count)
+        first_stop = np.minimum.accumulate(np.where(walking & followed, count, index)[::-1])[::-1]
+        blocked = walking & stowing[first_stop]
+        moves = walking & ~blocked
+        self._congestion[cells[blocked]] += 1
+
+        # Baggage stowing
+        self._baggage[passengers[stowing]] -= 1
+
+        # Passengers leaving the aisle towards their seat, over a seated passenger or not
+        leaving = passengers[exiting]
+        if leaving.size:
+            entered = self._exit_cell[leaving]
+            self._cell[leaving] = entered
+            self._blockers[leaving] += self._seat_cells[entered] != EMPTY
+            self._in_seats = np.concatenate((self._in_seats, leaving))
+
+        # Passengers walking one row forward: cells are emptied before being filled, so a run
+        # of walking passengers shifts by one cell
+        flat[cells[exiting | moves]] = EMPTY
+        flat[cells[moves] + 1] = passengers[moves]
+
+    def _enter(self):
+        """
+        Lets the next passenger of each queue enter the aisle when its first cell is free.
+        """
+        free = (self._aisle_cells[self._entry] == EMPTY) & (self._queue_next < self._queue_end)
+        if free.any():
+            self._aisle_cells[self._entry[free]] = self._queue_next[free]
+            self._queue_next[free] += 1
+
+    def step(self):
+        """
+        Simulates one boarding tick for every aisle at once.
+
+        Returns:
+            bool: True while some passengers are still not seated.
+        """
+        self._tick += 1
+        self._move_in_seats()
+        self._move_in_aisles()
+        self._enter()
+        return self._remaining > 0
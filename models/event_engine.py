@@ -0,0 +1,293 @@
+import heapq
+import itertools
+
+# Phase of a passenger in the event-driven boarding
+QUEUED = 0  # Waiting at the door
+WALKING = 1  # Walking in the aisle towards their seat row
+STOWING = 2  # Stowing their baggage, holding the aisle
+INTERFERING = 3  # Waiting for seated passengers to let them through, holding the aisle
+SHUFFLING = 4  # Moving across the seats towards their own seat
+SEATED = 5  # Seated
+
+DOOR = -1  # Marker of the door events in the event queue (DOOR - door queue index)
+
+
+class PassengerBehavior:
+    """
+    Describes the durations, in seconds, of the actions of boarding passengers.
+
+    Each duration is either a constant or a (mean, standard deviation) pair, drawn from a
+    gamma distribution so that it stays positive and skewed towards long durations, like
+    measured stow times.
+
+    Attributes:
+    - walk_time: Time to walk one row in the aisle, drawn once per passenger
+    - stow_time: Time to stow the baggage, drawn for each passenger with baggage
+    - seat_time: Time to move one seat across a row, drawn once per passenger
+    - interference_time: Time for one seated passenger to let another one through
+    - reaction_time: Delay before a blocked passenger moves on once the way is clear
+    - reduced_mobility_factor: Factor applied to the walking and seat times of the passengers
+      with reduced mobility
+
+    Methods:
+    - draw(rng, duration): Draws a value of one of the durations above
+    """
+
+    def __init__(self, walk_time=(1.0, 0.25), stow_time=(6.0, 3.0), seat_time=(1.0, 0.25),
+                 interference_time=(4.0, 1.5), reaction_time=0.3, reduced_mobility_factor=2.0):
+        """
+        Initializes a PassengerBehavior. The defaults make one aisle step last about one tick
+        of the tick engines, counted as one second.
+
+        Args:
+            walk_time (float | tuple): Time to walk one row.
+            stow_time (float | tuple): Time to stow the baggage.
+            seat_time (float | tuple): Time to move one seat across a row.
+            interference_time (float | tuple): Time for one seated passenger to let another one through.
+            reaction_time (float | tuple): Delay before a blocked passenger moves on.
+            reduced_mobility_factor (float): Factor applied to the walking and seat times of
+                the passengers with reduced mobility.
+        """
+        self.walk_time = walk_time
+        self.stow_time = stow_time
+        self.seat_time = seat_time
+        self.interference_time = interference_time
+        self.reaction_time = reaction_time
+        self.reduced_mobility_factor = reduced_mobility_factor
+
+    @staticmethod
+    def draw(rng, duration):
+        """
+        Draws a duration.
+
+        Args:
+            rng (random.Random): The random generator.
+            duration (float | tuple): A constant, or a (mean, standard deviation) pair.
+
+        Returns:
+            float: The drawn duration.
+        """
+        if not isinstance(duration, tuple):
+            return float(duration)
+        mean, stdev = duration
+        if stdev <= 0:
+            return float(mean)
+        # Gamma distribution with the given mean and standard deviation
+        return rng.gammavariate((mean / stdev) ** 2, stdev ** 2 / mean)
+
+    def __repr__(self):
+        return (
+            f"PassengerBehavior(walk_time={self.walk_time}, stow_time={self.stow_time}, seat_time={self.seat_time}, "
+            f"interference_time={self.interference_time}, reaction_time={self.reaction_time})"
+        )
+
+
+class EventDrivenBoarding:
+    """
+    Simulates the boarding of a cabin in continuous time with a priority queue of events.
+
+    Each aisle is a single file of cells, one per row, entered through one or several doors.
+    Passengers walk away from their door towards their seat row. A passenger schedules the end
+    of their current action (walking one row, stowing, letting seated passengers through,
+    reaching their seat) and the simulation jumps from one event to the next. A passenger
+    blocked by the one ahead schedules nothing: they are woken up when the cell ahead is freed.
+    Idle cells and waiting passengers therefore cost nothing, whatever the duration of the boarding.
+
+    Attributes (Properties):
+    - time (float): The time of the last processed event, in seconds
+    - seat_times (dict): The time at which each passenger sat down, keyed by passenger identifier
+    - aisle_congestion (dict): For each aisle, the seconds passengers spent blocked in each row
+    - events (int): The number of processed events
+
+    Methods:
+    - run(): Processes every event until all passengers are seated
+    """
+
+    def __init__(self, aircraft, passengers_by_aisle: dict, behavior: PassengerBehavior, rng):
+        """
+        Initializes an EventDrivenBoarding from the boarding queues of a flight.
+
+        Args:
+            aircraft (Aircraft): The aircraft being boarded.
+            passengers_by_aisle (dict): The boarding queue of each aisle (column index), in boarding
+                order: a list for the front door, or a mapping of door row indices to queues.
+            behavior (PassengerBehavior): The durations of the passengers' actions.
+            rng (random.Random): The random generator the durations are drawn from.
+        """
+        self._aircraft = aircraft
+        self._behavior = behavior
+        self._rng = rng
+        self._aisles = list(passengers_by_aisle)
+        # One queue per door of each aisle, as (lane, door row index, passengers)
+        self._queues = []
+        for lane, queues in enumerate(passengers_by_aisle.values()):
+            if not isinstance(queues, dict):
+                queues = {0: queues}  # Front door only
+            self._queues.extend((lane, door_row, list(queue)) for door_row, queue in queues.items())
+        self._queue_next = [0] * len(self._queues)
+        self._door_queue = {(lane, door_row): index for index, (lane, door_row, _) in enumerate(self._queues)}
+
+        passengers = [passenger for _, _, queue in self._queues for passenger in queue]
+        self._index = {passenger: index for index, passenger in enumerate(passengers)}
+        self._passengers = passengers
+        self._lane = [lane for lane, _, queue in self._queues for _ in queue]
+        self._target_row = [passenger.seat.number - 1 for passenger in passengers]
+        self._target_column = [aircraft.column_of(passenger.seat.letter) for passenger in passengers]
+        self._phase = [QUEUED] * len(passengers)
+        self._row = [0] * len(passengers)
+        self._blocked_since = [0.0] * len(passengers)
+
+        # Personal pace of each passenger, drawn once
+        draw = behavior.draw
+        pace = [behavior.reduced_mobility_factor if passenger.reduced_mobility else 1.0 for passenger in passengers]
+        self._walk_time = [draw(rng, behavior.walk_time) * factor for factor in pace]
+        self._seat_time = [draw(rng, behavior.seat_time) * factor for factor in pace]
+
+        rows = aircraft.rows
+        self._occupant = [[None] * rows for _ in self._aisles]  # Passenger index holding each aisle cell
+        self._waiting = [[None] * rows for _ in self._aisles]  # Passenger index waiting for each aisle cell
+        self._seated = [[False] * len(aircraft.layout[-1]) for _ in range(rows)]
+        self._congestion = [[0.0] * rows for _ in self._aisles]
+
+        self._events = []  # Heap of (time, sequence number, passenger index or DOOR - door queue index)
+        self._sequence = itertools.count()  # Breaks ties between simultaneous events in scheduling order
+        self._time = 0.0
+        self._processed = 0
+        self._seat_times = {}
+
+    # Property for controlled access to the time of the last processed event
+    @property
+    def time(self):
+        return self._time
+
+    # Property for controlled access to the seating times
+    @property
+    def seat_times(self):
+        return self._seat_times
+
+    # Property for controlled access to the number of processed events
+    @property
+    def events(self):
+        return self._processed
+
+    # Property for the blocked time per aisle and row, for the aisles that saw congestion
+    @property
+    def aisle_congestion(self):
+        return {
+            aisle: list(seconds)
+            for aisle, seconds in zip(self._aisles, self._congestion)
+            if any(seconds)
+        }
+
+    # Property for controlled access to the passengers, in index order
+    @property
+    def passengers(self):
+        return self._passengers
+
+    def _schedule(self, time, target):
+        """
+        Schedules an event for a passenger index, or for a door (DOOR - door queue index).
+        """
+        heapq.heappush(self._events, (time, next(self._sequence), target))
+
+    def _release(self, lane, row, time):
+        """
+        Frees an aisle cell and wakes up the passenger waiting for it, if any.
+        """
+        self._occupant[lane][row] = None
+        reaction = self._behavior.draw(self._rng, self._behavior.reaction_time)
+        door = self._door_queue.get((lane, row))
+        if door is not None and self._queue_next[door] < len(self._queues[door][2]):
+            self._schedule(time + reaction, DOOR - door)
+        waiter = self._waiting[lane][row]
+        if waiter is not None:
+            self._waiting[lane][row] = None
+            self._congestion[lane][self._row[waiter]] += time - self._blocked_since[waiter]
+            self._schedule(time + reaction, waiter)
+
+    def _enter(self, door, time):
+        """
+        Lets the next passenger of a door queue enter the aisle cell at the door.
+        """
+        lane, row, queue = self._queues[door]
+        if self._occupant[lane][row] is not None or self._queue_next[door] >= len(queue):
+            return
+        passenger = self._index[queue[self._queue_next[door]]]
+        self._queue_next[door] += 1
+        self._occupant[lane][row] = passenger
+        self._row[passenger] = row
+        self._phase[passenger] = WALKING
+        self._schedule(time + self._walk_time[passenger], passenger)
+
+    def _leave_aisle(self, passenger, time):
+        """
+        Starts moving a passenger from the aisle to their seat, once the seated passengers
+        between the aisle and their seat have let them through.
+        """
+        lane, row = self._lane[passenger], self._row[passenger]
+        aisle, column = self._aisles[lane], self._target_column[passenger]
+        step = 1 if column > aisle else -1
+        seated = self._seated[row]
+        delay = sum(
+            self._behavior.draw(self._rng, self._behavior.interference_time)
+            for between in range(aisle + step, column, step)
+            if seated[between]
+        )
+        self._phase[passenger] = INTERFERING
+        self._schedule(time + delay, passenger)
+
+    def _advance(self, passenger, time):
+        """
+        Handles the end of the current action of a passenger.
+        """
+        phase = self._phase[passenger]
+        lane, row = self._lane[passenger], self._row[passenger]
+
+        if phase == WALKING:
+            if row == self._target_row[passenger]:
+                if self._passengers[passenger].has_baggage:
+                    self._phase[passenger] = STOWING
+                    self._schedule(time + self._behavior.draw(self._rng, self._behavior.stow_time), passenger)
+                else:
+                    self._leave_aisle(passenger, time)
+            else:
+                next_row = row + 1 if self._target_row[passenger] > row else row - 1
+                if self._occupant[lane][next_row] is None:
+                    self._occupant[lane][next_row] = passenger
+                    self._row[passenger] = next_row
+                    self._release(lane, row, time)
+                    self._schedule(time + self._walk_time[passenger], passenger)
+                else:
+                    # Blocked: nothing is scheduled until the cell ahead is freed
+                    self._waiting[lane][next_row] = passenger
+                    self._blocked_since[passenger] = time
+        elif phase == STOWING:
+            self._leave_aisle(passenger, time)
+        elif phase == INTERFERING:
+            distance = abs(self._target_column[passenger] - self._aisles[lane])
+            self._phase[passenger] = SHUFFLING
+            self._release(lane, row, time)
+            self._schedule(time + distance * self._seat_time[passenger], passenger)
+        elif phase == SHUFFLING:
+            self._phase[passenger] = SEATED
+            self._seated[row][self._target_column[passenger]] = True
+            self._seat_times[self._passengers[passenger].identifier] = time
+
+    def run(self):
+        """
+        Processes every event until all passengers are seated.
+
+        Returns:
+            float: The time at which the last passenger sat down, in seconds.
+        """
+        for door in range(len(self._queues)):
+            self._schedule(0.0, DOOR - door)
+        events = self._events
+        while events:
+            self._time, _, target = heapq.heappop(events)
+            self._processed += 1
+            if target < 0:
+                self._enter(DOOR - target, self._time)
+            else:
+                self._advance(target, self._time)
+        return self._time
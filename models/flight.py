@@ -1,34 +1,77 @@
-import copy
-import os
 import time
-from emoji import emojize
 import random
+import warnings
 from .passenger import Passenger  # Importing the Passenger class (assumed to handle passenger details)
-from .aircraft import Aircraft  # Importing the Aircraft class
+from .aircraft import Aircraft, BLOCKED_CELL  # Importing the Aircraft class
 from .seat import Seat  # Importing the Seat class
+from .boarding_result import BoardingResult, TIME_UNITS  # Importing the BoardingResult class
+from .strategies import ManifestGroups, get_strategy  # Importing the boarding strategies
+
+# States of a layout cell, as returned by `Flight.cell_state`
+EMPTY_SEAT = 0  # A seat nobody stands on
+AISLE = 1  # An empty aisle cell
+WALKING = 2  # A passenger standing in the aisle
+MOVING = 3  # A passenger moving across the seats
+SEATED = 4  # A seated passenger
+CROSSING = 5  # A passenger crossing a seated passenger
+BLOCKED = 6  # A cell without a seat
 
 class Flight:
     """
     A class representing a flight, including its passengers, aircraft, and boarding process.
     """
     
-    def __init__(self, aircraft: Aircraft):
+    def __init__(self, aircraft: Aircraft, seed=None, load_factor=(0.95, 1.03), baggage_probability=0.7, stow_ticks=1,
+                 manifest=None):
         """
         Initializes a Flight object.
 
         Args:
             aircraft (Aircraft): The aircraft assigned to this flight.
+            seed (int, optional): Seed of the flight's own random generator. Two flights with
+                the same aircraft and seed sell and board their seats identically.
+            load_factor (tuple): The range of the number of tickets sold, as fractions of the capacity.
+            baggage_probability (float): The probability that a passenger has baggage.
+            stow_ticks (int): The number of ticks a passenger needs to stow their baggage.
+            manifest (iterable, optional): The booking records of the passengers (see `load_manifest`).
+                Seats are sold at random when no manifest is given.
         """
-        self._aircraft = copy.deepcopy(aircraft)  # Deep copy of the aircraft to avoid modifying the original object
+        self._random = random.Random(seed)  # Random generator of this flight only
+        self._load_factor = load_factor
+        self._baggage_probability = baggage_probability
+        self._stow_ticks = stow_ticks
+        self._aircraft = aircraft  # The aircraft is a read-only template shared between flights
+        self._layout = aircraft.new_layout()  # Mutable copy of the seating grid for this flight
+        # Number of seated passengers on each cell, that passengers moving across the row have to cross
+        self._blockers = [bytearray(len(row)) for row in self._layout[:-1]]
         self._seats = self._aircraft.seats  # Reference to the seats of the aircraft
         self._passengers = []  # List of passengers on the flight
-        self.sell_seats()  # Sell seats to passengers upon initialization
+        self._passenger_by_seat = {}  # Maps each assigned seat to its passenger
+        self._unseated_count = 0  # Number of passengers with a seat who are not seated yet
+        self._active_rows = {}  # Number of moving passengers per row, for each aisle
+        self._tick = 0  # Number of boarding ticks simulated so far
+        self._seated_ticks = {}  # Tick at which each passenger sat down, keyed by identifier
+        self._aisle_congestion = {}  # Blocked passenger counts per aisle and row
+        self._queues = None  # Remaining boarding queues of the tick engine, per aisle and door
+        self._from_manifest = False  # Whether the passengers come from a booking manifest
+        self._observers = []  # Callbacks notified of passenger events during boarding
+        self._profiler = None  # Optional profiler timing the boarding handlers
+        self._renderer = None  # Terminal renderer, created on first display
+        if manifest is None:
+            self.sell_seats()  # Sell seats to passengers upon initialization
+        else:
+            self.load_manifest(manifest)
 
     # Getter for the aircraft
     @property
     def aircraft(self):
         return self._aircraft
 
+    # Getter for the seating layout of this flight
+    @property
+    def layout(self):
+        return self._layout
+
     # Getter for the seats
     @property
     def seats(self):
@@ -43,20 +86,152 @@ class Flight:
     def passengers(self, new_passengers):
         self._passengers = new_passengers
 
+    # Getter and setter for the profiler of the boarding handlers
+    @property
+    def profiler(self):
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, new_profiler):
+        self._profiler = new_profiler
+
+    def add_observer(self, callback):
+        """
+        Registers a callback notified of the passenger events of the boarding (Observer Pattern).
+
+        The callback is called as `callback(event, passenger, row, column, tick)`, where event is one of:
+        - "enter": the passenger enters the aisle
+        - "step": the passenger walks one row forward in the aisle
+        - "block": the passenger cannot walk forward because the aisle is occupied
+        - "stow": the passenger stows their baggage
+        - "shuffle": the passenger moves one seat towards their own seat
+        - "interference": the passenger has to cross a seated passenger
+        - "sit": the passenger sits down
+        - "tick": the tick is over (passenger is None, row and column are -1)
+
+        Observers are only notified by the "objects" engine. Without observers, events cost nothing.
+
+        Args:
+            callback (callable): The callback to register.
+        """
+        self._observers.append(callback)
+
+    def remove_observer(self, callback):
+        """
+        Unregisters a callback added with `add_observer`.
+
+        Args:
+            callback (callable): The callback to unregister.
+        """
+        self._observers.remove(callback)
+
+    def _notify(self, event, passenger, row, column):
+        """
+        Notifies the observers of a passenger event.
+
+        Args:
+            event (str): The event name.
+            passenger (Passenger): The passenger concerned, or None.
+            row (int): The row of the event.
+            column (int): The column of the event.
+        """
+        for callback in self._observers:
+            callback(event, passenger, row, column, self._tick)
+
+    # Getter for the number of boarding ticks simulated so far
+    @property
+    def tick(self):
+        return self._tick
+
+    # Getter for the number of passengers with a seat who are not seated yet
+    @property
+    def unseated_count(self):
+        return self._unseated_count
+
+    def passenger_at(self, seat):
+        """
+        Returns the passenger assigned to a seat.
+
+        Args:
+            seat (Seat): A seat of the flight's aircraft.
+
+        Returns:
+            Passenger: The passenger, or None if the seat is not assigned.
+        """
+        return self._passenger_by_seat.get(seat)
+
+    def passenger_stood_up(self, passenger):
+        """
+        Brings a passenger who stood up back into the boarding: the flight waits for them again
+        and, if they stand at their seat, their row is visited on the next tick so they sit down.
+
+        Args:
+            passenger (Passenger): A passenger of the flight, seated until now.
+        """
+        self._unseated_count += 1
+        seat = passenger.seat
+        row, column = seat.number - 1, self._aircraft.column_of(seat.letter)
+        if self._layout[row][column] is passenger:
+            active_rows = self._active_rows.setdefault(self._aircraft.aisle_of(seat), {})
+            active_rows[row] = active_rows.get(row, 0) + 1
+
+    def cell_state(self, row, column):
+        """
+        Describes a cell of the flight's layout.
+
+        Args:
+            row (int): The row index of the cell.
+            column (int): The column index of the cell.
+
+        Returns:
+            tuple: The state of the cell (EMPTY_SEAT, AISLE, WALKING, MOVING, SEATED, CROSSING or BLOCKED)
+            and the passenger standing or moving on it, or None.
+        """
+        cell = self._layout[row][column]
+        if isinstance(cell, Seat):
+            return EMPTY_SEAT, None
+        if isinstance(cell, Passenger):
+            if self._aircraft.layout[row][column] == '|':
+                return WALKING, cell
+            if cell.is_seated:
+                return SEATED, cell
+            return (CROSSING if self._blockers[row][column] else MOVING), cell
+        if cell == BLOCKED_CELL:
+            return BLOCKED, None
+        return AISLE, None
+
+    def update_seat_index(self, passenger, old_seat, new_seat):
+        """
+        Updates the seat-to-passenger index when a passenger's seat changes.
+
+        Args:
+            passenger (Passenger): The passenger whose seat changed.
+            old_seat (Seat): The previous seat of the passenger, or None.
+            new_seat (Seat): The new seat of the passenger, or None.
+        """
+        if old_seat is not None and self._passenger_by_seat.get(old_seat) is passenger:
+            del self._passenger_by_seat[old_seat]
+        if new_seat is not None:
+            self._passenger_by_seat[new_seat] = passenger
+
     def sell_seats(self):
         """
         Simulates selling seats to passengers. Randomly determines the number of seats sold,
         creates Passenger objects, and assigns them seats.
         """
-        # Randomly determine the number of seats sold (95% to 100% capacity)
-        seats_to_sell = random.randint(int(0.95 * self._aircraft.capacity), int(self._aircraft.capacity*1.03))
+        # Randomly determine the number of seats sold (95% to 103% capacity by default)
+        min_load, max_load = self._load_factor
+        seats_to_sell = self._random.randint(int(min_load * self._aircraft.capacity), int(self._aircraft.capacity * max_load))
         
-        # Create passengers (70% chance each passenger has baggage)
-        self.passengers = [Passenger(self, random.random() <= 0.7) for _ in range(seats_to_sell)]
+        # Create passengers (70% chance each passenger has baggage by default)
+        self.passengers = [
+            Passenger(self, self._random.random() <= self._baggage_probability, self._stow_ticks)
+            for _ in range(seats_to_sell)
+        ]
 
         # Copy and shuffle the list of available seats
         available_seats = self.seats.copy()
-        random.shuffle(available_seats)
+        self._random.shuffle(available_seats)
 
         # Assign seats to passengers
         for passenger in self.passengers:
@@ -64,25 +239,112 @@ class Flight:
                 seat = available_seats.pop()
                 passenger.seat = seat  # Assign a seat to the passenger
             else:
-                print("Warning: No more seats available for remaining passengers.")
+                # Overbooked flight: reported once per process rather than printed on every sale
+                warnings.warn("No more seats available for remaining passengers.", RuntimeWarning, stacklevel=2)
                 break
 
+    def load_manifest(self, records):
+        """
+        Creates the passengers of a booking manifest, instead of selling seats at random.
+        The flight then boards by the groups of the manifest (`ManifestGroups`) unless another
+        strategy is given.
+
+        Args:
+            records (iterable): One dict per passenger, with the keys:
+                - "seat" (str): The seat name, e.g. "12A" or "A12"
+                - "baggage" (int, optional): The number of bags to stow, 0 by default. Each bag
+                  takes the flight's `stow_ticks` ticks to stow
+                - "stow_ticks" (int, optional): The ticks needed to stow the baggage, instead of
+                  "baggage" (as exported by `manifest`)
+                - "group" (int, optional): The boarding group, 0 by default
+                - "reduced_mobility" (bool, optional): Whether the passenger needs assistance
+
+        Returns:
+            list: The created passengers.
+
+        Raises:
+            ValueError: If a seat does not exist or is booked twice.
+        """
+        seat_named = self._aircraft.seat_named
+        rows = []
+        booked = set()
+        for record in records:
+            try:
+                seat = seat_named(record["seat"])
+            except KeyError:
+                raise ValueError(f"Unknown seat in manifest: {record['seat']}") from None
+            if seat in booked or seat in self._passenger_by_seat:
+                raise ValueError(f"Seat booked twice in manifest: {record['seat']}")
+            booked.add(seat)
+            rows.append((
+                seat,
+                int(record["stow_ticks"]) if record.get("stow_ticks") is not None
+                else int(record.get("baggage", 0)) * self._stow_ticks,
+                int(record.get("group", 0)),
+                bool(record.get("reduced_mobility", False)),
+            ))
+        self._from_manifest = True
+        return Passenger.bulk(self, rows)
+
+    def manifest(self):
+        """
+        Returns the booking records of the passengers with a seat, in the format of `load_manifest`.
+        Baggage is exported as the ticks still needed to stow it, so loading the records gives
+        the same passengers whatever the flight's `stow_ticks` (before boarding, the booked ones).
+
+        Returns:
+            list: One dict per passenger.
+        """
+        return [
+            {
+                "seat": f"{passenger.seat.number}{passenger.seat.letter}",
+                "stow_ticks": passenger.stow_remaining,
+                "group": passenger.group,
+                "reduced_mobility": passenger.reduced_mobility,
+            }
+            for passenger in self._passengers
+            if passenger.seat is not None
+        ]
+
     def boarding(self, order, passengers):
         """
         Simulates the boarding process of passengers onto the aircraft.
 
+        Passengers walk away from the door they entered by: towards the back of the cabin
+        from a front door, in both directions from a door further back.
+
         Args:
             order (list): The boarding order of column indices.
-            passengers (list): The list of passengers boarding.
+            passengers (list | dict): The list of passengers boarding through the front door,
+                or a mapping of door row indices to the passengers boarding through each door.
         """
-        layout = self._aircraft.layout  # Get the aircraft's seating layout
+        layout = self._layout  # Get the flight's seating layout
+        template = self._aircraft.layout  # Empty cells, restored when passengers move on
+        blockers = self._blockers
+        column_of = self._aircraft.column_of
+        geometry = self._aircraft.geometry  # Aisle and direction of each column, computed once
+        passenger_by_seat = self._passenger_by_seat
+        notify = self._notify if self._observers else None  # Events are only built when observed
+
+        def _shuffle(passenger, row, column, target_column):
+            """
+            Moves a passenger one cell across a row, over the seated passenger of the target
+            cell if any, and gives their current cell back to its seated passenger or leaves it empty.
+            """
+            layout[row][target_column] = passenger
+            if notify and blockers[row][target_column]:
+                notify("interference", passenger, row, target_column)
+            cell = template[row][column]
+            layout[row][column] = passenger_by_seat[cell] if blockers[row][column] else cell
+            if notify:
+                notify("shuffle", passenger, row, target_column)
 
         def _passenger_aisle_case(layout, row, column):
             """
             Handles the movement of a passenger in an aisle.
 
             Args:
-                layout (list): The aircraft's seating layout.
+                layout (list): The flight's seating layout.
                 row (int): The current row of the passenger.
                 column (int): The current column of the passenger.
             """
@@ -90,81 +352,108 @@ class Flight:
 
             # Check if the passenger has reached their seat row
             if passenger.seat.number != row + 1:
-                # Move the passenger forward in the aisle
-                if layout[row + 1][column] == '|':
-                    layout[row + 1][column] = passenger
+                # Move the passenger one row towards their seat in the aisle
+                next_row = row + 1 if passenger.seat.number > row + 1 else row - 1
+                if layout[next_row][column] == '|':
+                    layout[next_row][column] = passenger
                     layout[row][column] = '|'
+                    active_rows[row] -= 1
+                    active_rows[next_row] = active_rows.get(next_row, 0) + 1
+                    if notify:
+                        notify("step", passenger, next_row, column)
+                else:
+                    self._record_congestion(column, row)  # The passenger is blocked by the one ahead
+                    if notify:
+                        notify("block", passenger, row, column)
             else:
                 # Handle baggage or movement to the target seat
                 if passenger.has_baggage:
                     passenger.drop_off_baggage()  # Drop off baggage if applicable
+                    if notify:
+                        notify("stow", passenger, row, column)
                 else:
-                    offset = -1 if layout[-1].index(passenger.seat.letter) < column else 1
-                    target_column = column + offset
-                    target_seat = layout[row][target_column]
-                    
-                    # Handle the target seat being empty or occupied
-                    if isinstance(target_seat, Seat):
-                        layout[row][target_column] = (passenger, target_seat)
-                    else:
-                        seated_passenger = target_seat[0]
-                        target_seat = target_seat[1]
-                        layout[row][target_column] = (passenger, seated_passenger, target_seat)
-                    layout[row][column] = '|'
+                    # Leave the aisle towards the seat, over a seated passenger or not
+                    _shuffle(passenger, row, column, column + geometry[column_of(passenger.seat.letter)].direction)
 
         def _passenger_non_aisle_case(layout, row, column):
             """
             Handles the movement of a passenger off the aisle to their seat.
 
             Args:
-                layout (list): The aircraft's seating layout.
+                layout (list): The flight's seating layout.
                 row (int): The current row of the passenger.
                 column (int): The current column of the passenger.
             """
-            passenger, seat = layout[row][column][0], layout[row][column][-1]
+            passenger = layout[row][column]
+            seat_column = column_of(passenger.seat.letter)
 
             # Check if the passenger is at their seat
-            if passenger.seat == seat:
+            if column == seat_column:
                 passenger.sit_down()  # Passenger sits down
+                blockers[row][column] = 1  # Already set for a passenger sitting down again after standing up
+                self._seated_ticks[passenger.identifier] = self._tick
+                active_rows[row] -= 1
+                if notify:
+                    notify("sit", passenger, row, column)
                 return
-            
-            # Move the passenger closer to their seat
-            offset = -1 if layout[-1].index(passenger.seat.letter) < column else 1
-            target_column = column + offset
-            target_seat = layout[row][target_column]
 
-            # Handle the target seat being empty or occupied
-            if isinstance(target_seat, Seat):
-                layout[row][target_column] = (passenger, target_seat)
-            else:
-                seated_passenger, target_seat = target_seat[0], target_seat[1]
-                layout[row][target_column] = (passenger, seated_passenger, target_seat)
-            
-            # Update the current position of the passenger
-            layout[row][column] = layout[row][column][1:] if len(layout[row][column]) > 2 else seat
+            # Move the passenger closer to their seat
+            _shuffle(passenger, row, column, column + geometry[seat_column].direction)
 
-        def _entry_point(layout, aisle_index, passengers):
+        def _entry_point(layout, aisle_index, passengers, door_row=0):
             """
             Handles passengers entering the aircraft through the aisle.
 
             Args:
-                layout (list): The aircraft's seating layout.
+                layout (list): The flight's seating layout.
                 aisle_index (int): The column index of the aisle.
                 passengers (list): The list of passengers boarding.
+                door_row (int): The row index of the door the passengers board through.
             """
-            if layout[0][aisle_index] == '|':
-                layout[0][aisle_index] = passengers.pop(0)  # Place the passenger in the aisle
-
-        # Simulate boarding from back to front
-        for row in range(len(layout) - 2, -1, -1):  # Start from the last row
+            if layout[door_row][aisle_index] == '|':
+                layout[door_row][aisle_index] = passengers.pop(0)  # Place the passenger in the aisle
+                active_rows[door_row] = active_rows.get(door_row, 0) + 1
+                if notify:
+                    notify("enter", layout[door_row][aisle_index], door_row, aisle_index)
+
+        if self._profiler is not None:  # Time the handlers only when profiling
+            _passenger_aisle_case = self._profiler.timed("_passenger_aisle_case", _passenger_aisle_case)
+            _passenger_non_aisle_case = self._profiler.timed("_passenger_non_aisle_case", _passenger_non_aisle_case)
+            _entry_point = self._profiler.timed("_entry_point", _entry_point)
+
+        # Number of moving passengers in each row holding at least one; only these rows are visited
+        aisle = order[-1]
+        active_rows = self._active_rows.setdefault(aisle, {})
+        if not isinstance(passengers, dict):
+            passengers = {0: passengers}  # Front door only
+        backward = any(passengers)  # Passengers entering behind the front walk in both directions
+
+        # Simulate boarding from back to front, for everyone but the passengers walking to the front
+        for row in sorted(active_rows, reverse=True):  # Start from the last row
+            cells = layout[row]
             for column in order:
-                if isinstance(layout[row][column], Passenger) and column == order[-1]:  # If passenger is in the aisle
-                    _passenger_aisle_case(layout, row, column)
-                elif isinstance(layout[row][column], tuple) and not layout[row][column][0].is_seated:
-                    _passenger_non_aisle_case(layout, row, column)
-
-        if passengers:  # Handle remaining passengers entering the aircraft
-            _entry_point(layout, order[-1], passengers)
+                cell = cells[column]
+                if isinstance(cell, Passenger):
+                    if column == aisle:  # If passenger is in the aisle
+                        if cell.seat.number > row or not backward:
+                            _passenger_aisle_case(layout, row, column)
+                    elif not cell.is_seated:
+                        _passenger_non_aisle_case(layout, row, column)
+            if not active_rows[row]:
+                del active_rows[row]
+
+        # Then from front to back, for the passengers walking to the front
+        if backward:
+            for row in sorted(active_rows):
+                cell = layout[row][aisle]
+                if isinstance(cell, Passenger) and cell.seat.number <= row:
+                    _passenger_aisle_case(layout, row, aisle)
+            for row in [row for row, count in active_rows.items() if not count]:
+                del active_rows[row]
+
+        for door_row, queue in passengers.items():
+            if queue:  # Handle remaining passengers entering the aircraft
+                _entry_point(layout, aisle, queue, door_row)
 
     def get_passengers_by_aisle(self):
         """
@@ -177,64 +466,304 @@ class Flight:
         aisle_seat_map = self._aircraft.get_closest_seats_for_each_aisle()
         passengers_by_aisle = {aisle: [] for aisle in aisle_seat_map}
 
-        # Match passengers to their respective aisles
+        # Match passengers to their respective aisles through the seat index
         for aisle, seats in aisle_seat_map.items():
             for seat in seats:
-                for passenger in self._passengers:
-                    if passenger.seat == seat:
-                        passengers_by_aisle[aisle].append(passenger)
+                passenger = self._passenger_by_seat.get(seat)
+                if passenger is not None:
+                    passengers_by_aisle[aisle].append(passenger)
 
         return passengers_by_aisle
 
-    def boarding_simulation(self, time_interval=0.5):
+    def _record_congestion(self, aisle, row):
         """
-        Simulates the boarding process of passengers onto the aircraft.
+        Counts one tick of a passenger blocked in an aisle.
+
+        Args:
+            aisle (int): The column index of the aisle.
+            row (int): The row where the passenger is blocked.
+        """
+        if aisle not in self._aisle_congestion:
+            self._aisle_congestion[aisle] = [0] * self._aircraft.rows
+        self._aisle_congestion[aisle][row] += 1
+
+    def _boarding_queues(self, strategy=None):
+        """
+        Builds the boarding queue of each aisle with a boarding strategy.
+
+        Args:
+            strategy (BoardingStrategy | str, optional): The boarding strategy or its name.
+                Defaults to the groups of the manifest for a flight loaded from one, and to
+                random boarding otherwise.
+
+        Returns:
+            dict: A mapping of aisle indices to the passengers boarding through them, in boarding order.
         """
-        layout = tuple(tuple(row) for row in self._aircraft.layout)
+        if strategy is None and self._from_manifest:
+            strategy = ManifestGroups()
+        return get_strategy(strategy).queues(self, self._random)
 
-        passengers_by_aisle = self.get_passengers_by_aisle()
+    def _door_queues(self, passengers_by_aisle, doors=None):
+        """
+        Splits the boarding queue of each aisle between the doors, each passenger boarding
+        through the door closest to their seat row (the front-most one on ties). The boarding
+        order of the strategy is kept within each door.
+
+        Args:
+            passengers_by_aisle (dict): The boarding queue of each aisle.
+            doors (list, optional): The rows (1-based) of the doors to use. Defaults to the
+                doors of the aircraft's cabin.
+
+        Returns:
+            dict: For each aisle, a mapping of door row indices to their boarding queues.
+
+        Raises:
+            ValueError: If the list of doors is empty or holds a row outside of the aircraft.
+        """
+        if doors is not None and (not doors or not all(1 <= door <= self._aircraft.rows for door in doors)):
+            raise ValueError(f"Doors must be rows between 1 and {self._aircraft.rows}: {list(doors)}")
+        if doors is None:
+            doors = self._aircraft.cabin.doors
+            door_distance = self._aircraft.cabin.door_distance  # Precomputed with the cabin
+        else:
+            doors = sorted(set(doors))
+            door_distance = [[abs(row + 1 - door) for door in doors] for row in range(self._aircraft.rows)]
+        door_rows = [door - 1 for door in doors]
+
+        queues = {}
         for aisle, passengers in passengers_by_aisle.items():
-            random.shuffle(passengers)
-        while any(not passenger.is_seated and passenger.seat for passenger in self._passengers):  # Verify if all passengers with seats are seated
-            for aisle, seats in self._aircraft.get_closest_seats_for_each_aisle().items():
-                min_column = layout[0].index(seats[0])
-                max_column = layout[-2].index(seats[-1])
-                columns = list(range(min_column, max_column + 1))
-                columns.remove(aisle)
-                order = []
-                # We take first the extreme columns and then the middle ones 
-                while columns:
-                    order.append(columns.pop(0))
-                    if columns:
-                        order.append(columns.pop(-1))
-                order = order + [aisle]
-                self.boarding(order, passengers_by_aisle[aisle])
-            self.display_boarding_simulation()
-            time.sleep(time_interval)
+            queues[aisle] = {door_row: [] for door_row in door_rows}
+            for passenger in passengers:
+                distances = door_distance[passenger.seat.number - 1]
+                queues[aisle][door_rows[distances.index(min(distances))]].append(passenger)
+        return queues
+
+    def _boarding_orders(self):
+        """
+        Builds, for each aisle, the order in which `boarding` processes the columns.
+
+        Returns:
+            dict: A mapping of aisle indices to column indices, the aisle itself being last.
+        """
+        orders = {}
+        for aisle, seats in self._aircraft.get_closest_seats_for_each_aisle().items():
+            # The range spans the aisle too, which may stand at an edge of the seat columns
+            columns = {self._aircraft.column_of(seat.letter) for seat in seats} | {aisle}
+            columns = list(range(min(columns), max(columns) + 1))
+            columns.remove(aisle)
+            order = []
+            # We take first the extreme columns and then the middle ones 
+            while columns:
+                order.append(columns.pop(0))
+                if columns:
+                    order.append(columns.pop(-1))
+            orders[aisle] = order + [aisle]
+        return orders
+
+    def _vectorized_boarding(self, strategy=None, doors=None):
+        """
+        Runs the boarding process to completion on a NumPy `CabinState` and writes the
+        final state back to the passengers and the layout.
+        """
+        if tuple(self._aircraft.cabin.doors if doors is None else doors) != (1,):
+            raise ValueError("The 'vectorized' engine only supports boarding through the front door")
+        from .cabin_state import CabinState  # Imported here as NumPy is only needed by this engine
+
+        state = CabinState(self._aircraft, self._boarding_queues(strategy), self._boarding_orders())
+        while state.step():
+            pass
+
+        self._seat_passengers(state.passengers, [int(tick) for tick in state.seated_tick])
+        self._tick = state.tick
+        self._aisle_congestion = state.aisle_congestion()
+
+    def _event_boarding(self, strategy=None, behavior=None, doors=None):
+        """
+        Runs the boarding process to completion on an `EventDrivenBoarding`, in continuous
+        time, and writes the final state back to the passengers and the layout.
+        """
+        from .event_engine import EventDrivenBoarding, PassengerBehavior
+
+        engine = EventDrivenBoarding(
+            self._aircraft,
+            self._door_queues(self._boarding_queues(strategy), doors),
+            behavior or PassengerBehavior(),
+            self._random,
+        )
+        self._tick = engine.run()
+        seat_times = engine.seat_times
+        self._seat_passengers(engine.passengers, [seat_times[p.identifier] for p in engine.passengers])
+        self._aisle_congestion = engine.aisle_congestion
+
+    def _seat_passengers(self, passengers, seat_times):
+        """
+        Seats passengers at once, after a boarding run by another engine than `boarding`.
+
+        Args:
+            passengers (list): The passengers to seat.
+            seat_times (list): The time at which each of them sat down.
+        """
+        layout = self._layout
+        column_of = self._aircraft.column_of
+        for passenger, seat_time in zip(passengers, seat_times):
+            seat = passenger.seat
+            row, column = seat.number - 1, column_of(seat.letter)
+            layout[row][column] = passenger
+            self._blockers[row][column] += 1
+            passenger.has_baggage = False
+            passenger.sit_down()
+            self._seated_ticks[passenger.identifier] = seat_time
+
+    def boarding_ticks(self, strategy=None, doors=None):
+        """
+        Runs the boarding process tick by tick, yielding after each tick. This lets callers
+        step the boarding at their own pace (display, event loop, ...).
+
+        Args:
+            strategy (BoardingStrategy | str, optional): The boarding strategy or its name.
+            doors (list, optional): The rows (1-based) of the doors to board through.
+                Defaults to the doors of the aircraft's cabin.
+
+        A flight restored from a snapshot taken during the boarding continues with its own
+        queues, the strategy and doors being ignored.
+
+        Yields:
+            int: The number of the tick that was just simulated.
+        """
+        if self._queues is None:
+            self._queues = self._door_queues(self._boarding_queues(strategy), doors)
+        passengers_by_aisle = self._queues
+        orders = self._boarding_orders()  # The column orders do not change during the boarding
+        while self._unseated_count > 0:  # Verify if all passengers with seats are seated
+            self._tick += 1
+            if self._profiler is None:
+                for aisle, order in orders.items():
+                    self.boarding(order, passengers_by_aisle[aisle])
+            else:
+                start = time.perf_counter()
+                for aisle, order in orders.items():
+                    self.boarding(order, passengers_by_aisle[aisle])
+                self._profiler.record("boarding", time.perf_counter() - start)
+            if self._observers:
+                self._notify("tick", None, -1, -1)
+            yield self._tick
+
+    def boarding_simulation(self, time_interval=0.5, strategy=None, max_fps=None, doors=None):
+        """
+        Simulates the boarding process of passengers onto the aircraft.
+
+        Args:
+            time_interval (float): The number of seconds between two ticks.
+            strategy (BoardingStrategy | str, optional): The boarding strategy or its name.
+                Defaults to the manifest's groups, or to random boarding (see `_boarding_queues`).
+            max_fps (float, optional): The maximum number of frames drawn per second, independent
+                of the tick rate. Ticks that come faster are simulated but not drawn.
+            doors (list, optional): The rows (1-based) of the doors to board through.
+                Defaults to the doors of the aircraft's cabin.
+        """
+        from utils.display import TerminalRenderer  # Only needed when something is displayed
+
+        self._renderer = TerminalRenderer(max_fps)
+        for _ in self.boarding_ticks(strategy, doors):
+            self.display_boarding_simulation(force=False)
+            if time_interval:
+                time.sleep(time_interval)
+        self.display_boarding_simulation()  # The final state is always drawn
+        self._renderer.finish()
         print("Boarding completed!")
 
-    def display_boarding_simulation(self):
+    def run_headless(self, engine="objects", strategy=None, behavior=None, doors=None):
         """
-        Displays the current state of the boarding simulation.
+        Runs the boarding process to completion without rendering or waiting between ticks.
+
+        Args:
+            engine (str): "objects" to run `boarding` on the layout grid, "vectorized" to run
+                the same tick logic on NumPy arrays (same results, faster than "objects" on large
+                cabins, slower on small ones), or "events" to run
+                a discrete-event simulation in continuous time with random action durations.
+            strategy (BoardingStrategy | str, optional): The boarding strategy or its name.
+                Defaults to the manifest's groups, or to random boarding (see `_boarding_queues`).
+            behavior (PassengerBehavior, optional): The durations of the passengers' actions,
+                used by the "events" engine only.
+            doors (list, optional): The rows (1-based) of the doors to board through. Defaults
+                to the doors of the aircraft's cabin. The "vectorized" engine only supports the front door.
+
+        Returns:
+            BoardingResult: The number of ticks, the tick at which each passenger sat down
+            and the aisle congestion counts of the run. With the "events" engine, times are
+            in seconds and congestion counts are blocked seconds.
+
+        Raises:
+            ValueError: If the engine is unknown, or if the "vectorized" or "events" engine is
+                asked to board a flight whose boarding has already started (a second run, or
+                a flight restored or forked mid-boarding): only "objects" resumes a boarding.
         """
-        os.system('cls' if os.name == 'nt' else 'clear') 
-
-        display_layout = [
-            [
-                emojize(':seat:') if isinstance(cell, Seat) 
-                else emojize(':busts_in_silhouette:') if (isinstance(cell, tuple) and len(cell) == 3) 
-                else emojize(":bust_in_silhouette:") if (isinstance(cell, tuple) and cell[0].is_seated) 
-                else emojize(':men’s_room:') if (isinstance(cell, Passenger) or (isinstance(cell, tuple) and not cell[0].is_seated)) 
-                else emojize(':cross_mark:') if cell == "|" 
-                else cell
-                for cell in row
-            ]
-            for row in self._aircraft.layout
-        ]
+        if engine in ("vectorized", "events"):
+            if self._observers or self._profiler is not None:
+                raise ValueError("Observers and profilers are only supported by the 'objects' engine")
+            if self._tick or self._queues is not None or self._seated_ticks:
+                raise ValueError(f"The '{engine}' engine only boards flights whose boarding has not started")
+            if engine == "vectorized":
+                self._vectorized_boarding(strategy, doors)
+            else:
+                self._event_boarding(strategy, behavior, doors)
+        elif engine == "objects":
+            for _ in self.boarding_ticks(strategy, doors):
+                pass
+        else:
+            raise ValueError(f"Unknown boarding engine: {engine}")
+        return BoardingResult(self._tick, self._seated_ticks, self._aisle_congestion, TIME_UNITS[engine])
+
+    def snapshot(self):
+        """
+        Serializes the state of the flight: passengers, layout, boarding queues, counters and
+        the state of its random generator (see `models.snapshot`). Observers, profiler and
+        renderer are not part of the state.
+
+        Returns:
+            bytes: The snapshot.
+        """
+        from .snapshot import dump_flight
 
-        displayed_layout = [["|"] + row + ["|"] for row in display_layout]
+        return dump_flight(self)
 
-        indentation = (20 - self._aircraft.columns - 2) * " "
+    @classmethod
+    def restore(cls, aircraft: Aircraft, data: bytes):
+        """
+        Rebuilds a flight from a snapshot. Running the restored flight gives the same result,
+        tick for tick, as running the original one from the moment of the snapshot.
+
+        Args:
+            aircraft (Aircraft): The aircraft of the snapshotted flight.
+            data (bytes): A snapshot returned by `snapshot`.
+
+        Returns:
+            Flight: The restored flight.
+        """
+        from .snapshot import load_flight
+
+        return load_flight(aircraft, data)
+
+    def fork(self):
+        """
+        Returns an independent copy of the flight in its current state, e.g. to explore a
+        what-if branch from the middle of the boarding.
+
+        Returns:
+            Flight: The copy.
+        """
+        return Flight.restore(self._aircraft, self.snapshot())
+
+    def display_boarding_simulation(self, force=True):
+        """
+        Displays the current state of the boarding simulation.
+        Only the cells that changed since the previous display are redrawn.
+
+        Args:
+            force (bool): Draw even if the frame rate cap of the renderer is reached.
+        """
+        if self._renderer is None:
+            from utils.display import TerminalRenderer  # Only needed when something is displayed
 
-        output = "\n".join([indentation + " ".join(line) for line in displayed_layout[:-1]])
-        print(output)
+            self._renderer = TerminalRenderer()
+        self._renderer.render(self, force)
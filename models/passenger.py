@@ -1,45 +1,70 @@
-import uuid
+import weakref
 
 class Passenger:
     """"
     Represents a passenger on a flight.
 
+    Passengers use __slots__ to keep their memory footprint small, as simulations create
+    a large number of them.
+
     Attributes (Properties):
-    - identifier (str): The unique identifier of the passenger
+    - identifier (int): The identifier of the passenger, unique within its flight
     - has_baggage (bool): Indicates whether the passenger has baggage
+    - stow_remaining (int): The number of ticks the passenger still needs to stow their baggage
+    - group (int): The boarding group of the passenger in their booking manifest
+    - reduced_mobility (bool): Indicates whether the passenger needs assistance (pre-boarding, slower pace)
     - seat (Seat): The seat assigned to the passenger, if any
     - is_seated (bool): Indicates whether the passenger is currently seated
 
     Methods:
     - sit_down(): Marks the passenger as seated
     - stand_up(): Marks the passenger as standing
-    - drop_off_baggage(): Simulates baggage drop-off by setting has_baggage to False
-    - remove_passenger(passenger_id): Class method to remove a Passenger instance from the class's list by its identifier
+    - drop_off_baggage(): Simulates one tick of baggage drop-off, setting has_baggage to False once stowed
+    - delay(ticks): Holds the passenger longer in the aisle at their row
+    - bulk(flight, records): Class method to create the passengers of a manifest at once
+    - track_instances(enabled): Class method to enable or disable the registry of Passenger instances
+    - get_passenger_by_id(flight, passenger_id): Class method to find a registered Passenger of a flight by identifier
+    - remove_passenger(flight, passenger_id): Class method to remove a Passenger of a flight from the registry
     """
 
-    # Class attribute to maintain a list of all created Passenger instances
-    passengers = []
+    __slots__ = (
+        "_id", "_flight", "_has_baggage", "_stow_remaining", "_group", "_reduced_mobility", "_seat", "_is_seated",
+        "__weakref__",
+    )
+
+    # Opt-in registry of the created Passenger instances. It holds weak references only,
+    # so passengers are freed with their flight.
+    tracking = False
+    passengers = weakref.WeakSet()
 
     # Constructor method to initialize a Passenger object
-    def __init__(self, flight, has_baggage: bool):
+    def __init__(self, flight, has_baggage: bool, stow_ticks: int = 1, group: int = 0, reduced_mobility: bool = False):
         """
         Initialize a Passenger instance.
 
         :param flight: The flight this passenger is associated with
         :param has_baggage: Boolean indicating if the passenger has baggage
+        :param stow_ticks: Number of ticks needed to stow the baggage
+        :param group: Boarding group of the passenger
+        :param reduced_mobility: Boolean indicating if the passenger needs assistance
         """
-        self._id = str(uuid.uuid4())
+        self._id = len(flight._passengers)
         self._flight = flight
-        self._has_baggage = has_baggage
+        # Baggage that takes no time to stow is no baggage, for every engine
+        self._has_baggage = has_baggage and stow_ticks > 0
+        self._stow_remaining = stow_ticks if self._has_baggage else 0
+        self._group = group
+        self._reduced_mobility = reduced_mobility
         self._seat = None
         self._is_seated = False
-        Passenger.passengers.append(self)
+        if Passenger.tracking:
+            Passenger.passengers.add(self)
         flight._passengers.append(self)
 
-    # Property to access the passenger's unique identifier
+    # Property to access the passenger's identifier, unique within its flight
     @property
     def identifier(self):
-        """Return the unique identifier of the passenger."""
+        """Return the identifier of the passenger, its index in the flight's passengers (numbered from 0 per flight)."""
         return self._id
 
     # Property to access and modify the passenger's baggage status
@@ -50,8 +75,26 @@ class Passenger:
 
     @has_baggage.setter
     def has_baggage(self, new_value: bool):
-        """Set the baggage status of the passenger."""
-        self._has_baggage = new_value
+        """Set the baggage status of the passenger (only with ticks left to stow it)."""
+        self._has_baggage = new_value and self._stow_remaining > 0
+
+    # Property to access the number of ticks still needed to stow the baggage
+    @property
+    def stow_remaining(self):
+        """Return the number of ticks the passenger still needs to stow their baggage."""
+        return self._stow_remaining if self._has_baggage else 0
+
+    # Property to access the passenger's boarding group
+    @property
+    def group(self):
+        """Return the boarding group of the passenger."""
+        return self._group
+
+    # Property to access the passenger's mobility status
+    @property
+    def reduced_mobility(self):
+        """Return whether the passenger needs assistance."""
+        return self._reduced_mobility
 
     # Property to access and modify the passenger's seat assignment
     @property
@@ -62,7 +105,12 @@ class Passenger:
     @seat.setter
     def seat(self, new_value):
         """Assign a new seat to the passenger."""
+        old_value = self._seat
         self._seat = new_value
+        self._flight.update_seat_index(self, old_value, new_value)  # Keep the flight's seat index in sync
+        if not self._is_seated:
+            # Only passengers with a seat have to be seated before the boarding completes
+            self._flight._unseated_count += (new_value is not None) - (old_value is not None)
 
     # Property to access the passenger's seated status
     @property
@@ -73,31 +121,107 @@ class Passenger:
     # Method to mark the passenger as seated
     def sit_down(self):
         """Mark the passenger as seated."""
+        if not self._is_seated and self._seat is not None:
+            self._flight._unseated_count -= 1  # One less passenger to wait for
         self._is_seated = True
 
     # Method to mark the passenger as standing
     def stand_up(self):
         """Mark the passenger as standing."""
+        if self._is_seated and self._seat is not None:
+            self._flight.passenger_stood_up(self)  # The flight has to wait for this passenger again
         self._is_seated = False
 
-    # Method to handle baggage drop-off (sets has_baggage to False)
+    # Method to handle baggage drop-off (sets has_baggage to False once stowed)
     def drop_off_baggage(self):
-        """Simulate baggage drop-off by setting has_baggage to False."""
-        self.has_baggage = False
+        """Simulate one tick of baggage drop-off, setting has_baggage to False once the baggage is stowed."""
+        self._stow_remaining -= 1
+        if self._stow_remaining <= 0:
+            self.has_baggage = False
+
+    # Method to hold the passenger longer in the aisle (what-if scenarios)
+    def delay(self, ticks: int):
+        """Delay the passenger: once at their row, they hold the aisle for `ticks` more ticks.
+
+        :param ticks: Number of extra ticks, with no effect once the passenger left the aisle
+        """
+        self._stow_remaining = self.stow_remaining + ticks
+        self._has_baggage = self._stow_remaining > 0
+
+    # Class method to create the passengers of a booking manifest at once
+    @classmethod
+    def bulk(cls, flight, records):
+        """
+        Create the seated-to-be passengers of a manifest at once. The seat index and the
+        unseated count of the flight are updated once for all of them, instead of through
+        the seat setter of each passenger.
+
+        :param flight: The flight the passengers are associated with
+        :param records: Iterable of (seat, stow_ticks, group, reduced_mobility) tuples, stow_ticks
+            being 0 for passengers without baggage
+        :return: The list of created passengers
+        """
+        start = len(flight._passengers)
+        passengers = []
+        for offset, (seat, stow_ticks, group, reduced_mobility) in enumerate(records):
+            passenger = cls.__new__(cls)
+            passenger._id = start + offset
+            passenger._flight = flight
+            passenger._has_baggage = stow_ticks > 0
+            passenger._stow_remaining = stow_ticks
+            passenger._group = group
+            passenger._reduced_mobility = reduced_mobility
+            passenger._seat = seat
+            passenger._is_seated = False
+            passengers.append(passenger)
+        if cls.tracking:
+            cls.passengers.update(passengers)
+        flight._passengers.extend(passengers)
+        flight._passenger_by_seat.update((passenger._seat, passenger) for passenger in passengers)
+        flight._unseated_count += len(passengers)
+        return passengers
+
+    # Class method to enable or disable the registry of Passenger instances
+    @classmethod
+    def track_instances(cls, enabled: bool = True):
+        """
+        Enable or disable the registry of created Passenger instances.
+
+        :param enabled: Whether the passengers created from now on are registered
+        """
+        cls.tracking = enabled
+
+    # Class method to find a registered Passenger instance of a flight by its identifier
+    @classmethod
+    def get_passenger_by_id(cls, flight, passenger_id):
+        """
+        Find a registered Passenger instance of a flight by its identifier. Identifiers are only
+        unique within a flight, so the lookup is scoped to one.
+
+        :param flight: The flight of the passenger
+        :param passenger_id: The identifier of the passenger
+        :return: The registered passenger of this flight with this identifier, or None
+        """
+        return next(
+            (passenger for passenger in cls.passengers
+             if passenger._flight is flight and passenger.identifier == passenger_id),
+            None,
+        )
 
-    # Class method to remove a Passenger instance from the class's list by its identifier
+    # Class method to remove a Passenger instance of a flight from the class's registry by its identifier
     @classmethod
-    def remove_passenger(cls, passenger_id):
+    def remove_passenger(cls, flight, passenger_id):
         """
-        Remove a Passenger instance from the class's list by its identifier.
+        Remove a Passenger instance of a flight from the class's registry by its identifier.
 
-        :param passenger_id: The unique identifier of the passenger to remove
+        :param flight: The flight of the passenger
+        :param passenger_id: The identifier of the passenger to remove
         """
-        passenger = cls.get_passenger_by_id(passenger_id)
+        passenger = cls.get_passenger_by_id(flight, passenger_id)
         if passenger:
-            cls.passengers.remove(passenger)
+            cls.passengers.discard(passenger)
 
     # String representation of the Passenger instance for printing
     def __repr__(self):
         """Return a string representation of the Passenger instance."""
-        return f"Passenger({self._id})"
\ No newline at end of file
+        return f"Passenger({self._id})"
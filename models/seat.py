@@ -2,6 +2,9 @@
 class Seat:
     """
     Represents an individual seat on an aircraft.
+
+    Seats use __slots__ and compute their coordinates and name on access, to keep
+    large layouts light.
     
     Attributes (Properties):
     - letter (str): The letter designation of the seat (e.g., 'A', 'B', etc.)
@@ -11,6 +14,8 @@ class Seat:
     - aircraft (Aircraft): The aircraft to which this seat belongs
     """
 
+    __slots__ = ("_letter", "_number", "_aircraft")
+
     def __init__(self, letter: str, number: int, aircraft):
         """
         Initializes a Seat instance.
@@ -22,8 +27,6 @@ class Seat:
         """
         self._letter = letter  # Internal storage for the seat's letter
         self._number = number  # Internal storage for the seat's number
-        self._coordinates = (letter, number)  # Quick reference tuple
-        self._name = f"{letter}{number}"  # Human-readable name
         self._aircraft = aircraft  # Reference to the parent aircraft
         # Automatically adds this seat to the aircraft's seat list
         aircraft.add_seat(self)
@@ -41,12 +44,12 @@ class Seat:
     # Property for controlled access to the seat's coordinates
     @property
     def coordinates(self):
-        return self._coordinates
+        return (self._letter, self._number)
 
     # Property for controlled access to the seat's name
     @property
     def name(self):
-        return self._name
+        return f"{self._letter}{self._number}"
 
     # Property for controlled access to the parent aircraft
     @property
@@ -55,4 +58,4 @@ class Seat:
 
     # Custom representation of the Seat instance for debugging/logging
     def __repr__(self):
-        return f"Seat({self._name})"
\ No newline at end of file
+        return f"Seat({self.name})"
\ No newline at end of file
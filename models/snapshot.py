@@ -0,0 +1,235 @@
+import math
+import struct
+import sys
+from array import array
+
+from .passenger import Passenger
+
+# Snapshot layout (little-endian):
+#   header       magic "FSNP", version, rows, columns, passengers, unseated count, tick, flags,
+#                load factor, baggage probability, stow ticks
+#   rng          version, whether a gauss value is pending, the pending value, then the
+#                Mersenne Twister state (625 u32)
+#   passengers   seat index (i32, -1 without seat), stow ticks left (i32), group (i32),
+#                flags (u8), seat time (f64, NaN when not seated), one column each
+#   layout       the passenger on each cell of the seat rows (i32, -1 for the empty cell),
+#                then the number of seated passengers on each cell (u8)
+#   congestion   number of aisles, then for each aisle its index, its number of rows and the
+#                count of each row (f64)
+#   active rows  number of aisles, then for each aisle its index, its number of rows and
+#                the (row, count) pairs (i32)
+#   queues       number of aisles, then for each aisle its index, its number of doors and,
+#                for each door, its row index, the queue length and the passengers (u32)
+MAGIC = b"FSNP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHIIdBdddi")
+RNG = struct.Struct("<B?d")
+COUNT = struct.Struct("<H")
+PAIR = struct.Struct("<HH")
+QUEUE = struct.Struct("<HI")
+
+FLOAT_TICKS = 1  # Times are seconds (events engine) rather than ticks
+HAS_QUEUES = 2  # The tick engine is running, its queues are stored
+FROM_MANIFEST = 4  # The passengers come from a booking manifest
+
+HAS_BAGGAGE = 1
+IS_SEATED = 2
+REDUCED_MOBILITY = 4
+
+
+def _pack(typecode, values):
+    """
+    Packs values into little-endian bytes.
+    """
+    packed = array(typecode, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+class _Reader:
+    """
+    Reads the sections of a snapshot one after the other.
+    """
+
+    def __init__(self, data):
+        self._data = memoryview(data)
+        self._offset = 0
+
+    def unpack(self, layout: struct.Struct):
+        values = layout.unpack_from(self._data, self._offset)
+        self._offset += layout.size
+        return values
+
+    def array(self, typecode, count):
+        values = array(typecode)
+        end = self._offset + count * values.itemsize
+        values.frombytes(self._data[self._offset:end])
+        if sys.byteorder != "little":
+            values.byteswap()
+        self._offset = end
+        return values
+
+
+def dump_flight(flight):
+    """
+    Serializes the state of a flight into a compact binary snapshot, without copying its
+    object graph: passengers are stored as columns, and cells and queues refer to them by identifier.
+
+    Args:
+        flight (Flight): The flight to serialize.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    layout = flight._layout
+    rows, columns = len(layout) - 1, len(layout[-1])
+    passengers = flight._passengers
+    float_ticks = isinstance(flight._tick, float)
+    flags = (
+        (FLOAT_TICKS if float_ticks else 0) | (HAS_QUEUES if flight._queues is not None else 0)
+        | (FROM_MANIFEST if flight._from_manifest else 0)
+    )
+    min_load, max_load = flight._load_factor
+    parts = [HEADER.pack(
+        MAGIC, VERSION, rows, columns, len(passengers), flight._unseated_count, flight._tick, flags,
+        min_load, max_load, flight._baggage_probability, flight._stow_ticks,
+    )]
+
+    version, state, gauss = flight._random.getstate()
+    parts.append(RNG.pack(version, gauss is not None, gauss or 0.0))
+    parts.append(_pack("I", state))
+
+    seat_index = {seat: index for index, seat in enumerate(flight._aircraft.seats)}
+    seated_ticks = flight._seated_ticks
+    parts.append(_pack("i", [seat_index[p._seat] if p._seat is not None else -1 for p in passengers]))
+    parts.append(_pack("i", [p._stow_remaining for p in passengers]))
+    parts.append(_pack("i", [p._group for p in passengers]))
+    parts.append(bytes(
+        (HAS_BAGGAGE if p._has_baggage else 0) | (IS_SEATED if p._is_seated else 0)
+        | (REDUCED_MOBILITY if p._reduced_mobility else 0)
+        for p in passengers
+    ))
+    parts.append(_pack("d", [seated_ticks.get(p._id, math.nan) for p in passengers]))
+
+    parts.append(_pack("i", [
+        cell._id if isinstance(cell, Passenger) else -1
+        for cells in layout[:-1]
+        for cell in cells
+    ]))
+    parts.append(b"".join(bytes(counts) for counts in flight._blockers))
+
+    parts.append(COUNT.pack(len(flight._aisle_congestion)))
+    for aisle, counts in flight._aisle_congestion.items():
+        parts.append(PAIR.pack(aisle, len(counts)))
+        parts.append(_pack("d", counts))
+
+    parts.append(COUNT.pack(len(flight._active_rows)))
+    for aisle, counts in flight._active_rows.items():
+        parts.append(PAIR.pack(aisle, len(counts)))
+        parts.append(_pack("i", [value for pair in counts.items() for value in pair]))
+
+    queues = flight._queues or {}
+    parts.append(COUNT.pack(len(queues)))
+    for aisle, doors in queues.items():
+        parts.append(PAIR.pack(aisle, len(doors)))
+        for door_row, queue in doors.items():
+            parts.append(QUEUE.pack(door_row, len(queue)))
+            parts.append(_pack("I", [p._id for p in queue]))
+    return b"".join(parts)
+
+
+def load_flight(aircraft, data):
+    """
+    Rebuilds a flight from a snapshot of `dump_flight`.
+
+    Args:
+        aircraft (Aircraft): The aircraft of the snapshotted flight.
+        data (bytes): The snapshot.
+
+    Returns:
+        Flight: The restored flight.
+
+    Raises:
+        ValueError: If the data is not a snapshot, or not one of a flight of this aircraft.
+    """
+    from .flight import Flight
+
+    reader = _Reader(data)
+    if len(data) < HEADER.size:
+        raise ValueError("Not a flight snapshot")
+    (magic, version, rows, columns, count, unseated, tick, flags,
+     min_load, max_load, baggage_probability, stow_ticks) = reader.unpack(HEADER)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a flight snapshot, or an unsupported version")
+    template = aircraft.layout
+    if (rows, columns) != (len(template) - 1, len(template[-1])):
+        raise ValueError(f"Snapshot of a {rows}x{columns} layout, not of this aircraft")
+
+    flight = Flight(aircraft, load_factor=(min_load, max_load), baggage_probability=baggage_probability,
+                    stow_ticks=stow_ticks, manifest=())
+    flight._from_manifest = bool(flags & FROM_MANIFEST)
+    rng_version, has_gauss, gauss = reader.unpack(RNG)
+    state = reader.array("I", 625)
+    flight._random.setstate((rng_version, tuple(state), gauss if has_gauss else None))
+
+    seats = aircraft.seats
+    seat_indices = reader.array("i", count)
+    stow = reader.array("i", count)
+    groups = reader.array("i", count)
+    passenger_flags = reader.array("B", count)
+    seat_times = reader.array("d", count)
+    passengers = flight._passengers
+    for identifier in range(count):
+        passenger = Passenger.__new__(Passenger)
+        passenger._id = identifier
+        passenger._flight = flight
+        passenger._seat = seats[seat_indices[identifier]] if seat_indices[identifier] >= 0 else None
+        passenger._stow_remaining = stow[identifier]
+        passenger._group = groups[identifier]
+        passenger._has_baggage = bool(passenger_flags[identifier] & HAS_BAGGAGE)
+        passenger._is_seated = bool(passenger_flags[identifier] & IS_SEATED)
+        passenger._reduced_mobility = bool(passenger_flags[identifier] & REDUCED_MOBILITY)
+        passengers.append(passenger)
+        if passenger._seat is not None:
+            flight._passenger_by_seat[passenger._seat] = passenger
+        if not math.isnan(seat_times[identifier]):
+            seat_time = seat_times[identifier]
+            flight._seated_ticks[identifier] = seat_time if flags & FLOAT_TICKS else int(seat_time)
+    if Passenger.tracking:
+        Passenger.passengers.update(passengers)
+    flight._unseated_count = unseated
+    flight._tick = tick if flags & FLOAT_TICKS else int(tick)
+
+    cells = reader.array("i", rows * columns)
+    blockers = reader.array("B", rows * columns)
+    layout = flight._layout
+    for row in range(rows):
+        flight._blockers[row][:] = blockers[row * columns:(row + 1) * columns].tobytes()
+        for column in range(columns):
+            identifier = cells[row * columns + column]
+            if identifier >= 0:
+                layout[row][column] = passengers[identifier]
+
+    number, = reader.unpack(COUNT)
+    for _ in range(number):
+        aisle, length = reader.unpack(PAIR)
+        counts = reader.array("d", length)
+        flight._aisle_congestion[aisle] = [value if flags & FLOAT_TICKS else int(value) for value in counts]
+
+    number, = reader.unpack(COUNT)
+    for _ in range(number):
+        aisle, length = reader.unpack(PAIR)
+        pairs = reader.array("i", 2 * length)
+        flight._active_rows[aisle] = dict(zip(pairs[::2], pairs[1::2]))
+
+    number, = reader.unpack(COUNT)
+    if flags & HAS_QUEUES:
+        flight._queues = {}
+    for _ in range(number):
+        aisle, doors = reader.unpack(PAIR)
+        flight._queues[aisle] = {}
+        for _ in range(doors):
+            door_row, length = reader.unpack(QUEUE)
+            flight._queues[aisle][door_row] = [passengers[identifier] for identifier in reader.array("I", length)]
+    return flight
@@ -0,0 +1,228 @@
+from abc import ABC, abstractmethod
+
+
+class BoardingStrategy(ABC):
+    """
+    Base class of the boarding strategies (Strategy Pattern).
+
+    A strategy builds the boarding queue of each aisle once, before the boarding starts.
+    Passengers are shuffled, then stably sorted by the priority of their seat, so passengers
+    sharing the same priority (a boarding group) board in random order. This costs O(n log n).
+
+    Methods:
+    - priority(row, distance, side, rows, max_distance): Boarding priority of a seat, lowest first
+    - queues(flight, rng): The boarding queue of each aisle of the flight
+    """
+
+    # Name under which the strategy is registered in STRATEGIES
+    name = None
+
+    @abstractmethod
+    def priority(self, row: int, distance: int, side: int, rows: int, max_distance: int):
+        """
+        Returns the boarding priority of a seat. Seats with the lowest priority board first.
+
+        Args:
+            row (int): The seat number (1 is the front row).
+            distance (int): The number of columns between the seat and its aisle (1 is the aisle seat).
+            side (int): 0 if the seat is left of its aisle, 1 if it is right of it.
+            rows (int): The number of rows of the aircraft.
+            max_distance (int): The largest distance to this aisle (the window seats).
+
+        Returns:
+            A sortable value.
+        """
+
+    def queues(self, flight, rng):
+        """
+        Builds the boarding queue of each aisle of a flight.
+
+        Args:
+            flight (Flight): The flight to board.
+            rng (random.Random): The random generator used to order passengers within a group.
+
+        Returns:
+            dict: A mapping of aisle indices to the passengers boarding through them, in boarding order.
+        """
+        aircraft = flight.aircraft
+        distance_to_aisle = aircraft.cabin.distance_to_aisle  # Passengers board through their seat's closest aisle
+        passengers_by_aisle = flight.get_passengers_by_aisle()
+        for aisle, passengers in passengers_by_aisle.items():
+            rng.shuffle(passengers)
+            columns = [aircraft.column_of(passenger.seat.letter) for passenger in passengers]
+            max_distance = max((distance_to_aisle[column] for column in columns), default=0)
+            priorities = [
+                self.priority(passenger.seat.number, distance_to_aisle[column], int(column > aisle), aircraft.rows,
+                              max_distance)
+                for passenger, column in zip(passengers, columns)
+            ]
+            order = sorted(range(len(passengers)), key=priorities.__getitem__)
+            passengers_by_aisle[aisle] = [passengers[index] for index in order]
+        return passengers_by_aisle
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class RandomBoarding(BoardingStrategy):
+    """
+    Boards all passengers in random order.
+    """
+
+    name = "random"
+
+    def priority(self, row, distance, side, rows, max_distance):
+        return 0
+
+
+class BackToFront(BoardingStrategy):
+    """
+    Boards one row at a time, from the back row to the front row.
+    """
+
+    name = "back-to-front"
+
+    def priority(self, row, distance, side, rows, max_distance):
+        return -row
+
+
+class ByZoneGroups(BoardingStrategy):
+    """
+    Splits the cabin into zones of consecutive rows and boards one zone at a time.
+
+    Attributes:
+    - groups (int): The number of zones
+    - zone_order (tuple): The order in which zones board, zone 0 being the back of the cabin
+    """
+
+    name = "zones"
+
+    def __init__(self, groups: int = 3, zone_order=None):
+        """
+        Initializes a ByZoneGroups strategy.
+
+        Args:
+            groups (int): The number of zones.
+            zone_order (iterable, optional): The boarding order of the zones, zone 0 being the
+                back of the cabin. Defaults to back to front.
+        """
+        self.groups = groups
+        self.zone_order = tuple(zone_order) if zone_order is not None else tuple(range(groups))
+        self._rank = {zone: rank for rank, zone in enumerate(self.zone_order)}
+
+    def priority(self, row, distance, side, rows, max_distance):
+        zone = (rows - row) * self.groups // rows
+        return self._rank[zone]
+
+    def __repr__(self):
+        return f"ByZoneGroups(groups={self.groups}, zone_order={self.zone_order})"
+
+
+class WindowMiddleAisle(BoardingStrategy):
+    """
+    Boards window seats first, then middle seats, then aisle seats (WilMA).
+    """
+
+    name = "wilma"
+
+    def priority(self, row, distance, side, rows, max_distance):
+        return -distance
+
+
+class Steffen(BoardingStrategy):
+    """
+    Boards seat by seat to spread passengers along the aisle (Steffen method): window seats
+    first, every other row from the back, one side of the aisle at a time.
+    """
+
+    name = "steffen"
+
+    def priority(self, row, distance, side, rows, max_distance):
+        return (-distance, (rows - row) % 2, side, -row)
+
+
+class ReversePyramid(BoardingStrategy):
+    """
+    Boards in diagonal groups, starting with the window seats at the back of the cabin
+    and ending with the aisle seats at the front (reverse pyramid).
+    """
+
+    name = "reverse-pyramid"
+
+    def priority(self, row, distance, side, rows, max_distance):
+        return (max_distance - distance) + (rows - row) * (max_distance + 1) // rows
+
+
+class ManifestGroups(BoardingStrategy):
+    """
+    Follows the boarding groups of the booking manifest: passengers with reduced mobility
+    pre-board, then each group boards in turn, lowest group first. It is not registered by
+    name, as only manifest passengers have groups: flights loaded from a manifest use it by
+    default (see `Flight.load_manifest`).
+    """
+
+    def priority(self, row, distance, side, rows, max_distance):
+        return 0
+
+    def queues(self, flight, rng):
+        passengers_by_aisle = flight.get_passengers_by_aisle()
+        for passengers in passengers_by_aisle.values():
+            rng.shuffle(passengers)
+            passengers.sort(key=lambda passenger: (not passenger.reduced_mobility, passenger.group))
+        return passengers_by_aisle
+
+
+class GroupAssignment(BoardingStrategy):
+    """
+    Boards groups of seats in a given order. Each seat class, identified by its row and its
+    distance to the aisle, is assigned to a boarding group; group 0 boards first. It is not
+    registered by name, as it is meaningless without an assignment (see `utils.optimizer`).
+
+    Attributes:
+    - assignment (dict): The group of each (row, distance) seat class
+    - default_group (int): The group of the seat classes missing from the assignment
+    """
+
+    def __init__(self, assignment=None, default_group: int = 0):
+        """
+        Initializes a GroupAssignment strategy.
+
+        Args:
+            assignment (dict, optional): The group of each (row, distance) seat class.
+            default_group (int): The group of the seat classes missing from the assignment.
+        """
+        self.assignment = dict(assignment or {})
+        self.default_group = default_group
+
+    def priority(self, row, distance, side, rows, max_distance):
+        return self.assignment.get((row, distance), self.default_group)
+
+    def __repr__(self):
+        return f"GroupAssignment({len(self.assignment)} seat classes, {len(set(self.assignment.values()))} groups)"
+
+
+# Built-in strategies, by name
+STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (RandomBoarding, BackToFront, ByZoneGroups, WindowMiddleAisle, Steffen, ReversePyramid)
+}
+
+
+def get_strategy(strategy):
+    """
+    Returns a boarding strategy instance.
+
+    Args:
+        strategy (BoardingStrategy | str | None): A strategy, the name of a built-in strategy,
+            or None for random boarding.
+
+    Returns:
+        BoardingStrategy: The strategy instance.
+    """
+    if strategy is None:
+        return RandomBoarding()
+    if isinstance(strategy, str):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown boarding strategy: {strategy}. Available: {', '.join(STRATEGIES)}")
+        return STRATEGIES[strategy]()
+    return strategy
@@ -0,0 +1,63 @@
+import argparse
+import os
+
+from models.aircraft import Aircraft
+from models.boarding_result import TIME_UNITS
+from models.cabin_config import load_aircraft
+from models.strategies import STRATEGIES
+from utils.run import compare_doors, compare_strategies, monte_carlo
+
+
+def format_summary(summary, unit="ticks"):
+    """
+    Formats a MonteCarloSummary on one line, its times being in `unit`.
+    """
+    low, high = summary.confidence_interval
+    return (
+        f"mean {summary.mean:8.2f} {unit} | 95% CI [{low:.2f}, {high:.2f}] | "
+        f"p5 {summary.percentiles[5]:.1f} p50 {summary.percentiles[50]:.1f} p95 {summary.percentiles[95]:.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs seeded boarding simulations in parallel and reports statistics.")
+    parser.add_argument("--rows", type=int, default=30, help="number of rows of the aircraft")
+    parser.add_argument("--columns", type=int, default=6, help="number of seats per row")
+    parser.add_argument("--cabin", help="cabin configuration file (JSON or TOML), instead of --rows and --columns")
+    parser.add_argument("--runs", type=int, default=1000, help="number of replications")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first replication")
+    parser.add_argument("--engine", choices=["objects", "vectorized", "events"], default="objects", help="boarding engine")
+    parser.add_argument("--every", type=int, default=100, help="replications between two reports")
+    parser.add_argument("--strategy", choices=list(STRATEGIES), default="random", help="boarding strategy")
+    parser.add_argument("--compare", action="store_true", help="compare all boarding strategies on the same manifests")
+    parser.add_argument("--doors", type=int, nargs="+", help="rows of the boarding doors (default: the cabin's doors)")
+    parser.add_argument("--compare-doors", action="store_true", help="compare --doors with front-door boarding on the same manifests")
+    args = parser.parse_args()
+
+    aircraft = load_aircraft(args.cabin) if args.cabin else Aircraft(args.rows, args.columns)
+    unit = TIME_UNITS[args.engine]
+    if args.compare_doors:
+        doors = args.doors or list(aircraft.cabin.doors)
+        if doors == [1]:
+            doors = [1, aircraft.rows]  # Front and rear doors
+        summaries = compare_doors(aircraft, [[1], doors], args.runs, args.workers, args.seed, args.engine, args.strategy)
+        single, multiple = summaries.values()
+        for door_set, summary in summaries.items():
+            print(f"{'doors ' + ','.join(map(str, door_set)):>16} | {format_summary(summary, unit)}")
+        print(f"Boarding time: {100 * (multiple.mean / single.mean - 1):+.1f}% with doors {','.join(map(str, doors))}")
+        return
+
+    if args.compare:
+        summaries = compare_strategies(aircraft, replications=args.runs, workers=args.workers, seed=args.seed, engine=args.engine)
+        for name, summary in summaries.items():
+            print(f"{name:>16} | {format_summary(summary, unit)}")
+        return
+
+    for summary in monte_carlo(aircraft, args.runs, args.workers, args.seed, args.engine, args.every,
+                               strategy=args.strategy, doors=args.doors):
+        print(f"{summary.count:>7} runs | {format_summary(summary, unit)}")
+
+
+if __name__ == "__main__":
+    main()
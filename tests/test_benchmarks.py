@@ -0,0 +1,38 @@
+import json
+
+from benchmarks.suite import BASELINE_PATH, BENCHMARKS, compare, run_benchmark, run_suite, speedups
+
+
+def test_compare_reports_only_slowdowns_above_the_threshold():
+    baseline = {"a/1x1": {"median": 1.0}, "b/1x1": {"median": 1.0}, "c/1x1": {"median": 1.0}}
+    results = {"a/1x1": {"median": 1.2}, "b/1x1": {"median": 1.5}, "c/1x1": {"median": 0.5}, "d/1x1": {"median": 9.0}}
+
+    assert compare(results, baseline, 0.25) == [("b/1x1", 1.5)]
+
+
+def test_run_benchmark_times_every_repeat():
+    result = run_benchmark("layout_generation", 5, 4, repeats=3)
+
+    assert result["repeats"] == 3
+    assert 0 < result["min"] <= result["median"]
+
+
+def test_suite_covers_the_baseline():
+    baseline = json.loads(BASELINE_PATH.read_text())["results"]
+    results = run_suite([(5, 4)], ["layout_generation", "headless_boarding"], repeats=1)
+
+    assert set(results) == {"layout_generation/5x4", "headless_boarding/5x4"}
+    assert {key.split("/")[0] for key in baseline} <= set(BENCHMARKS)
+
+
+def test_speedups_compare_the_engines_per_cabin():
+    results = {"headless_boarding/1x1": {"median": 3.0}, "vectorized_boarding/1x1": {"median": 1.5},
+               "vectorized_boarding/2x2": {"median": 1.0}}
+
+    assert speedups(results) == {"1x1": 2.0}
+
+
+def test_vectorized_engine_beats_the_object_engine_on_large_cabins():
+    results = run_suite([(120, 12)], ["headless_boarding", "vectorized_boarding"], repeats=3)
+
+    assert speedups(results)["120x12"] > 1
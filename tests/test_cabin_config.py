@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from models.cabin_config import column_labels, load_aircraft, load_cabin, parse_config
+from models.flight import Flight
+
+CONFIG_PATH = "configs/a321_two_class.toml"
+
+
+def test_parse_config():
+    cabin = parse_config({"name": "test", "rows": 3, "columns": [2, 2], "blocked": ["B2"], "doors": [3, 1]})
+
+    assert cabin.labels == ("A", "B", "-", "C", "D")
+    assert cabin.blocked == {(1, 1)}
+    assert cabin.doors == (1, 3)
+    assert cabin.distance_to_aisle == (2, 1, 0, 1, 2)
+
+
+def test_column_labels_past_z():
+    assert column_labels(28)[-3:] == ["Z", "AA", "AB"]
+
+
+@pytest.mark.parametrize("config", [
+    {"columns": "AB|CD"},
+    {"rows": 0, "columns": "AB|CD"},
+    {"rows": "3", "columns": "AB|CD"},
+    {"rows": 3},
+    {"rows": 3, "columns": []},
+    {"rows": 3, "columns": "ABCD"},
+    {"rows": 3, "columns": "|"},
+    {"rows": 3, "columns": ["A", "A", "|", "B"]},
+    {"rows": 3, "columns": "AB|CD", "blocks": [{"rows": [2, 4], "seats": ["A"]}]},
+    {"rows": 3, "columns": "AB|CD", "blocks": [{"rows": [1, 2], "seats": ["E"]}]},
+    {"rows": 3, "columns": "AB|CD", "blocks": [{"seats": ["A"]}]},
+    {"rows": 3, "columns": "AB|CD", "blocks": [{"rows": 2, "seats": ["A"]}]},
+    {"rows": 3, "columns": "AB|CD", "blocked": ["E1"]},
+    {"rows": 3, "columns": "AB|CD", "blocked": ["A4"]},
+    {"rows": 3, "columns": "AB|CD", "blocked": ["1A"]},
+    {"rows": 3, "columns": "AB|CD", "doors": []},
+    {"rows": 3, "columns": "AB|CD", "doors": [4]},
+])
+def test_invalid_configurations_are_rejected(config):
+    with pytest.raises(ValueError):
+        parse_config(config)
+
+
+@pytest.mark.parametrize("columns", ["|AB", "AB|CD|"])
+@pytest.mark.parametrize("engine", ["objects", "vectorized", "events"])
+def test_cabins_with_an_aisle_at_the_edge_board(tmp_path, columns, engine):
+    path = tmp_path / "edge.json"
+    path.write_text(json.dumps({"rows": 6, "columns": columns}))
+    aircraft = load_aircraft(path, None, shared=False)
+
+    flight = Flight(aircraft, seed=1)
+    result = flight.run_headless(engine)
+
+    assert flight.unseated_count == 0
+    assert len(result.seat_times) == sum(passenger.seat is not None for passenger in flight.passengers)
+
+
+def test_compiled_configurations_are_cached(tmp_path):
+    cabin, key = load_cabin(CONFIG_PATH, tmp_path)
+    cached, cached_key = load_cabin(CONFIG_PATH, tmp_path)
+
+    assert [path.name for path in tmp_path.iterdir()] == [f"{key}.json"]
+    assert cached_key == key
+    assert json.dumps(cached.to_dict()) == json.dumps(cabin.to_dict())
+    assert cached.blocked == cabin.blocked and cached.door_distance == cabin.door_distance
+
+
+def test_aircraft_are_shared_unless_requested(tmp_path):
+    aircraft = load_aircraft(CONFIG_PATH, None)
+
+    assert load_aircraft(CONFIG_PATH, tmp_path) is aircraft
+    unshared = load_aircraft(CONFIG_PATH, None, shared=False)
+    assert unshared is not aircraft
+    assert unshared.capacity == aircraft.capacity == 16 + 28 * 6 - 4
@@ -0,0 +1,48 @@
+import pytest
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+
+
+@pytest.mark.parametrize("rows, columns", [(10, 4), (20, 6), (15, 10)])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_vectorized_engine_matches_objects_engine(rows, columns, seed):
+    aircraft = Aircraft(rows, columns)
+    objects = Flight(aircraft, seed=seed).run_headless("objects")
+    vectorized = Flight(aircraft, seed=seed).run_headless("vectorized")
+
+    assert vectorized.ticks == objects.ticks
+    assert vectorized.seat_times == objects.seat_times
+    assert vectorized.aisle_congestion == objects.aisle_congestion
+
+
+@pytest.mark.parametrize("engine", ["objects", "vectorized"])
+def test_baggage_without_stow_ticks_takes_no_tick(engine):
+    aircraft = Aircraft(6, 4)
+    records = [{"seat": "A3", "baggage": True, "stow_ticks": 0}, {"seat": "C5", "baggage": True, "stow_ticks": 2}]
+    with_baggage = Flight(aircraft, seed=0, manifest=records).run_headless(engine)
+    records[0] = {"seat": "A3", "baggage": False}
+    without_baggage = Flight(aircraft, seed=0, manifest=records).run_headless(engine)
+
+    assert with_baggage.seat_times == without_baggage.seat_times
+
+
+def test_baggage_without_stow_ticks_matches_across_engines():
+    flight = Flight(Aircraft(6, 4), seed=0, stow_ticks=0)
+    objects = flight.run_headless("objects")
+    vectorized = Flight(Aircraft(6, 4), seed=0, stow_ticks=0).run_headless("vectorized")
+
+    assert any(passenger.seat is not None for passenger in flight.passengers)
+    assert vectorized.seat_times == objects.seat_times
+
+
+def test_vectorized_engine_seats_passengers_in_the_layout():
+    flight = Flight(Aircraft(8, 6), seed=3)
+    flight.run_headless("vectorized")
+
+    for passenger in flight.passengers:
+        if passenger.seat is not None:
+            assert passenger.is_seated
+            row, column = passenger.seat.number - 1, flight.aircraft.column_of(passenger.seat.letter)
+            assert flight.layout[row][column] is passenger
+    assert flight.unseated_count == 0
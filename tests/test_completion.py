@@ -0,0 +1,40 @@
+from models.aircraft import Aircraft
+from models.flight import Flight
+
+
+def _unseated(flight):
+    return sum(1 for p in flight.passengers if p.seat is not None and not p.is_seated)
+
+
+def test_unseated_count_matches_a_full_scan_on_every_tick():
+    flight = Flight(Aircraft(8, 6), seed=4)
+    assert flight.unseated_count == _unseated(flight)
+
+    for _ in flight.boarding_ticks():
+        assert flight.unseated_count == _unseated(flight)
+    assert flight.unseated_count == 0
+
+
+def test_standing_up_counts_the_passenger_again():
+    flight = Flight(Aircraft(4, 4), seed=0)
+    flight.run_headless()
+    passenger = next(p for p in flight.passengers if p.seat is not None)
+
+    passenger.stand_up()
+    assert flight.unseated_count == 1
+    passenger.sit_down()
+    assert flight.unseated_count == 0
+
+
+def test_boarding_finishes_after_a_passenger_stands_up():
+    flight = Flight(Aircraft(4, 4), seed=0)
+    first = flight.run_headless()
+    passenger = next(p for p in flight.passengers if p.seat is not None)
+
+    passenger.stand_up()
+    result = flight.run_headless()
+
+    assert passenger.is_seated
+    assert flight.unseated_count == 0
+    assert result.ticks == first.ticks + 1
+    assert result.seat_times[passenger.identifier] == first.ticks + 1
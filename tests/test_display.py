@@ -0,0 +1,47 @@
+import io
+import re
+
+import pytest
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+from utils.display import GLYPH_ALIASES, TerminalRenderer
+
+CURSOR_MOVE = re.compile(r"\x1b\[(\d+);(\d+)H")
+
+
+@pytest.fixture(autouse=True)
+def plain_glyphs(monkeypatch):
+    # One letter per state keeps the output readable and independent of the emoji package
+    monkeypatch.setattr(TerminalRenderer, "_glyphs", {state: "ABCDEFG"[state] for state in GLYPH_ALIASES})
+
+
+def test_only_changed_cells_are_redrawn():
+    flight = Flight(Aircraft(5, 4), seed=0)
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream=stream)
+    renderer.render(flight)
+    assert stream.getvalue().startswith("\x1b[2J\x1b[H")
+    assert stream.getvalue().count("\n") == 4
+
+    ticks = flight.boarding_ticks()
+    before = [[flight.cell_state(row, column)[0] for column in range(5)] for row in range(5)]
+    next(ticks)
+    after = [[flight.cell_state(row, column)[0] for column in range(5)] for row in range(5)]
+    stream.seek(0)
+    stream.truncate()
+    renderer.render(flight)
+
+    changed = sum(old != new for old_row, new_row in zip(before, after) for old, new in zip(old_row, new_row))
+    assert changed > 0
+    assert len(CURSOR_MOVE.findall(stream.getvalue())) == changed
+    assert "\x1b[2J" not in stream.getvalue()
+
+
+def test_frame_rate_cap_skips_frames_unless_forced():
+    flight = Flight(Aircraft(5, 4), seed=0)
+    renderer = TerminalRenderer(max_fps=0.001, stream=io.StringIO())
+
+    assert renderer.render(flight)
+    assert not renderer.render(flight)
+    assert renderer.render(flight, force=True)
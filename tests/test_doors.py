@@ -0,0 +1,65 @@
+import pytest
+
+from models.aircraft import Aircraft
+from models.cabin_config import load_aircraft
+from models.flight import Flight
+from utils.run import compare_doors, init_worker, simulate_seed
+
+
+def test_passengers_board_through_their_closest_door():
+    aircraft = Aircraft(20, 6)
+    flight = Flight(aircraft, seed=0)
+    queues = flight._door_queues(flight._boarding_queues("random"), [1, 20])
+
+    for doors in queues.values():
+        assert set(doors) == {0, 19}
+        assert all(passenger.seat.number <= 10 for passenger in doors[0])
+        assert all(passenger.seat.number > 10 for passenger in doors[19])
+
+
+@pytest.mark.parametrize("engine", ["objects", "events"])
+def test_every_passenger_is_seated_with_two_doors(engine):
+    flight = Flight(Aircraft(20, 6), seed=1)
+    result = flight.run_headless(engine, doors=[1, 20])
+
+    assert flight.unseated_count == 0
+    assert len(result.seat_times) == sum(passenger.seat is not None for passenger in flight.passengers)
+
+
+def test_cabin_doors_are_the_default():
+    aircraft = load_aircraft("configs/a321_two_class.toml", None)
+    default = Flight(aircraft, seed=2).run_headless()
+    explicit = Flight(aircraft, seed=2).run_headless(doors=list(aircraft.cabin.doors))
+
+    assert aircraft.cabin.doors == (1, 32)
+    assert default.seat_times == explicit.seat_times
+
+
+def test_two_doors_board_faster():
+    summaries = compare_doors(Aircraft(30, 6), [[1], [1, 30]], replications=10)
+    single, double = summaries.values()
+
+    assert list(summaries) == [(1,), (1, 30)]
+    assert double.mean < single.mean
+
+
+def test_vectorized_engine_only_boards_through_the_front_door():
+    with pytest.raises(ValueError):
+        Flight(Aircraft(10, 4), seed=0).run_headless("vectorized", doors=[1, 10])
+
+
+@pytest.mark.parametrize("doors", [[], [0], [11], [-3], [1, 11]])
+@pytest.mark.parametrize("engine", ["objects", "vectorized", "events"])
+def test_doors_outside_of_the_aircraft_are_rejected(engine, doors):
+    with pytest.raises(ValueError):
+        Flight(Aircraft(10, 4), seed=0).run_headless(engine, doors=doors)
+
+
+@pytest.mark.parametrize("doors", [[], [0], [11]])
+def test_replications_reject_doors_outside_of_the_aircraft(doors):
+    aircraft = Aircraft(10, 4)
+    init_worker(aircraft)
+    with pytest.raises(ValueError):
+        simulate_seed(0, doors=doors)
+    with pytest.raises(ValueError):
+        compare_doors(aircraft, [[1], doors], replications=2)
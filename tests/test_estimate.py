@@ -0,0 +1,33 @@
+import numpy as np
+
+from models.aircraft import Aircraft
+from utils.estimate import estimate_ticks, rank_agreement, screen, validation_report
+
+
+def test_estimates_are_reproducible_and_positive():
+    aircraft = Aircraft(10, 6)
+    ticks = estimate_ticks(aircraft, "random", samples=50, seed=3)
+
+    assert ticks.shape == (50,)
+    assert (ticks > 0).all()
+    assert np.array_equal(ticks, estimate_ticks(aircraft, "random", samples=50, seed=3))
+
+
+def test_estimates_are_close_to_the_simulator():
+    report = validation_report([Aircraft(20, 6)], ["random", "back-to-front", "wilma"], replications=20, samples=500)
+
+    for line in report:
+        assert 0.85 < line["ratio"] < 1.15, line
+    pearson, _ = rank_agreement(report)
+    assert pearson > 0.8
+
+
+def test_screen_keeps_the_best_configurations():
+    aircraft = Aircraft(20, 6)
+    candidates = [(name, aircraft, name) for name in ("random", "back-to-front", "wilma")]
+    shortlist = screen(candidates, samples=200, keep=2)
+
+    assert len(shortlist) == 2
+    means = [summary.mean for *_, summary in shortlist]
+    assert means == sorted(means)
+    assert shortlist[0][3].mean <= estimate_ticks(aircraft, "back-to-front", 200).mean()
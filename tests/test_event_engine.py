@@ -0,0 +1,56 @@
+import random
+
+from models.aircraft import Aircraft
+from models.boarding_result import BoardingResult
+from models.event_engine import PassengerBehavior
+from models.flight import Flight
+from montecarlo import format_summary
+from utils.run import MonteCarloSummary
+
+
+def test_events_engine_seats_everyone_in_seconds():
+    aircraft = Aircraft(10, 6)
+    result = Flight(aircraft, seed=4).run_headless("events")
+    again = Flight(aircraft, seed=4).run_headless("events")
+
+    assert result.unit == "seconds"
+    assert isinstance(result.ticks, float)
+    assert result.ticks == max(result.seat_times.values())
+    assert result.seat_times == again.seat_times
+    assert len(result.seat_times) == len(Flight(aircraft, seed=4).run_headless().seat_times)
+
+
+def test_constant_durations_do_not_depend_on_the_draws():
+    behavior = PassengerBehavior(walk_time=1.0, stow_time=2.0, seat_time=1.0, interference_time=1.0, reaction_time=0.0)
+    flight = Flight(Aircraft(6, 4), seed=1)
+    result = flight.run_headless("events", behavior=behavior)
+
+    # Every action lasts a whole number of seconds
+    assert all(time == int(time) for time in result.seat_times.values())
+
+
+def test_slower_passengers_board_slower():
+    aircraft = Aircraft(10, 6)
+    fast = Flight(aircraft, seed=2).run_headless("events", behavior=PassengerBehavior(stow_time=2.0))
+    slow = Flight(aircraft, seed=2).run_headless("events", behavior=PassengerBehavior(stow_time=20.0))
+
+    assert slow.ticks > fast.ticks
+
+
+def test_draw_keeps_the_mean():
+    rng = random.Random(0)
+    draws = [PassengerBehavior.draw(rng, (6.0, 3.0)) for _ in range(20000)]
+
+    assert min(draws) > 0
+    assert abs(sum(draws) / len(draws) - 6.0) < 0.1
+
+
+def test_units_are_labelled():
+    assert Flight(Aircraft(4, 4), seed=0).run_headless().unit == "ticks"
+    assert " seconds |" in format_summary(MonteCarloSummary([1.5, 2.5]), "seconds")
+    assert " ticks |" in format_summary(MonteCarloSummary([1, 2]))
+
+
+def test_result_unit_is_stored_on_construction():
+    assert BoardingResult(12.0, {}, {}).unit == "ticks"
+    assert BoardingResult(12, {}, {}, unit="seconds").unit == "seconds"
@@ -0,0 +1,19 @@
+from models.aircraft import Aircraft, ColumnGeometry
+from models.flight import Flight
+
+
+def test_column_geometry():
+    aircraft = Aircraft(4, 6)
+
+    assert aircraft.geometry == tuple(ColumnGeometry(3, direction) for direction in (-1, -1, -1, 0, 1, 1, 1))
+    assert Aircraft(10, 6).geometry is aircraft.geometry  # Shared by the aircraft with the same aisles
+
+
+def test_seated_passengers_count_as_blockers_once():
+    flight = Flight(Aircraft(8, 6), seed=0)
+    flight.run_headless()
+
+    for row, counts in enumerate(flight._blockers):
+        for column, count in enumerate(counts):
+            seat = flight.aircraft.layout[row][column]
+            assert count == (seat in flight._passenger_by_seat)
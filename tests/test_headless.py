@@ -0,0 +1,30 @@
+import pytest
+
+from models.aircraft import Aircraft
+from models.boarding_result import BoardingResult
+from models.flight import Flight
+
+
+def test_run_headless_seats_every_passenger():
+    flight = Flight(Aircraft(10, 6), seed=1)
+    result = flight.run_headless()
+
+    assert isinstance(result, BoardingResult)
+    seated = [passenger for passenger in flight.passengers if passenger.seat is not None]
+    assert all(passenger.is_seated for passenger in seated)
+    assert set(result.seat_times) == {passenger.identifier for passenger in seated}
+    assert result.ticks == max(result.seat_times.values())
+
+
+def test_run_headless_is_reproducible_with_a_seed():
+    first = Flight(Aircraft(12, 6), seed=7).run_headless()
+    second = Flight(Aircraft(12, 6), seed=7).run_headless()
+
+    assert first.ticks == second.ticks
+    assert first.seat_times == second.seat_times
+    assert first.aisle_congestion == second.aisle_congestion
+
+
+def test_run_headless_rejects_unknown_engine():
+    with pytest.raises(ValueError):
+        Flight(Aircraft(4, 4), seed=0).run_headless("teleport")
@@ -0,0 +1,31 @@
+from models.aircraft import Aircraft
+from models.flight import Flight
+
+
+def test_column_of_matches_the_label_row():
+    aircraft = Aircraft(5, 10)
+    labels = aircraft.layout[-1]
+
+    for seat in aircraft.seats:
+        assert labels[aircraft.column_of(seat.letter)] == seat.letter
+
+
+def test_aisle_of_is_the_closest_aisle():
+    aircraft = Aircraft(5, 10)
+
+    for seat in aircraft.seats:
+        column = aircraft.column_of(seat.letter)
+        distances = [abs(column - aisle) for aisle in aircraft.aisle_positions]
+        assert abs(column - aircraft.aisle_of(seat)) == min(distances)
+
+
+def test_passenger_at_follows_seat_changes():
+    flight = Flight(Aircraft(5, 6), seed=0)
+    passenger = next(p for p in flight.passengers if p.seat is not None)
+    old_seat = passenger.seat
+    free_seat = next(seat for seat in flight.seats if flight.passenger_at(seat) is None)
+
+    passenger.seat = free_seat
+
+    assert flight.passenger_at(free_seat) is passenger
+    assert flight.passenger_at(old_seat) is None
@@ -0,0 +1,49 @@
+import csv
+
+import pytest
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+from utils.instrumentation import TickCollector
+
+
+def test_observers_do_not_change_the_boarding():
+    aircraft = Aircraft(8, 6)
+    plain = Flight(aircraft, seed=3).run_headless()
+    flight = Flight(aircraft, seed=3)
+    collector = TickCollector()
+    collector.attach(flight)
+    observed = flight.run_headless()
+
+    assert observed.ticks == plain.ticks
+    assert observed.seat_times == plain.seat_times
+    series = collector.time_series()
+    assert len(series) == observed.ticks
+    assert sum(record["sit"] for record in series) == len(observed.seat_times)
+    assert sum(record["enter"] for record in series) == len(observed.seat_times)
+
+
+def test_profiler_times_the_handlers(tmp_path):
+    flight = Flight(Aircraft(6, 4), seed=0)
+    collector = TickCollector()
+    collector.attach(flight)
+    flight.run_headless()
+    collector.detach(flight)
+
+    profile = collector.handler_profile()
+    assert {"_entry_point", "_passenger_aisle_case"} <= set(profile)
+    assert all(entry["calls"] > 0 for entry in profile.values())
+    assert flight.profiler is None
+
+    path = tmp_path / "series.csv"
+    collector.to_csv(path)
+    with open(path, newline="") as file:
+        assert len(list(csv.DictReader(file))) == len(collector.time_series())
+
+
+def test_other_engines_refuse_observers():
+    flight = Flight(Aircraft(6, 4), seed=0)
+    flight.add_observer(lambda *event: None)
+
+    with pytest.raises(ValueError):
+        flight.run_headless("vectorized")
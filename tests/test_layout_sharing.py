@@ -0,0 +1,25 @@
+from models.aircraft import Aircraft
+from models.flight import Flight
+
+
+def test_flights_share_the_aircraft_but_not_the_layout():
+    aircraft = Aircraft(6, 6)
+    first = Flight(aircraft, seed=0)
+    second = Flight(aircraft, seed=1)
+
+    first.run_headless()
+
+    assert first.layout is not second.layout
+    assert all(cell == template for row, template_row in zip(second.layout, aircraft.layout)
+               for cell, template in zip(row, template_row))
+    assert first.seats is second.seats
+
+
+def test_aircraft_layout_is_read_only():
+    aircraft = Aircraft(4, 4)
+    flight = Flight(aircraft, seed=0)
+    flight.run_headless()
+
+    assert isinstance(aircraft.layout, tuple)
+    assert all(isinstance(row, tuple) for row in aircraft.layout)
+    assert Flight(aircraft, seed=0).run_headless().ticks == Flight(aircraft, seed=0).run_headless().ticks
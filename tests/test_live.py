@@ -0,0 +1,65 @@
+import asyncio
+import json
+
+import pytest
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+from utils.live import LiveBoardingService, tick_snapshot
+
+
+async def _get(port, path):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), body
+
+
+def test_flights_board_on_a_shared_clock_like_headless_runs():
+    aircraft = Aircraft(6, 4)
+    service = LiveBoardingService(tick_interval=0)
+    live_flights = [service.add_flight(f"gate-{seed}", Flight(aircraft, seed=seed)) for seed in range(3)]
+    asyncio.run(service.run())
+
+    for seed, live_flight in enumerate(live_flights):
+        assert live_flight.is_complete
+        assert live_flight.snapshot["tick"] == Flight(aircraft, seed=seed).run_headless().ticks
+        assert live_flight.snapshot["unseated"] == 0
+
+
+def test_duplicate_names_are_rejected():
+    service = LiveBoardingService()
+    service.add_flight("gate-1", Flight(Aircraft(4, 4), seed=0))
+
+    with pytest.raises(ValueError):
+        service.add_flight("gate-1", Flight(Aircraft(4, 4), seed=1))
+
+
+def test_http_endpoints():
+    async def scenario():
+        service = LiveBoardingService(tick_interval=0)
+        flight = Flight(Aircraft(4, 4), seed=0)
+        service.add_flight("gate-1", flight)
+        server = await service.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            listing = await _get(port, "/flights")
+            detail = await _get(port, "/flights/gate-1")
+            missing = await _get(port, "/flights/gate-2")
+            stream = asyncio.ensure_future(_get(port, "/flights/gate-1/stream"))
+            await asyncio.sleep(0.05)  # Let the subscriber connect before the boarding starts
+            await service.run()
+            streamed = await stream
+        return flight, listing, detail, missing, streamed
+
+    flight, listing, detail, missing, streamed = asyncio.run(scenario())
+
+    assert listing == (200, json.dumps([{"flight": "gate-1", "tick": 0, "complete": False}]).encode())
+    assert detail[0] == 200 and json.loads(detail[1])["cells"] == tick_snapshot("gate-1", Flight(Aircraft(4, 4), seed=0))["cells"]
+    assert missing[0] == 404
+    assert streamed[0] == 200
+    events = [json.loads(line[len(b"data: "):]) for line in streamed[1].split(b"\n\n") if line]
+    assert events[-1]["complete"] and events[-1]["tick"] == flight.tick
@@ -0,0 +1,39 @@
+import csv
+import warnings
+
+import pytest
+
+from main import main, parse_arguments
+
+
+def test_argument_errors():
+    for argv in (["--runs", "2"], ["--output", "results"], ["--headless", "--runs", "0"], ["--headless", "--render"]):
+        with pytest.raises(SystemExit):
+            parse_arguments(argv)
+
+
+def test_headless_runs_print_one_line_each_without_warnings(capsys):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # Default flights overbook, which must not warn on the command line
+        main(["--headless", "--rows", "10", "--columns", "6", "--seed", "1", "--runs", "5"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(" | ")[0] for line in lines] == [f"run {run}" for run in range(5)]
+    assert all(line.split(" | ")[2].endswith(" ticks") for line in lines)
+
+
+def test_events_engine_reports_seconds(capsys):
+    main(["--headless", "--rows", "10", "--columns", "6", "--seed", "1", "--engine", "events"])
+
+    fields = capsys.readouterr().out.strip().split(" | ")
+    assert fields[2].endswith(" seconds") and fields[3].endswith(" seconds blocked")
+
+
+def test_headless_results_are_written(tmp_path, capsys):
+    prefix = tmp_path / "results"
+    main(["--headless", "--rows", "6", "--columns", "4", "--seed", "3", "--runs", "2", "--output", str(prefix)])
+
+    with open(f"{prefix}_runs.csv", newline="") as file:
+        runs = list(csv.DictReader(file))
+    assert [run["flight"] for run in runs] == ["3", "4"]
+    assert all(run["aircraft"] == "6x4" for run in runs)
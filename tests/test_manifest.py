@@ -0,0 +1,102 @@
+import csv
+
+import numpy as np
+import pytest
+
+from models.aircraft import Aircraft
+from models.cabin_config import parse_config
+from models.flight import Flight
+from models.strategies import STRATEGIES, get_strategy
+from utils.manifest import ResultWriter, iter_manifests, replay, write_manifests
+
+
+def _passengers(flight):
+    return [
+        (passenger.seat, passenger.stow_remaining, passenger.group, passenger.reduced_mobility)
+        for passenger in flight.passengers
+        if passenger.seat is not None
+    ]
+
+
+def test_manifest_round_trip():
+    aircraft = Aircraft(8, 6)
+    flight = Flight(aircraft, seed=5, stow_ticks=3)
+    flight.passengers[0].delay(2)
+
+    loaded = Flight(aircraft, seed=5, manifest=flight.manifest())  # Default stow_ticks of 1
+    assert _passengers(loaded) == _passengers(flight)
+    assert loaded.manifest() == flight.manifest()
+
+
+def test_seat_names_resolve_on_the_grid():
+    aircraft = Aircraft.from_cabin(parse_config({"rows": 3, "columns": "AB|CD", "blocked": ["B2"]}))
+
+    assert aircraft.seat_named("2A") is aircraft.layout[1][0]
+    assert aircraft.seat_named(" c3 ") is aircraft.layout[2][3]
+    for name in ("B2", "2-", "0A", "4A", "E1", "A", "12", ""):
+        with pytest.raises(KeyError):
+            aircraft.seat_named(name)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+def test_manifest_file_round_trip(tmp_path, suffix):
+    aircraft = Aircraft(8, 6)
+    flights = {f"F{seed}": Flight(aircraft, seed=seed, stow_ticks=2) for seed in range(3)}
+    path = tmp_path / f"schedule{suffix}"
+    write_manifests(path, [(name, "8x6", flight.manifest()) for name, flight in flights.items()])
+
+    for flight_id, spec, records in iter_manifests(path):
+        assert spec == "8x6"
+        assert _passengers(Flight(aircraft, manifest=records)) == _passengers(flights[flight_id])
+
+
+def test_manifest_records():
+    aircraft = Aircraft(4, 4)
+    records = [{"seat": "2A", "baggage": 2, "group": 1}, {"seat": "B1", "reduced_mobility": True}]
+    flight = Flight(aircraft, stow_ticks=3, manifest=records)
+
+    assert _passengers(flight) == [(aircraft.seat_named("A2"), 6, 1, False), (aircraft.seat_named("1B"), 0, 0, True)]
+    for invalid in ([{"seat": "9A"}], [{"seat": "1E"}], [{"seat": "1A"}, {"seat": "A1"}]):
+        with pytest.raises(ValueError):
+            Flight(aircraft, manifest=invalid)
+
+
+def test_manifest_groups_are_the_default_of_manifest_flights_only():
+    aircraft = Aircraft(6, 4)
+    records = [{"seat": f"{row}{letter}", "group": 6 - row} for row in range(1, 7) for letter in "ABCD"]
+    records[-1]["reduced_mobility"] = True
+    flight = Flight(aircraft, seed=0, manifest=records)
+    queues = flight._boarding_queues()
+
+    for queue in queues.values():
+        assert queue[0].reduced_mobility or not any(passenger.reduced_mobility for passenger in queue)
+        groups = [passenger.group for passenger in queue if not passenger.reduced_mobility]
+        assert groups == sorted(groups)
+    assert "manifest" not in STRATEGIES
+    with pytest.raises(ValueError):
+        get_strategy("manifest")
+
+
+@pytest.mark.parametrize("output_format", ["csv", "npz"])
+def test_replay_writes_every_passenger(tmp_path, output_format):
+    aircraft = Aircraft(6, 4)
+    flights = [Flight(aircraft, seed=seed) for seed in range(3)]
+    schedule = tmp_path / "schedule.csv"
+    write_manifests(schedule, [(f"F{index}", "6x4", flight.manifest()) for index, flight in enumerate(flights)])
+
+    assert replay(schedule, tmp_path / "results", output_format, batch_size=7) == 3
+    passengers = sum(len(flight.manifest()) for flight in flights)
+    if output_format == "csv":
+        with open(tmp_path / "results_passengers.csv", newline="") as file:
+            assert len(list(csv.DictReader(file))) == passengers
+        with open(tmp_path / "results_runs.csv", newline="") as file:
+            assert [row["flight"] for row in csv.DictReader(file)] == ["F0", "F1", "F2"]
+    else:
+        with np.load(tmp_path / "results.npz") as arrays:
+            assert len(arrays["passengers_seat_time"]) == passengers
+            assert list(arrays["runs_flight"]) == ["F0", "F1", "F2"]
+
+
+def test_unknown_result_format():
+    with pytest.raises(ValueError):
+        ResultWriter("results", "parquet")
@@ -0,0 +1,35 @@
+import pytest
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+from utils.recorder import TrajectoryReader, TrajectoryRecorder, _cabin_frame
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 32])
+def test_reader_returns_the_recorded_frames(tmp_path, chunk_size):
+    path = tmp_path / "run.trj"
+    flight = Flight(Aircraft(6, 6), seed=2)
+    expected = []
+    with TrajectoryRecorder(path, chunk_size) as recorder:
+        recorder.attach(flight)
+        expected.append(_cabin_frame(flight))
+        flight.add_observer(lambda event, *_: event == "tick" and expected.append(_cabin_frame(flight)))
+        result = flight.run_headless()
+
+    with TrajectoryReader(path) as reader:
+        assert len(reader) == result.ticks + 1 == len(expected)
+        assert (reader.rows, reader.columns, reader.chunk_size) == (6, 7, chunk_size)
+        for tick in reversed(range(len(reader))):  # Random access, not only sequential
+            assert reader.frame(tick) == expected[tick]
+        for tick, (states, passengers) in enumerate(reader):
+            assert (states, passengers) == expected[tick]
+        with pytest.raises(IndexError):
+            reader.frame(len(reader))
+
+
+def test_incomplete_file_is_rejected(tmp_path):
+    path = tmp_path / "broken.trj"
+    path.write_bytes(b"not a trajectory file")
+
+    with pytest.raises(ValueError):
+        TrajectoryReader(path)
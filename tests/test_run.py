@@ -0,0 +1,39 @@
+import pytest
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+from utils.run import MonteCarloSummary, monte_carlo, simulate_replications
+
+
+def test_replications_do_not_depend_on_the_number_of_workers():
+    aircraft = Aircraft(6, 4)
+    serial = list(simulate_replications(aircraft, 6, workers=1, seed=10))
+    parallel = list(simulate_replications(aircraft, 6, workers=2, seed=10))
+
+    assert serial == parallel
+    assert [seed for seed, _ in serial] == list(range(10, 16))
+    assert serial[0][1] == Flight(aircraft, seed=10).run_headless().ticks
+
+
+def test_monte_carlo_reports_every_batch_and_the_total():
+    summaries = list(monte_carlo(Aircraft(5, 4), 5, seed=0, report_every=2))
+
+    assert [summary.count for summary in summaries] == [2, 4, 5]
+
+
+def test_summary_statistics():
+    summary = MonteCarloSummary([10, 20, 30])
+
+    assert summary.count == 3
+    assert summary.mean == pytest.approx(20)
+    assert summary.stdev == pytest.approx(10)
+    low, high = summary.confidence_interval
+    assert low < 20 < high
+
+
+def test_summary_of_a_single_run():
+    summary = MonteCarloSummary([42])
+
+    assert summary.stdev == 0
+    assert summary.percentiles == {5: 42, 50: 42, 95: 42}
+    assert summary.confidence_interval == (42, 42)
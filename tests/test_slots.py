@@ -0,0 +1,51 @@
+import gc
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+from models.passenger import Passenger
+
+
+def test_passengers_and_seats_have_no_instance_dict():
+    flight = Flight(Aircraft(3, 4), seed=0)
+
+    assert not hasattr(flight.passengers[0], "__dict__")
+    assert not hasattr(flight.seats[0], "__dict__")
+
+
+def test_registry_is_opt_in_and_weak():
+    Passenger.track_instances(False)
+    flight = Flight(Aircraft(3, 4), seed=0)
+    assert not any(p in Passenger.passengers for p in flight.passengers)
+
+    Passenger.track_instances(True)
+    try:
+        before = len(Passenger.passengers)
+        flight = Flight(Aircraft(3, 4), seed=0)
+        assert len(Passenger.passengers) == before + len(flight.passengers)
+        del flight
+        gc.collect()
+        assert len(Passenger.passengers) == before
+    finally:
+        Passenger.track_instances(False)
+
+
+def test_registry_lookup_is_scoped_to_a_flight():
+    Passenger.track_instances(True)
+    try:
+        first, second = Flight(Aircraft(3, 4), seed=0), Flight(Aircraft(3, 4), seed=1)
+
+        assert Passenger.get_passenger_by_id(first, 0) is first.passengers[0]
+        assert Passenger.get_passenger_by_id(second, 0) is second.passengers[0]
+
+        Passenger.remove_passenger(first, 0)
+        assert Passenger.get_passenger_by_id(first, 0) is None
+        assert Passenger.get_passenger_by_id(second, 0) is second.passengers[0]
+    finally:
+        Passenger.track_instances(False)
+
+
+def test_seat_name_and_coordinates_are_computed():
+    seat = Aircraft(3, 4).seats[0]
+
+    assert seat.name == f"{seat.letter}{seat.number}"
+    assert seat.coordinates == (seat.letter, seat.number)
@@ -0,0 +1,104 @@
+import pytest
+
+from models.aircraft import Aircraft
+from models.cabin_config import load_aircraft
+from models.flight import Flight
+
+ENGINES = ["objects", "vectorized", "events"]
+
+
+def _state(flight):
+    """The full observable state of a flight, plus the next draw of its random generator."""
+    layout = flight.layout
+    cells = [
+        (state, getattr(passenger, "identifier", None))
+        for state, passenger in (
+            flight.cell_state(row, column) for row in range(len(layout) - 1) for column in range(len(layout[-1]))
+        )
+    ]
+    return flight.tick, dict(flight._seated_ticks), dict(flight._aisle_congestion), cells, flight._random.random()
+
+
+@pytest.mark.parametrize("aircraft, strategy", [
+    (Aircraft(20, 6), None),
+    (Aircraft(30, 10), "steffen"),
+    (load_aircraft("configs/a321_two_class.toml", None), "back-to-front"),
+])
+@pytest.mark.parametrize("stop", [0, 1, 25, 80])
+def test_restored_flight_continues_bit_identically(aircraft, strategy, stop):
+    reference = Flight(aircraft, seed=5)
+    reference.run_headless(strategy=strategy)
+
+    flight = Flight(aircraft, seed=5)
+    ticks = flight.boarding_ticks(strategy)
+    for _ in range(stop):
+        next(ticks, None)
+    data = flight.snapshot()
+    restored = Flight.restore(aircraft, data)
+    forked = flight.fork()
+
+    assert restored.snapshot() == data
+    restored.run_headless(strategy=strategy)
+    forked.run_headless(strategy=strategy)
+    assert _state(restored) == _state(forked) == _state(reference)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_every_engine_boards_a_restored_flight(engine):
+    aircraft = Aircraft(12, 6)
+    reference = Flight(aircraft, seed=8).run_headless(engine)
+    restored = Flight.restore(aircraft, Flight(aircraft, seed=8).snapshot())
+
+    result = restored.run_headless(engine)
+    assert result.ticks == reference.ticks
+    assert result.seat_times == reference.seat_times
+
+
+@pytest.mark.parametrize("engine", ["vectorized", "events"])
+def test_started_boardings_are_only_resumed_by_the_objects_engine(engine):
+    aircraft = Aircraft(12, 6)
+    flight = Flight(aircraft, seed=8)
+    ticks = flight.boarding_ticks()
+    for _ in range(10):
+        next(ticks)
+    expected = Flight(aircraft, seed=8).run_headless()
+
+    for started in (flight, flight.fork(), Flight.restore(aircraft, flight.snapshot())):
+        with pytest.raises(ValueError):
+            started.run_headless(engine)
+        assert started.run_headless().seat_times == expected.seat_times
+
+
+@pytest.mark.parametrize("engine", ["vectorized", "events"])
+def test_finished_boardings_are_not_run_twice(engine):
+    flight = Flight(Aircraft(12, 6), seed=3)
+    result = flight.run_headless(engine)
+    blockers = [bytes(counts) for counts in flight._blockers]
+
+    with pytest.raises(ValueError):
+        flight.run_headless(engine)
+    assert [bytes(counts) for counts in flight._blockers] == blockers
+    assert max(max(counts) for counts in blockers) == 1
+
+    restored = Flight.restore(flight.aircraft, flight.snapshot())
+    assert restored.tick == flight.tick and type(restored.tick) is type(flight.tick)
+    assert restored.run_headless().seat_times == result.seat_times
+
+
+def test_manifest_flights_keep_their_default_strategy():
+    aircraft = Aircraft(6, 4)
+    records = [{"seat": f"{row}A", "group": 6 - row} for row in range(1, 7)]
+    flight = Flight(aircraft, seed=0, manifest=records)
+    restored = Flight.restore(aircraft, flight.snapshot())
+
+    assert restored.run_headless().seat_times == flight.run_headless().seat_times
+
+
+def test_invalid_snapshots_are_rejected():
+    data = Flight(Aircraft(6, 4), seed=0).snapshot()
+
+    for invalid in (b"", b"NOPE" + data[4:]):
+        with pytest.raises(ValueError):
+            Flight.restore(Aircraft(6, 4), invalid)
+    with pytest.raises(ValueError):
+        Flight.restore(Aircraft(8, 4), data)
@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+from models.strategies import BackToFront, ByZoneGroups, STRATEGIES, WindowMiddleAisle, get_strategy
+from utils.run import compare_strategies
+
+
+def _queue(strategy, seed=0):
+    flight = Flight(Aircraft(10, 6), seed=seed)
+    (queue,) = strategy.queues(flight, random.Random(seed)).values()
+    return flight, queue
+
+
+def test_queues_hold_every_seated_passenger_once():
+    flight, queue = _queue(get_strategy("random"))
+
+    assert sorted(p.identifier for p in queue) == sorted(p.identifier for p in flight.passengers if p.seat)
+
+
+def test_back_to_front_boards_rows_in_decreasing_order():
+    _, queue = _queue(BackToFront())
+    rows = [passenger.seat.number for passenger in queue]
+
+    assert rows == sorted(rows, reverse=True)
+
+
+def test_wilma_boards_window_seats_first():
+    flight, queue = _queue(WindowMiddleAisle())
+    distances = [abs(flight.aircraft.column_of(p.seat.letter) - flight.aircraft.aisle_of(p.seat)) for p in queue]
+
+    assert distances == sorted(distances, reverse=True)
+
+
+def test_zones_follow_the_zone_order():
+    _, queue = _queue(ByZoneGroups(groups=2, zone_order=(1, 0)))
+    rows = [passenger.seat.number for passenger in queue]
+    front = [row <= 5 for row in rows]
+
+    assert front == sorted(front, reverse=True)  # Front zone (1) first
+
+
+def test_get_strategy():
+    assert isinstance(get_strategy(None), STRATEGIES["random"])
+    assert isinstance(get_strategy("steffen"), STRATEGIES["steffen"])
+    with pytest.raises(ValueError):
+        get_strategy("alphabetical")
+
+
+def test_compare_strategies_boards_every_strategy():
+    summaries = compare_strategies(Aircraft(6, 4), ["random", "back-to-front"], replications=3)
+
+    assert set(summaries) == {"random", "back-to-front"}
+    assert all(summary.count == 3 for summary in summaries.values())
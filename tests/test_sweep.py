@@ -0,0 +1,46 @@
+from models.aircraft import Aircraft
+from utils.optimizer import optimize_groups, seat_classes
+from utils.run import init_worker, simulate_seed
+from utils.sweep import DEFAULTS, grid, random_sample, run_sweep
+
+
+def test_grid_covers_every_combination():
+    points = grid(rows=[10, 20], strategy=["random", "wilma"])
+
+    assert len(points) == 4
+    assert {(point["rows"], point["strategy"]) for point in points} == {
+        (10, "random"), (10, "wilma"), (20, "random"), (20, "wilma")
+    }
+    assert all(point["columns"] == DEFAULTS["columns"] for point in points)
+
+
+def test_random_sample_keeps_valid_load_ranges():
+    points = random_sample(200, seed=1, min_load=(0.5, 1.0), max_load=(0.5, 1.0), rows=(5, 10))
+
+    assert all(point["min_load"] <= point["max_load"] for point in points)
+    assert all(isinstance(point["rows"], int) and 5 <= point["rows"] <= 10 for point in points)
+    assert random_sample(5, seed=1, rows=(5, 10)) == random_sample(5, seed=1, rows=(5, 10))
+
+
+def test_sweep_results_are_cached(tmp_path):
+    points = grid(rows=[6], columns=[4])
+    first = run_sweep(points, replications=3, cache_dir=tmp_path)
+    files = list(tmp_path.iterdir())
+    second = run_sweep(points, replications=3, cache_dir=tmp_path)
+
+    assert len(files) == 1
+    assert first == second
+    assert first[0]["count"] == 3
+
+
+def test_optimizer_never_gets_worse():
+    aircraft = Aircraft(6, 4)
+    result = optimize_groups(aircraft, groups=2, iterations=3, neighbours=2, replications=3)
+
+    assert result.history == sorted(result.history, reverse=True)
+    assert result.mean == result.history[-1]
+    assert set(result.assignment) == set(seat_classes(aircraft))
+
+    init_worker(aircraft)
+    mean = sum(simulate_seed(seed, "objects", result.strategy) for seed in range(3)) / 3
+    assert mean == result.mean
@@ -0,0 +1,114 @@
+import sys
+import time
+
+from models.flight import AISLE, BLOCKED, CROSSING, EMPTY_SEAT, MOVING, SEATED, WALKING
+
+# Emoji aliases of each cell state
+GLYPH_ALIASES = {
+    EMPTY_SEAT: ":seat:",
+    AISLE: ":cross_mark:",
+    WALKING: ":men’s_room:",
+    MOVING: ":men’s_room:",
+    SEATED: ":bust_in_silhouette:",
+    CROSSING: ":busts_in_silhouette:",
+    BLOCKED: ":black_large_square:",
+}
+
+CELL_WIDTH = 3  # Each cell is a double-width emoji followed by a space
+
+
+class TerminalRenderer:
+    """
+    Draws the layout of a flight in the terminal, redrawing only the cells that changed.
+
+    The first frame clears the screen and draws every cell. The next frames move the cursor
+    (ANSI escape codes) to each changed cell only. Emoji glyphs are built once. The frame
+    rate can be capped independently of the simulation tick rate: frames requested too early
+    are skipped, and the next drawn frame catches up with every change.
+
+    Methods:
+    - render(flight, force): Draws the current state of a flight
+    - finish(): Moves the cursor below the drawing
+    """
+
+    _glyphs = None  # Emoji of each cell state, built on first use
+
+    def __init__(self, max_fps=None, stream=None):
+        """
+        Initializes a TerminalRenderer.
+
+        Args:
+            max_fps (float, optional): The maximum number of frames drawn per second. Unlimited by default.
+            stream (file, optional): The output stream. Defaults to the standard output.
+        """
+        self._min_interval = 1 / max_fps if max_fps else 0
+        self._stream = stream or sys.stdout
+        self._previous = None  # States of the last drawn frame
+        self._last_draw = float("-inf")
+        self._rows = 0
+
+    @classmethod
+    def glyphs(cls):
+        """
+        Returns the glyph of each cell state, building them once.
+
+        Returns:
+            dict: A mapping of cell states to emoji.
+        """
+        if cls._glyphs is None:
+            from emoji import emojize  # Only needed when something is displayed
+
+            cls._glyphs = {state: emojize(alias) for state, alias in GLYPH_ALIASES.items()}
+        return cls._glyphs
+
+    def render(self, flight, force=False):
+        """
+        Draws the current state of a flight, unless the previous frame was drawn too recently.
+
+        Args:
+            flight (Flight): The flight to draw.
+            force (bool): Draw even if the frame rate cap is reached.
+
+        Returns:
+            bool: Whether the frame was drawn.
+        """
+        now = time.perf_counter()
+        if not force and now - self._last_draw < self._min_interval:
+            return False
+        self._last_draw = now
+
+        glyphs = self.glyphs()
+        layout = flight.layout
+        rows, columns = len(layout) - 1, len(layout[-1])
+        states = [[flight.cell_state(row, column)[0] for column in range(columns)] for row in range(rows)]
+        indentation = max(0, 20 - flight.aircraft.columns - 2)
+
+        if self._previous is None or len(self._previous) != rows:
+            # Full drawing of the first frame
+            lines = [
+                " " * indentation + " ".join(["|"] + [glyphs[state] for state in row] + ["|"])
+                for row in states
+            ]
+            output = "\x1b[2J\x1b[H" + "\n".join(lines)
+        else:
+            # Only the changed cells (1-based screen coordinates)
+            parts = []
+            for row, (new_row, old_row) in enumerate(zip(states, self._previous)):
+                for column, state in enumerate(new_row):
+                    if state != old_row[column]:
+                        screen_column = indentation + 3 + column * CELL_WIDTH
+                        parts.append(f"\x1b[{row + 1};{screen_column}H{glyphs[state]}")
+            output = "".join(parts)
+
+        self._previous = states
+        self._rows = rows
+        self._stream.write(output)
+        self._stream.flush()
+        return True
+
+    def finish(self):
+        """
+        Moves the cursor below the drawing, so that the next output does not overwrite it.
+        """
+        self._stream.write(f"\x1b[{self._rows + 1};1H")
+        self._stream.flush()
@@ -0,0 +1,233 @@
+import argparse
+import time
+
+import numpy as np
+
+from models.flight import Flight
+from models.strategies import STRATEGIES, get_strategy
+from utils.manifest import resolve_aircraft
+from utils.run import MonteCarloSummary
+
+
+def _aisle_tables(aircraft, strategy):
+    """
+    Describes the seats of each aisle for the estimator: their row index, their number of
+    columns to the aisle, and their boarding priority under the strategy, as dense ranks.
+
+    Returns:
+        list: One (seat indices, rows, distances, priority ranks) tuple of arrays per aisle,
+        the seat indices pointing into `aircraft.seats`.
+    """
+    seat_index = {seat: index for index, seat in enumerate(aircraft.seats)}
+    distance_to_aisle = aircraft.cabin.distance_to_aisle
+    tables = []
+    for aisle, seats in aircraft.get_closest_seats_for_each_aisle().items():
+        columns = [aircraft.column_of(seat.letter) for seat in seats]
+        max_distance = max((distance_to_aisle[column] for column in columns), default=0)
+        priorities = [
+            strategy.priority(seat.number, distance_to_aisle[column], int(column > aisle), aircraft.rows, max_distance)
+            for seat, column in zip(seats, columns)
+        ]
+        rank = {priority: index for index, priority in enumerate(sorted(set(priorities)))}
+        tables.append((
+            np.array([seat_index[seat] for seat in seats], dtype=np.int64),
+            np.array([seat.number - 1 for seat in seats], dtype=np.int64),
+            np.array([distance_to_aisle[column] for column in columns], dtype=np.int64),
+            np.array([rank[priority] for priority in priorities], dtype=np.int64),
+        ))
+    return tables
+
+
+def estimate_ticks(aircraft, strategy=None, samples: int = 2000, seed: int = 0, load_factor=(0.95, 1.03),
+                   baggage_probability=0.7, stow_ticks=1):
+    """
+    Estimates the boarding ticks of many random flights at once, without simulating them.
+
+    Each aisle is boarded by its own queue (`Aircraft.get_closest_seats_for_each_aisle`).
+    A passenger holds the aisle at their row while stowing, and every passenger behind them
+    waits until they leave it. The boarding time of an aisle is therefore driven by its longest
+    blocking chain, as in the longest increasing subsequence bound: passengers held behind
+    each other, each one adding their aisle time. The chains are followed cell by cell with the
+    tick semantics of `Flight.boarding`, so the estimate also accounts for the walk between
+    blocking rows and for the door being blocked. Only seat shuffles are simplified.
+
+    For each sample, seats are sold and baggage drawn as by `Flight`, and passengers are ordered
+    by the `priority` of the strategy, ties being broken at random. All samples are computed
+    together with NumPy, one queue position at a time. Boarding through the front door only.
+
+    Args:
+        aircraft (Aircraft): The aircraft to board.
+        strategy (BoardingStrategy | str, optional): The boarding strategy or its name. Strategies
+            that override `queues` are estimated from their `priority` only.
+        samples (int): The number of random flights.
+        seed (int): The seed of the NumPy random generator.
+        load_factor (tuple): The range of the number of tickets sold, as fractions of the capacity.
+        baggage_probability (float): The probability that a passenger has baggage.
+        stow_ticks (int): The number of ticks a passenger needs to stow their baggage.
+
+    Returns:
+        numpy.ndarray: The estimated boarding ticks of each sample.
+    """
+    strategy = get_strategy(strategy)
+    rng = np.random.default_rng(seed)
+    capacity = aircraft.capacity
+    rows = aircraft.rows
+
+    # Sold seats: the seats with the lowest random keys, as many as the tickets sold
+    sold_count = np.minimum(
+        rng.integers(int(load_factor[0] * capacity), int(capacity * load_factor[1]), size=samples, endpoint=True),
+        capacity,
+    )
+    seat_rank = np.argsort(np.argsort(rng.random((samples, capacity)), axis=1), axis=1)
+    sold = seat_rank < sold_count[:, None]
+    baggage = rng.random((samples, capacity)) <= baggage_probability
+
+    ticks = np.zeros(samples)
+    for seat_indices, seat_rows, distances, priorities in _aisle_tables(aircraft, strategy):
+        if not len(seat_indices):
+            continue
+        # Boarding order: by priority, then at random within a priority
+        order = np.lexsort((rng.random((samples, len(seat_indices))), np.broadcast_to(priorities, (samples, len(priorities)))))
+        queue_seats = seat_indices[order]
+        queue_rows = seat_rows[order]
+        queue_sold = np.take_along_axis(sold, queue_seats, axis=1)
+        # Ticks holding the aisle at the seat row: stowing, then one tick to step out of the aisle
+        aisle_time = np.take_along_axis(baggage, queue_seats, axis=1) * stow_ticks + 1
+        seat_time = distances[order]  # One tick per cell to the seat, the last one to sit down
+
+        # Tick at which each aisle cell is freed by the passengers ahead in the queue
+        freed = np.zeros((samples, rows))
+        freed[:, 0] = 1  # The first passenger enters on the first tick
+        finish = np.zeros(samples)
+        row_indices = np.arange(rows)
+        for position in range(len(seat_indices)):
+            row = queue_rows[:, position]
+            # Passengers walk one cell per tick and never overtake: the tick at which a passenger
+            # enters each cell is the longest chain of waits for the passengers ahead
+            enter = np.maximum.accumulate(freed - row_indices, axis=1) + row_indices
+            leave = enter[np.arange(samples), row] + aisle_time[:, position]
+            active = queue_sold[:, position]
+            finish = np.where(active, np.maximum(finish, leave + seat_time[:, position] - 1), finish)
+            # Up to their row, the passenger frees each cell when entering the next one
+            left = np.concatenate((enter[:, 1:], np.zeros((samples, 1))), axis=1)
+            left[np.arange(samples), row] = leave
+            update = active[:, None] & (row_indices <= row[:, None])
+            freed = np.where(update, left, freed)
+        ticks = np.maximum(ticks, finish)
+    return ticks
+
+
+def screen(candidates, samples: int = 2000, seed: int = 0, keep: int = 3):
+    """
+    Ranks (aircraft, strategy) configurations by their estimated mean boarding ticks, to
+    shortlist the ones worth simulating in detail.
+
+    Args:
+        candidates (iterable): (label, aircraft, strategy) tuples.
+        samples (int): The number of random flights estimated per configuration.
+        seed (int): The seed of the estimates, the same for every configuration.
+        keep (int): The number of configurations to shortlist.
+
+    Returns:
+        list: The `keep` best (label, aircraft, strategy, MonteCarloSummary) tuples, best first.
+    """
+    ranked = [
+        (label, aircraft, strategy, MonteCarloSummary(estimate_ticks(aircraft, strategy, samples, seed).tolist()))
+        for label, aircraft, strategy in candidates
+    ]
+    ranked.sort(key=lambda candidate: candidate[3].mean)
+    return ranked[:keep]
+
+
+def validation_report(aircraft_list, strategies=None, replications: int = 50, samples: int = 2000, seed: int = 0):
+    """
+    Compares the estimated boarding ticks with those of the "objects" engine for each
+    aircraft and strategy, boarding through the front door as the estimator does.
+
+    Args:
+        aircraft_list (iterable): The aircraft to compare on.
+        strategies (iterable, optional): The names of the strategies. Defaults to the built-in ones.
+        replications (int): The number of simulated flights per configuration.
+        samples (int): The number of estimated flights per configuration.
+        seed (int): The seed of the first simulated flight and of the estimates.
+
+    Returns:
+        list: One dict per configuration, with the aircraft, the strategy, the simulated and
+        estimated mean ticks, their ratio, and the time spent per flight by each method.
+    """
+    report = []
+    for aircraft in aircraft_list:
+        for strategy in strategies or STRATEGIES:
+            start = time.perf_counter()
+            simulated = [Flight(aircraft, seed=seed + i).run_headless(strategy=strategy, doors=[1]).ticks for i in range(replications)]
+            simulation_time = (time.perf_counter() - start) / replications
+            start = time.perf_counter()
+            estimated = estimate_ticks(aircraft, strategy, samples, seed)
+            estimate_time = (time.perf_counter() - start) / samples
+            simulated_mean = float(np.mean(simulated))
+            report.append({
+                "aircraft": aircraft.cabin.name,
+                "strategy": strategy,
+                "simulated": simulated_mean,
+                "estimated": float(estimated.mean()),
+                "ratio": float(estimated.mean()) / simulated_mean,
+                "simulation_ms": 1000 * simulation_time,
+                "estimate_ms": 1000 * estimate_time,
+            })
+    return report
+
+
+def rank_agreement(report):
+    """
+    Measures how well the estimates order the configurations of a validation report.
+
+    Returns:
+        tuple: The Pearson correlation of the simulated and estimated means, and the Spearman
+        correlation of their ranks.
+    """
+    simulated = np.array([line["simulated"] for line in report])
+    estimated = np.array([line["estimated"] for line in report])
+    if len(report) < 2:
+        return 1.0, 1.0
+    pearson = float(np.corrcoef(simulated, estimated)[0, 1])
+    spearman = float(np.corrcoef(np.argsort(np.argsort(simulated)), np.argsort(np.argsort(estimated)))[0, 1])
+    return pearson, spearman
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimates boarding ticks without simulation, and validates the estimates.")
+    parser.add_argument("--aircraft", nargs="+", default=["30x6"], help="aircraft as ROWSxCOLUMNS or cabin configuration files")
+    parser.add_argument("--strategies", nargs="+", choices=list(STRATEGIES), help="boarding strategies (default: all)")
+    parser.add_argument("--samples", type=int, default=2000, help="random flights estimated per configuration")
+    parser.add_argument("--runs", type=int, default=50, help="simulated flights per configuration for --validate")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the estimates and of the first simulated flight")
+    parser.add_argument("--keep", type=int, default=3, help="configurations to shortlist")
+    parser.add_argument("--validate", action="store_true", help="compare the estimates with the simulator")
+    args = parser.parse_args()
+
+    aircraft_list = [resolve_aircraft(spec) for spec in args.aircraft]
+    strategies = args.strategies or list(STRATEGIES)
+    if args.validate:
+        report = validation_report(aircraft_list, strategies, args.runs, args.samples, args.seed)
+        print(f"{'aircraft':>16} {'strategy':>16} | {'simulated':>9} {'estimated':>9} {'ratio':>6} | {'ms/sim':>7} {'ms/est':>7}")
+        for line in report:
+            print(
+                f"{line['aircraft']:>16} {line['strategy']:>16} | {line['simulated']:9.1f} {line['estimated']:9.1f} "
+                f"{line['ratio']:6.2f} | {line['simulation_ms']:7.2f} {line['estimate_ms']:7.4f}"
+            )
+        pearson, spearman = rank_agreement(report)
+        print(f"Correlation of the means: {pearson:.3f}, of their ranks: {spearman:.3f}")
+        return
+
+    candidates = [
+        (f"{aircraft.cabin.name} {strategy}", aircraft, strategy)
+        for aircraft in aircraft_list
+        for strategy in strategies
+    ]
+    for label, _, _, summary in screen(candidates, args.samples, args.seed, args.keep):
+        low, high = summary.confidence_interval
+        print(f"{label:>28} | estimated mean {summary.mean:8.2f} ticks | 95% CI [{low:.2f}, {high:.2f}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import csv
+import time
+from collections import Counter
+
+# Passenger events reported by `Flight.add_observer`, apart from the end-of-tick event
+EVENTS = ("enter", "step", "block", "stow", "shuffle", "interference", "sit")
+
+
+class TickCollector:
+    """
+    Collects the passenger events and the handler timings of a flight, tick by tick.
+
+    It is both an observer (see `Flight.add_observer`) and a profiler (see `Flight.profiler`),
+    and helps finding simulation bottlenecks (congested rows, seat interference) as well as
+    code bottlenecks (slow handlers).
+
+    Methods:
+    - attach(flight): Registers the collector as observer and profiler of a flight
+    - detach(flight): Unregisters the collector from a flight
+    - time_series(): One record per tick with the event counts and timings
+    - to_csv(path): Writes the time series to a CSV file
+    - congested_rows(top): The rows where passengers were blocked most often
+    - handler_profile(): The number of calls and total time of each timed handler
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty TickCollector.
+        """
+        self._series = []  # One record per completed tick
+        self._events = Counter()  # Event counts of the current tick
+        self._timings = Counter()  # Seconds spent in each timed section during the current tick
+        self._blocked_rows = Counter()  # Blocked passenger counts per row, over the whole run
+        self._interference_rows = Counter()  # Seat interference counts per row, over the whole run
+        self._calls = Counter()  # Number of calls of each timed handler
+        self._seconds = Counter()  # Total seconds spent in each timed handler
+
+    def attach(self, flight):
+        """
+        Registers the collector as observer and profiler of a flight.
+
+        Args:
+            flight (Flight): The flight to instrument.
+        """
+        flight.add_observer(self)
+        flight.profiler = self
+
+    def detach(self, flight):
+        """
+        Unregisters the collector from a flight.
+
+        Args:
+            flight (Flight): The instrumented flight.
+        """
+        flight.remove_observer(self)
+        if flight.profiler is self:
+            flight.profiler = None
+
+    def __call__(self, event, passenger, row, column, tick):
+        """
+        Records a passenger event (observer callback).
+        """
+        if event == "tick":
+            record = {"tick": tick}
+            record.update({name: self._events[name] for name in EVENTS})
+            record.update({f"{name}_seconds": seconds for name, seconds in self._timings.items()})
+            self._series.append(record)
+            self._events = Counter()
+            self._timings = Counter()
+            return
+        self._events[event] += 1
+        if event == "block":
+            self._blocked_rows[row] += 1
+        elif event == "interference":
+            self._interference_rows[row] += 1
+
+    def record(self, name, seconds):
+        """
+        Records the duration of a timed section (profiler callback).
+
+        Args:
+            name (str): The name of the section.
+            seconds (float): Its duration.
+        """
+        self._timings[name] += seconds
+        self._calls[name] += 1
+        self._seconds[name] += seconds
+
+    def timed(self, function_name, function):
+        """
+        Wraps a handler so that each call is timed (profiler callback).
+
+        Args:
+            function_name (str): The name under which the handler is recorded.
+            function (callable): The handler.
+
+        Returns:
+            callable: The timed handler.
+        """
+        def timed_function(*args):
+            start = time.perf_counter()
+            result = function(*args)
+            self.record(function_name, time.perf_counter() - start)
+            return result
+
+        return timed_function
+
+    def time_series(self):
+        """
+        Returns one record per tick with the count of each event and the seconds spent in
+        each timed section during that tick.
+
+        Returns:
+            list: The records (dicts), in tick order.
+        """
+        return list(self._series)
+
+    def to_csv(self, path):
+        """
+        Writes the time series to a CSV file.
+
+        Args:
+            path (str): The path of the CSV file.
+        """
+        fields = ["tick", *EVENTS]
+        for record in self._series:
+            fields.extend(key for key in record if key not in fields)
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=fields, restval=0)
+            writer.writeheader()
+            writer.writerows(self._series)
+
+    def congested_rows(self, top=5):
+        """
+        Returns the rows where passengers were blocked in the aisle most often.
+
+        Args:
+            top (int): The number of rows to return.
+
+        Returns:
+            list: (row index, blocked passenger ticks, seat interferences), most blocked first.
+        """
+        return [(row, count, self._interference_rows[row]) for row, count in self._blocked_rows.most_common(top)]
+
+    def handler_profile(self):
+        """
+        Returns the number of calls and the total time of each timed section.
+
+        Returns:
+            dict: A mapping of section names to {"calls": int, "seconds": float}, slowest first.
+        """
+        return {
+            name: {"calls": self._calls[name], "seconds": seconds}
+            for name, seconds in self._seconds.most_common()
+        }
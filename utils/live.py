@@ -0,0 +1,277 @@
+import argparse
+import asyncio
+import json
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+
+
+def tick_snapshot(name, flight):
+    """
+    Builds a JSON-serializable snapshot of a flight's boarding.
+
+    Args:
+        name (str): The name of the flight.
+        flight (Flight): The flight.
+
+    Returns:
+        dict: The name, tick, number of passengers still to seat, completion flag, and the
+        state of every cell (see `Flight.cell_state`), row by row.
+    """
+    layout = flight.layout
+    rows, columns = len(layout) - 1, len(layout[-1])
+    return {
+        "flight": name,
+        "tick": flight.tick,
+        "unseated": flight.unseated_count,
+        "complete": flight.unseated_count == 0,
+        "cells": [[flight.cell_state(row, column)[0] for column in range(columns)] for row in range(rows)],
+    }
+
+
+class LiveFlight:
+    """
+    A flight boarding on the shared clock of a `LiveBoardingService`.
+
+    It is an async iterable: `async for snapshot in live_flight` yields a snapshot after each
+    tick, until the boarding completes. Slow subscribers skip to the latest snapshot.
+
+    Attributes (Properties):
+    - name (str): The name of the flight
+    - flight (Flight): The boarding flight
+    - snapshot (dict): The latest tick snapshot
+    - is_complete (bool): Whether every passenger is seated
+    """
+
+    def __init__(self, name, flight, strategy=None):
+        """
+        Initializes a LiveFlight.
+
+        Args:
+            name (str): The name of the flight.
+            flight (Flight): The flight to board.
+            strategy (BoardingStrategy | str, optional): The boarding strategy or its name.
+        """
+        self._name = name
+        self._flight = flight
+        self._ticks = flight.boarding_ticks(strategy)
+        self._snapshot = tick_snapshot(name, flight)
+        self._subscribers = []  # One queue per subscriber, holding at most the latest snapshot
+
+    # Getter for the name of the flight
+    @property
+    def name(self):
+        return self._name
+
+    # Getter for the boarding flight
+    @property
+    def flight(self):
+        return self._flight
+
+    # Getter for the latest snapshot
+    @property
+    def snapshot(self):
+        return self._snapshot
+
+    # Getter telling whether the boarding is complete
+    @property
+    def is_complete(self):
+        return self._snapshot["complete"]
+
+    def step(self):
+        """
+        Simulates one tick and publishes its snapshot to the subscribers.
+
+        Returns:
+            bool: False once the boarding is complete.
+        """
+        if next(self._ticks, None) is not None:
+            self._snapshot = tick_snapshot(self._name, self._flight)
+        else:
+            self._snapshot = dict(self._snapshot, complete=True)
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()  # Drop the snapshot the subscriber did not read in time
+            queue.put_nowait(self._snapshot)
+        return not self.is_complete
+
+    async def __aiter__(self):
+        queue = asyncio.Queue(maxsize=1)
+        self._subscribers.append(queue)
+        try:
+            snapshot = self._snapshot
+            yield snapshot
+            while not snapshot["complete"]:
+                snapshot = await queue.get()
+                yield snapshot
+        finally:
+            self._subscribers.remove(queue)
+
+
+class LiveBoardingService:
+    """
+    Steps many flights on one asyncio event loop, all on a shared clock, and serves their
+    live state over HTTP (standard library only).
+
+    Endpoints:
+    - GET /flights: the name, tick and completion of every flight
+    - GET /flights/<name>: the latest snapshot of a flight
+    - GET /flights/<name>/stream: the snapshots of a flight as Server-Sent Events, one per tick
+
+    Methods:
+    - add_flight(name, flight, strategy): Adds a flight to board
+    - run(): Steps every flight on each clock tick until all are boarded
+    - serve(host, port): Starts the HTTP server
+    """
+
+    def __init__(self, tick_interval: float = 0.5):
+        """
+        Initializes a LiveBoardingService.
+
+        Args:
+            tick_interval (float): The number of seconds between two clock ticks.
+        """
+        self._tick_interval = tick_interval
+        self._flights = {}
+
+    # Getter for the live flights, by name
+    @property
+    def flights(self):
+        return self._flights
+
+    def add_flight(self, name, flight, strategy=None):
+        """
+        Adds a flight to board on the shared clock.
+
+        Args:
+            name (str): The name of the flight, used in the endpoints.
+            flight (Flight): The flight to board.
+            strategy (BoardingStrategy | str, optional): The boarding strategy or its name.
+
+        Returns:
+            LiveFlight: The live flight, an async iterable of its tick snapshots.
+        """
+        if name in self._flights:
+            raise ValueError(f"A flight named {name} already exists")
+        live_flight = LiveFlight(name, flight, strategy)
+        self._flights[name] = live_flight
+        return live_flight
+
+    async def run(self):
+        """
+        Steps every flight once per clock tick until all of them are boarded.
+        """
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            boarding = [live_flight.step() for live_flight in self._flights.values() if not live_flight.is_complete]
+            if not any(boarding):
+                return
+            next_tick += self._tick_interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080):
+        """
+        Starts the HTTP server.
+
+        Args:
+            host (str): The address to listen on.
+            port (int): The port to listen on (0 picks a free port).
+
+        Returns:
+            asyncio.Server: The started server.
+        """
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def _handle(self, reader, writer):
+        """
+        Answers one HTTP request.
+        """
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            while (await reader.readline()).strip():  # Skip the headers
+                pass
+            if len(request_line) < 2 or request_line[0] != "GET":
+                await self._respond(writer, 405, {"error": "only GET is supported"})
+                return
+
+            parts = [part for part in request_line[1].split("?")[0].split("/") if part]
+            if parts == ["flights"]:
+                body = [
+                    {"flight": name, "tick": flight.snapshot["tick"], "complete": flight.is_complete}
+                    for name, flight in self._flights.items()
+                ]
+                await self._respond(writer, 200, body)
+            elif len(parts) in (2, 3) and parts[0] == "flights" and parts[1] in self._flights:
+                live_flight = self._flights[parts[1]]
+                if len(parts) == 2:
+                    await self._respond(writer, 200, live_flight.snapshot)
+                elif parts[2] == "stream":
+                    await self._stream(writer, live_flight)
+                else:
+                    await self._respond(writer, 404, {"error": "not found"})
+            else:
+                await self._respond(writer, 404, {"error": "not found"})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, body):
+        """
+        Writes a JSON response.
+        """
+        payload = json.dumps(body).encode()
+        reason = {200: "OK", 404: "Not Found", 405: "Method Not Allowed"}[status]
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload
+        )
+        await writer.drain()
+
+    @staticmethod
+    async def _stream(writer, live_flight):
+        """
+        Streams the snapshots of a flight as Server-Sent Events until its boarding completes.
+        """
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\nConnection: close\r\n\r\n"
+        )
+        async for snapshot in live_flight:
+            writer.write(f"data: {json.dumps(snapshot)}\n\n".encode())
+            await writer.drain()
+
+
+async def _run_gate_bank(flights, rows, columns, tick_interval, host, port, strategy):
+    """
+    Boards a bank of flights on a shared clock while serving their live state.
+    """
+    service = LiveBoardingService(tick_interval)
+    aircraft = Aircraft(rows, columns)
+    for number in range(flights):
+        service.add_flight(f"gate-{number + 1}", Flight(aircraft, seed=number), strategy)
+    server = await service.serve(host, port)
+    address = server.sockets[0].getsockname()
+    print(f"Serving http://{address[0]}:{address[1]}/flights")
+    async with server:
+        await service.run()
+    print("All flights boarded.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Boards several flights at once and serves their live state over HTTP.")
+    parser.add_argument("--flights", type=int, default=6, help="number of flights boarding at once")
+    parser.add_argument("--rows", type=int, default=30, help="number of rows of the aircraft")
+    parser.add_argument("--columns", type=int, default=6, help="number of seats per row")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between two ticks")
+    parser.add_argument("--strategy", default=None, help="boarding strategy")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    args = parser.parse_args()
+    asyncio.run(_run_gate_bank(args.flights, args.rows, args.columns, args.interval, args.host, args.port, args.strategy))
+
+
+if __name__ == "__main__":
+    main()
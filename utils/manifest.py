@@ -0,0 +1,299 @@
+import argparse
+import csv
+import itertools
+import json
+from pathlib import Path
+
+from models.aircraft import Aircraft
+from models.cabin_config import load_aircraft
+from models.flight import Flight
+from models.strategies import STRATEGIES
+
+# Values of the mobility column meaning that the passenger needs no assistance
+NO_ASSISTANCE = {"", "0", "false", "no", "none"}
+
+# Columns of the per-passenger and per-run results
+PASSENGER_COLUMNS = ("flight", "passenger", "seat", "group", "reduced_mobility", "seat_time")
+RUN_COLUMNS = ("flight", "aircraft", "passengers", "ticks", "total_congestion")
+
+# Aircraft resolved from the manifest specifications, shared by the flights of a schedule
+_aircraft_cache = {}
+
+
+def _parse_record(raw: dict):
+    """
+    Normalizes one manifest line: the types of the CSV columns and the flags of the mobility column.
+    """
+    baggage = raw.get("baggage", 0)
+    if isinstance(baggage, str):
+        baggage = {"true": 1, "yes": 1, "false": 0, "no": 0, "": 0}.get(baggage.strip().lower(), baggage)
+    mobility = raw.get("mobility", raw.get("reduced_mobility", ""))
+    if isinstance(mobility, str):
+        mobility = mobility.strip().lower() not in NO_ASSISTANCE  # Any assistance code, e.g. WCHR
+    stow_ticks = raw.get("stow_ticks")
+    return {
+        "flight": str(raw.get("flight", "")),
+        "aircraft": str(raw.get("aircraft", "") or ""),
+        "seat": str(raw["seat"]),
+        "baggage": int(baggage),
+        "stow_ticks": int(stow_ticks) if stow_ticks not in (None, "") else None,
+        "group": int(raw.get("group", 0) or 0),
+        "reduced_mobility": bool(mobility),
+    }
+
+
+def read_records(path):
+    """
+    Streams the passenger records of a manifest file, one line at a time.
+
+    CSV files have a header line; JSONL files hold one JSON object per line. The columns are
+    flight, seat, and optionally aircraft, baggage (number of bags, or true/false), stow_ticks
+    (the ticks needed to stow the baggage, instead of baggage), group and mobility (an
+    assistance code such as WCHR, or empty).
+
+    Args:
+        path (str): The path of the CSV or JSONL file.
+
+    Yields:
+        dict: The normalized records, in file order.
+    """
+    path = Path(path)
+    with open(path, newline="") as file:
+        if path.suffix in (".jsonl", ".ndjson"):
+            for line in file:
+                if line.strip():
+                    yield _parse_record(json.loads(line))
+        else:
+            for raw in csv.DictReader(file):
+                yield _parse_record(raw)
+
+
+def iter_manifests(path):
+    """
+    Streams the manifests of a schedule file, the records of a flight being consecutive.
+    Only one manifest is held in memory at a time.
+
+    Args:
+        path (str): The path of the CSV or JSONL file.
+
+    Yields:
+        tuple: The flight identifier, the aircraft specification of its first record, and its records.
+    """
+    for flight_id, records in itertools.groupby(read_records(path), key=lambda record: record["flight"]):
+        records = list(records)
+        yield flight_id, records[0]["aircraft"], records
+
+
+def resolve_aircraft(spec: str, default=None):
+    """
+    Returns the aircraft of a manifest specification: "ROWSxCOLUMNS" for a standard aircraft,
+    or the path of a cabin configuration file. Aircraft are built once per specification.
+
+    Args:
+        spec (str): The specification, or an empty string.
+        default (Aircraft, optional): The aircraft of the records without a specification.
+
+    Returns:
+        Aircraft: The aircraft.
+
+    Raises:
+        ValueError: If the specification is empty and there is no default aircraft.
+    """
+    if not spec:
+        if default is None:
+            raise ValueError("Manifest record without aircraft, and no default aircraft given")
+        return default
+    if spec not in _aircraft_cache:
+        rows, _, columns = spec.lower().partition("x")
+        if rows.isdigit() and columns.isdigit():
+            _aircraft_cache[spec] = Aircraft(int(rows), int(columns))
+        else:
+            _aircraft_cache[spec] = load_aircraft(spec)
+    return _aircraft_cache[spec]
+
+
+def write_manifests(path, manifests):
+    """
+    Writes manifests to a CSV or JSONL file, readable by `read_records`.
+
+    Args:
+        path (str): The path of the file.
+        manifests (iterable): (flight identifier, aircraft specification, records) tuples,
+            the records being in the format of `Flight.manifest`.
+    """
+    path = Path(path)
+    columns = ("flight", "aircraft", "seat", "baggage", "stow_ticks", "group", "mobility")
+    with open(path, "w", newline="") as file:
+        writer = None if path.suffix in (".jsonl", ".ndjson") else csv.writer(file)
+        if writer:
+            writer.writerow(columns)
+        for flight_id, aircraft, records in manifests:
+            for record in records:
+                stow_ticks = record.get("stow_ticks")
+                row = (flight_id, aircraft, record["seat"], record.get("baggage", 0),
+                       "" if stow_ticks is None else stow_ticks, record["group"],
+                       "WCHR" if record["reduced_mobility"] else "")
+                if writer:
+                    writer.writerow(row)
+                else:
+                    file.write(json.dumps(dict(zip(columns, row))) + "\n")
+
+
+class ResultWriter:
+    """
+    Writes the per-passenger and per-run results of boarding runs as columns, in batches.
+
+    With the "csv" format, the rows are appended to `<prefix>_passengers.csv` and
+    `<prefix>_runs.csv` every `batch_size` passengers. With the "npz" format, each batch is
+    converted to NumPy arrays, and all batches are saved to `<prefix>.npz` when the writer is
+    closed: the arrays of the whole output stay in memory until then, so schedules too large for
+    memory should use the "csv" format, whose memory use is bounded by `batch_size`.
+
+    Methods:
+    - add_run(flight_id, aircraft, flight, result): Adds the results of one boarding run
+    - flush(): Writes the buffered rows
+    - close(): Flushes and closes the output
+    """
+
+    def __init__(self, prefix, output_format: str = "csv", batch_size: int = 10000):
+        """
+        Initializes a ResultWriter.
+
+        Args:
+            prefix (str): The path of the output files, without extension.
+            output_format (str): "csv" or "npz".
+            batch_size (int): The number of passenger rows buffered between two writes.
+        """
+        if output_format not in ("csv", "npz"):
+            raise ValueError(f"Unknown output format: {output_format}")
+        self._prefix = str(prefix)
+        self._format = output_format
+        self._batch_size = batch_size
+        self._passengers = {column: [] for column in PASSENGER_COLUMNS}
+        self._runs = {column: [] for column in RUN_COLUMNS}
+        self._chunks = {"passengers": [], "runs": []}  # NumPy batches of the "npz" format
+        self._files = []
+        self._writers = {}
+        self._closed = False
+        if output_format == "csv":
+            for name, columns in (("passengers", PASSENGER_COLUMNS), ("runs", RUN_COLUMNS)):
+                file = open(f"{self._prefix}_{name}.csv", "w", newline="")
+                self._files.append(file)
+                self._writers[name] = csv.writer(file)
+                self._writers[name].writerow(columns)
+
+    def add_run(self, flight_id, aircraft, flight, result):
+        """
+        Adds the results of one boarding run.
+
+        Args:
+            flight_id (str): The identifier of the flight.
+            aircraft (str): The aircraft specification of the flight.
+            flight (Flight): The boarded flight.
+            result (BoardingResult): The result of its boarding.
+        """
+        seat_times = result.seat_times
+        columns = self._passengers
+        for passenger in flight.passengers:
+            if passenger.seat is None:
+                continue
+            columns["flight"].append(flight_id)
+            columns["passenger"].append(passenger.identifier)
+            columns["seat"].append(passenger.seat.name)
+            columns["group"].append(passenger.group)
+            columns["reduced_mobility"].append(passenger.reduced_mobility)
+            columns["seat_time"].append(seat_times.get(passenger.identifier, -1))
+        for column, value in zip(RUN_COLUMNS, (flight_id, aircraft, len(seat_times), result.ticks, result.total_congestion)):
+            self._runs[column].append(value)
+        if len(columns["flight"]) >= self._batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered rows: appends them to the CSV files, or converts them to NumPy arrays.
+        """
+        for name, columns in (("passengers", self._passengers), ("runs", self._runs)):
+            if not next(iter(columns.values())):
+                continue
+            if self._format == "csv":
+                self._writers[name].writerows(zip(*columns.values()))
+            else:
+                import numpy as np  # Only needed for the "npz" format
+
+                self._chunks[name].append({column: np.asarray(values) for column, values in columns.items()})
+            for values in columns.values():
+                values.clear()
+
+    def close(self):
+        """
+        Flushes the buffered rows and closes the output.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        for file in self._files:
+            file.close()
+        if self._format == "npz":
+            import numpy as np  # Only needed for the "npz" format
+
+            arrays = {}
+            for name, columns in (("passengers", PASSENGER_COLUMNS), ("runs", RUN_COLUMNS)):
+                for column in columns:
+                    chunks = [chunk[column] for chunk in self._chunks[name]]
+                    arrays[f"{name}_{column}"] = np.concatenate(chunks) if chunks else np.array([])
+            np.savez_compressed(f"{self._prefix}.npz", **arrays)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def replay(path, output, output_format="csv", default_aircraft=None, engine="objects", strategy=None, seed=0,
+           batch_size=10000):
+    """
+    Boards every manifest of a schedule file and writes the results, one flight at a time.
+
+    Args:
+        path (str): The path of the schedule (CSV or JSONL manifests).
+        output (str): The path of the output files, without extension.
+        output_format (str): "csv" or "npz".
+        default_aircraft (Aircraft, optional): The aircraft of the records without an aircraft column.
+        engine (str): The boarding engine passed to `Flight.run_headless`.
+        strategy (BoardingStrategy | str, optional): The boarding strategy. Defaults to the manifest's groups.
+        seed (int): The seed of the first flight, the next flights using the following seeds.
+        batch_size (int): The number of passenger rows buffered between two writes.
+
+    Returns:
+        int: The number of flights replayed.
+    """
+    count = 0
+    with ResultWriter(output, output_format, batch_size) as writer:
+        for flight_id, spec, records in iter_manifests(path):
+            flight = Flight(resolve_aircraft(spec, default_aircraft), seed=seed + count, manifest=records)
+            writer.add_run(flight_id, spec, flight, flight.run_headless(engine, strategy))
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replays booking manifests through the boarding simulation.")
+    parser.add_argument("schedule", help="manifests of the flights (CSV or JSONL), the records of a flight being consecutive")
+    parser.add_argument("--output", default="results", help="path of the result files, without extension")
+    parser.add_argument("--format", choices=["csv", "npz"], default="csv", help="format of the result files")
+    parser.add_argument("--rows", type=int, default=30, help="rows of the aircraft of the records without aircraft column")
+    parser.add_argument("--columns", type=int, default=6, help="columns of the aircraft of the records without aircraft column")
+    parser.add_argument("--engine", choices=["objects", "vectorized", "events"], default="objects", help="boarding engine")
+    parser.add_argument("--strategy", choices=list(STRATEGIES), help="boarding strategy (default: the manifest's groups)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first flight")
+    args = parser.parse_args()
+
+    count = replay(args.schedule, args.output, args.format, Aircraft(args.rows, args.columns), args.engine,
+                   args.strategy, args.seed)
+    print(f"Replayed {count} flights")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+import argparse
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+from models.aircraft import Aircraft
+from models.strategies import GroupAssignment, get_strategy
+from utils.run import init_worker, simulate_seed
+
+
+class GroupSearchResult:
+    """
+    Outcome of a boarding group search.
+
+    Attributes (Properties):
+    - assignment (dict): The best group of each (row, distance) seat class found
+    - mean (float): Its mean number of boarding ticks over the evaluation seeds
+    - history (list): The best mean after each iteration, starting with the initial assignment
+    - strategy (GroupAssignment): A strategy boarding with the best assignment
+    """
+
+    def __init__(self, assignment: dict, mean: float, history: list):
+        self._assignment = assignment
+        self._mean = mean
+        self._history = history
+
+    # Getter for the best assignment
+    @property
+    def assignment(self):
+        return self._assignment
+
+    # Getter for the mean boarding ticks of the best assignment
+    @property
+    def mean(self):
+        return self._mean
+
+    # Getter for the best mean after each iteration
+    @property
+    def history(self):
+        return self._history
+
+    # Getter for a strategy boarding with the best assignment
+    @property
+    def strategy(self):
+        return GroupAssignment(self._assignment)
+
+    def __repr__(self):
+        return f"GroupSearchResult(mean={self._mean:.2f}, iterations={len(self._history) - 1})"
+
+
+def seat_classes(aircraft):
+    """
+    Returns the seat classes of an aircraft: the (row, distance to the aisle) pairs of its seats.
+
+    Args:
+        aircraft (Aircraft): The aircraft.
+
+    Returns:
+        list: The sorted (row, distance) pairs.
+    """
+    distance_to_aisle = aircraft.cabin.distance_to_aisle
+    return sorted({(seat.number, distance_to_aisle[aircraft.column_of(seat.letter)]) for seat in aircraft.seats})
+
+
+def initial_assignment(aircraft, groups: int, strategy="back-to-front"):
+    """
+    Splits the seat classes of an aircraft into boarding groups following a strategy's priorities.
+
+    Args:
+        aircraft (Aircraft): The aircraft.
+        groups (int): The number of boarding groups.
+        strategy (BoardingStrategy | str): The strategy whose priorities order the seat classes.
+
+    Returns:
+        dict: The group of each (row, distance) seat class.
+    """
+    strategy = get_strategy(strategy)
+    classes = seat_classes(aircraft)
+    max_distance = max(distance for _, distance in classes)
+    ranked = sorted(classes, key=lambda c: strategy.priority(c[0], c[1], 0, aircraft.rows, max_distance))
+    return {seat_class: rank * groups // len(ranked) for rank, seat_class in enumerate(ranked)}
+
+
+def _neighbour(assignment: dict, groups: int, rng: random.Random):
+    """
+    Returns a copy of an assignment with one random move: a seat class changes group, or two
+    seat classes of different groups swap their groups.
+    """
+    candidate = dict(assignment)
+    classes = list(candidate)
+    first = rng.choice(classes)
+    if rng.random() < 0.5:
+        candidate[first] = rng.choice([group for group in range(groups) if group != candidate[first]])
+    else:
+        second = rng.choice(classes)
+        candidate[first], candidate[second] = candidate[second], candidate[first]
+    return candidate
+
+
+def optimize_groups(aircraft, groups: int = 4, iterations: int = 50, neighbours: int = 8, replications: int = 30,
+                    workers: int = 1, seed: int = 0, engine: str = "objects", initial="back-to-front",
+                    search_seed: int = 0):
+    """
+    Searches the boarding group assignment minimizing the mean boarding ticks of an aircraft,
+    by local search. Each iteration evaluates several random neighbours of the current best
+    assignment and keeps the best one if it improves the mean.
+
+    Every assignment is evaluated on the same seeds (common random numbers), so that the
+    comparison between two assignments only reflects the boarding order.
+
+    Args:
+        aircraft (Aircraft): The aircraft to board.
+        groups (int): The number of boarding groups.
+        iterations (int): The number of local search iterations.
+        neighbours (int): The number of neighbours evaluated per iteration.
+        replications (int): The number of seeds each assignment is evaluated on.
+        workers (int): The number of worker processes (1 runs in the current process).
+        seed (int): The first evaluation seed.
+        engine (str): The boarding engine passed to `Flight.run_headless`.
+        initial (BoardingStrategy | str | dict): The starting assignment, or the strategy whose
+            priorities build it (see `initial_assignment`).
+        search_seed (int): The seed of the random moves.
+
+    Returns:
+        GroupSearchResult: The best assignment found and the search history.
+    """
+    rng = random.Random(search_seed)
+    seeds = list(range(seed, seed + replications))
+    best = dict(initial) if isinstance(initial, dict) else initial_assignment(aircraft, groups, initial)
+
+    def evaluate(candidates, run):
+        tasks = [(s, engine, GroupAssignment(candidate)) for candidate in candidates for s in seeds]
+        ticks = list(run(simulate_seed, *zip(*tasks)))
+        return [statistics.fmean(ticks[i * replications:(i + 1) * replications]) for i in range(len(candidates))]
+
+    def search(run):
+        nonlocal best
+        best_mean = evaluate([best], run)[0]
+        history = [best_mean]
+        for _ in range(iterations):
+            candidates = [_neighbour(best, groups, rng) for _ in range(neighbours)]
+            means = evaluate(candidates, run)
+            index = min(range(len(candidates)), key=means.__getitem__)
+            if means[index] < best_mean:
+                best, best_mean = candidates[index], means[index]
+            history.append(best_mean)
+        return GroupSearchResult(best, best_mean, history)
+
+    if workers <= 1:
+        init_worker(aircraft)
+        return search(map)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(aircraft,)) as executor:
+        return search(lambda function, *args: executor.map(function, *args, chunksize=max(1, replications // workers)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Searches the boarding groups minimizing the mean boarding ticks.")
+    parser.add_argument("--rows", type=int, default=30, help="number of rows")
+    parser.add_argument("--columns", type=int, default=6, help="number of seats per row")
+    parser.add_argument("--groups", type=int, default=4, help="number of boarding groups")
+    parser.add_argument("--iterations", type=int, default=50, help="local search iterations")
+    parser.add_argument("--neighbours", type=int, default=8, help="neighbours evaluated per iteration")
+    parser.add_argument("--runs", type=int, default=30, help="seeds each assignment is evaluated on")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="first evaluation seed")
+    parser.add_argument("--initial", default="back-to-front", help="strategy building the initial groups")
+    args = parser.parse_args()
+
+    result = optimize_groups(
+        Aircraft(args.rows, args.columns),
+        groups=args.groups,
+        iterations=args.iterations,
+        neighbours=args.neighbours,
+        replications=args.runs,
+        workers=args.workers,
+        seed=args.seed,
+        initial=args.initial,
+    )
+    print(f"Mean boarding ticks: {result.history[0]:.2f} -> {result.mean:.2f}")
+    distances = sorted({distance for _, distance in result.assignment})
+    print("Row | " + " ".join(f"d{distance}" for distance in distances))
+    for row in range(1, args.rows + 1):
+        print(f"{row:>3} | " + " ".join(f"{result.assignment.get((row, d), '-'):>2}" for d in distances))
+
+
+if __name__ == "__main__":
+    main()
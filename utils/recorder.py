@@ -0,0 +1,270 @@
+import mmap
+import struct
+import sys
+from array import array
+
+# File layout (little-endian):
+#   header   magic "FSTR", version, rows, columns, chunk size
+#   frames   one per tick; the first frame of each chunk is a keyframe holding every cell,
+#            the others only hold the cells that changed since the previous tick
+#   index    the offset of each frame (u64)
+#   footer   offset of the index, number of ticks, magic "FEND"
+# A cell is stored as its state (u8, see `Flight.cell_state`) and the identifier of its
+# passenger plus one (u32, 0 when empty).
+MAGIC = b"FSTR"
+END_MAGIC = b"FEND"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHH")
+FOOTER = struct.Struct("<QI4s")
+FRAME_HEADER = struct.Struct("<BI")  # Frame type, number of cells that follow
+CHANGE = struct.Struct("<IBI")  # Cell index, state, passenger
+KEYFRAME = 0
+DELTA = 1
+
+
+def _little_endian(values: array):
+    """
+    Converts an array between native and little-endian byte order, in place.
+    """
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def _cabin_frame(flight):
+    """
+    Reads the state of every cell of a flight's layout, row by row.
+
+    Returns:
+        tuple: The states (bytearray) and the passengers (array of u32, identifier plus one).
+    """
+    layout = flight.layout
+    rows, columns = len(layout) - 1, len(layout[-1])
+    states = bytearray(rows * columns)
+    passengers = array("I", bytes(4 * rows * columns))
+    for row in range(rows):
+        for column in range(columns):
+            state, passenger = flight.cell_state(row, column)
+            index = row * columns + column
+            states[index] = state
+            if passenger is not None:
+                passengers[index] = passenger.identifier + 1
+    return states, passengers
+
+
+class TrajectoryRecorder:
+    """
+    Streams the cabin state of a boarding run to a compact binary file, one frame per tick.
+
+    Frames are grouped into chunks of `chunk_size` ticks: a keyframe with every cell, then
+    the changes of each tick. An index of frame offsets is written when the recorder is
+    closed, so `TrajectoryReader` can seek to any tick by replaying at most one chunk.
+
+    Methods:
+    - attach(flight): Records the current state of a flight, then each of its ticks
+    - record(flight): Records the current state of a flight as the next tick
+    - close(): Writes the index and closes the file
+    """
+
+    def __init__(self, path, chunk_size: int = 32):
+        """
+        Initializes a TrajectoryRecorder.
+
+        Args:
+            path (str): The path of the file to write.
+            chunk_size (int): The number of ticks between two keyframes.
+        """
+        self._file = open(path, "wb")
+        self._chunk_size = chunk_size
+        self._offsets = array("Q")  # Offset of each frame
+        self._previous = None  # States and passengers of the last recorded frame
+        self._flight = None
+
+    def attach(self, flight):
+        """
+        Records the current state of a flight as tick 0, then records each of its boarding ticks.
+
+        Args:
+            flight (Flight): The flight to record.
+        """
+        self._flight = flight
+        self.record(flight)
+        flight.add_observer(self._on_event)
+
+    def _on_event(self, event, passenger, row, column, tick):
+        """
+        Records a frame at the end of each tick (observer callback).
+        """
+        if event == "tick":
+            self.record(self._flight)
+
+    def record(self, flight):
+        """
+        Records the current state of a flight as the next tick.
+
+        Args:
+            flight (Flight): The recorded flight.
+        """
+        states, passengers = _cabin_frame(flight)
+        if self._previous is None:
+            layout = flight.layout
+            self._file.write(HEADER.pack(MAGIC, VERSION, len(layout) - 1, len(layout[-1]), self._chunk_size))
+
+        self._offsets.append(self._file.tell())
+        if len(self._offsets) % self._chunk_size == 1 or self._chunk_size == 1:
+            self._file.write(FRAME_HEADER.pack(KEYFRAME, len(states)))
+            self._file.write(states)
+            self._file.write(_little_endian(array("I", passengers)).tobytes())
+        else:
+            previous_states, previous_passengers = self._previous
+            changes = [
+                CHANGE.pack(index, states[index], passengers[index])
+                for index in range(len(states))
+                if states[index] != previous_states[index] or passengers[index] != previous_passengers[index]
+            ]
+            self._file.write(FRAME_HEADER.pack(DELTA, len(changes)))
+            self._file.write(b"".join(changes))
+        self._previous = (states, passengers)
+
+    def close(self):
+        """
+        Writes the index of the frames and closes the file.
+        """
+        if self._file.closed:
+            return
+        if self._flight is not None:
+            self._flight.remove_observer(self._on_event)
+        index_offset = self._file.tell()
+        self._file.write(_little_endian(self._offsets).tobytes())
+        self._file.write(FOOTER.pack(index_offset, len(self._offsets), END_MAGIC))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TrajectoryReader:
+    """
+    Reads a file written by `TrajectoryRecorder` through a memory map, without loading it.
+
+    Any tick is reached by decoding its chunk's keyframe and at most `chunk_size - 1` deltas.
+
+    Attributes (Properties):
+    - rows (int): The number of rows of the recorded layout
+    - columns (int): The number of columns of the recorded layout (aisles included)
+    - chunk_size (int): The number of ticks between two keyframes
+
+    Methods:
+    - frame(tick): The states and passengers of every cell at a tick
+    - grid(tick): The states of the cells at a tick, row by row
+    - close(): Closes the memory map
+    """
+
+    def __init__(self, path):
+        """
+        Initializes a TrajectoryReader.
+
+        Args:
+            path (str): The path of the recorded file.
+        """
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._rows, self._columns, self._chunk_size = HEADER.unpack_from(self._map, 0)
+        index_offset, self._ticks, end_magic = FOOTER.unpack_from(self._map, len(self._map) - FOOTER.size)
+        if magic != MAGIC or end_magic != END_MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a complete trajectory file")
+        self._offsets = _little_endian(array("Q", self._map[index_offset:index_offset + 8 * self._ticks]))
+
+    # Getter for the number of rows
+    @property
+    def rows(self):
+        return self._rows
+
+    # Getter for the number of columns
+    @property
+    def columns(self):
+        return self._columns
+
+    # Getter for the chunk size
+    @property
+    def chunk_size(self):
+        return self._chunk_size
+
+    def __len__(self):
+        return self._ticks
+
+    def _apply(self, tick, states, passengers):
+        """
+        Applies the frame of a tick to the states and passengers of the previous tick.
+        """
+        offset = self._offsets[tick]
+        kind, count = FRAME_HEADER.unpack_from(self._map, offset)
+        offset += FRAME_HEADER.size
+        if kind == KEYFRAME:
+            states[:] = self._map[offset:offset + count]
+            passengers[:] = _little_endian(array("I", self._map[offset + count:offset + 5 * count]))
+            return
+        for index, state, passenger in CHANGE.iter_unpack(self._map[offset:offset + CHANGE.size * count]):
+            states[index] = state
+            passengers[index] = passenger
+
+    def frame(self, tick: int):
+        """
+        Returns the state of the cabin at a tick.
+
+        Args:
+            tick (int): The tick (0 is the state before the first tick).
+
+        Returns:
+            tuple: The states (bytearray) and the passengers (array of u32, identifier plus one,
+            0 when empty) of every cell, row by row.
+        """
+        if not 0 <= tick < self._ticks:
+            raise IndexError(f"tick {tick} out of range (0 to {self._ticks - 1})")
+        states = bytearray(self._rows * self._columns)
+        passengers = array("I", bytes(4 * self._rows * self._columns))
+        for current in range(tick - tick % self._chunk_size, tick + 1):
+            self._apply(current, states, passengers)
+        return states, passengers
+
+    def grid(self, tick: int):
+        """
+        Returns the states of the cabin cells at a tick.
+
+        Args:
+            tick (int): The tick.
+
+        Returns:
+            list: One list of cell states per row.
+        """
+        states, _ = self.frame(tick)
+        return [list(states[row * self._columns:(row + 1) * self._columns]) for row in range(self._rows)]
+
+    def __iter__(self):
+        """
+        Replays every tick in order, decoding each frame once.
+
+        Yields:
+            tuple: The states and passengers of every cell at each tick. The same buffers are
+            updated in place between ticks.
+        """
+        states = bytearray(self._rows * self._columns)
+        passengers = array("I", bytes(4 * self._rows * self._columns))
+        for tick in range(self._ticks):
+            self._apply(tick, states, passengers)
+            yield states, passengers
+
+    def close(self):
+        """
+        Closes the memory map.
+        """
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
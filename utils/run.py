@@ -0,0 +1,221 @@
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt
+
+from models.flight import Flight
+from models.strategies import STRATEGIES, get_strategy
+
+# Aircraft simulated by the current worker process, set once by `init_worker`
+_worker_aircraft = None
+
+
+class MonteCarloSummary:
+    """
+    Aggregated statistics of the boarding ticks of several replications.
+
+    Attributes (Properties):
+    - count (int): The number of replications aggregated
+    - mean (float): The mean number of boarding ticks
+    - stdev (float): The sample standard deviation of the boarding ticks
+    - percentiles (dict): The 5th, 50th, 95th percentiles of the boarding ticks
+    - confidence_interval (tuple): The bounds of the confidence interval of the mean
+    """
+
+    def __init__(self, ticks: list, confidence: float = 0.95):
+        """
+        Initializes a MonteCarloSummary from the boarding ticks of each replication.
+
+        Args:
+            ticks (list): The number of boarding ticks of each replication.
+            confidence (float): The confidence level of the interval of the mean.
+        """
+        self._count = len(ticks)
+        self._mean = statistics.fmean(ticks)
+        self._stdev = statistics.stdev(ticks) if self._count > 1 else 0.0
+        if self._count > 1:
+            cut_points = statistics.quantiles(ticks, n=100, method="inclusive")
+            self._percentiles = {5: cut_points[4], 50: cut_points[49], 95: cut_points[94]}
+        else:
+            self._percentiles = {5: ticks[0], 50: ticks[0], 95: ticks[0]}
+        # Normal approximation of the sampling distribution of the mean
+        margin = statistics.NormalDist().inv_cdf(0.5 + confidence / 2) * self._stdev / sqrt(self._count)
+        self._confidence_interval = (self._mean - margin, self._mean + margin)
+
+    # Getter for the number of replications
+    @property
+    def count(self):
+        return self._count
+
+    # Getter for the mean boarding ticks
+    @property
+    def mean(self):
+        return self._mean
+
+    # Getter for the standard deviation of the boarding ticks
+    @property
+    def stdev(self):
+        return self._stdev
+
+    # Getter for the percentiles of the boarding ticks
+    @property
+    def percentiles(self):
+        return self._percentiles
+
+    # Getter for the confidence interval of the mean
+    @property
+    def confidence_interval(self):
+        return self._confidence_interval
+
+    def __repr__(self):
+        low, high = self._confidence_interval
+        return (
+            f"MonteCarloSummary(count={self._count}, mean={self._mean:.2f}, "
+            f"ci=[{low:.2f}, {high:.2f}], p50={self._percentiles[50]}, p95={self._percentiles[95]})"
+        )
+
+
+def init_worker(aircraft):
+    """
+    Stores the aircraft to simulate in the worker process, so it is sent only once per worker.
+    Used as the initializer of the process pools of this module and of `utils.optimizer`.
+
+    Args:
+        aircraft (Aircraft): The aircraft to simulate.
+    """
+    global _worker_aircraft
+    _worker_aircraft = aircraft
+
+
+def simulate_seed(seed, engine="objects", strategy=None, doors=None):
+    """
+    Runs one headless boarding of the aircraft set by `init_worker`.
+
+    Args:
+        seed (int): The seed of the flight.
+        engine (str): The boarding engine passed to `Flight.run_headless`.
+        strategy (BoardingStrategy | str, optional): The boarding strategy passed to `Flight.run_headless`.
+        doors (list, optional): The door rows passed to `Flight.run_headless`.
+
+    Returns:
+        int: The number of boarding ticks.
+    """
+    return Flight(_worker_aircraft, seed=seed).run_headless(engine, strategy, doors=doors).ticks
+
+
+def simulate_replications(aircraft, replications: int, workers: int = 1, seed: int = 0, engine: str = "objects",
+                          strategy=None, doors=None):
+    """
+    Runs independent seeded boarding simulations, replication `i` using the seed `seed + i`.
+    Results are yielded in replication order, so they do not depend on the number of workers.
+
+    Args:
+        aircraft (Aircraft): The aircraft to simulate.
+        replications (int): The number of simulations to run.
+        workers (int): The number of worker processes (1 runs in the current process).
+        seed (int): The seed of the first replication.
+        engine (str): The boarding engine passed to `Flight.run_headless`.
+        strategy (BoardingStrategy | str, optional): The boarding strategy passed to `Flight.run_headless`.
+        doors (list, optional): The door rows passed to `Flight.run_headless`.
+
+    Yields:
+        tuple: The seed and the number of boarding ticks of each replication.
+    """
+    seeds = range(seed, seed + replications)
+    engines = [engine] * replications
+    strategies = [strategy] * replications
+    door_lists = [doors] * replications
+    if workers <= 1:
+        init_worker(aircraft)
+        yield from zip(seeds, map(simulate_seed, seeds, engines, strategies, door_lists))
+        return
+
+    chunksize = max(1, replications // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(aircraft,)) as executor:
+        yield from zip(seeds, executor.map(simulate_seed, seeds, engines, strategies, door_lists, chunksize=chunksize))
+
+
+def monte_carlo(aircraft, replications: int, workers: int = 1, seed: int = 0, engine: str = "objects",
+                report_every: int = 100, confidence: float = 0.95, strategy=None, doors=None):
+    """
+    Evaluates a boarding configuration over many seeds and streams the aggregated statistics.
+
+    Args:
+        aircraft (Aircraft): The aircraft to simulate.
+        replications (int): The number of simulations to run.
+        workers (int): The number of worker processes.
+        seed (int): The seed of the first replication.
+        engine (str): The boarding engine passed to `Flight.run_headless`.
+        report_every (int): The number of replications between two summaries.
+        confidence (float): The confidence level of the interval of the mean.
+        strategy (BoardingStrategy | str, optional): The boarding strategy passed to `Flight.run_headless`.
+        doors (list, optional): The door rows passed to `Flight.run_headless`.
+
+    Yields:
+        MonteCarloSummary: The statistics of the replications completed so far, the last one
+        covering all of them.
+    """
+    ticks = []
+    for _, replication_ticks in simulate_replications(aircraft, replications, workers, seed, engine, strategy, doors):
+        ticks.append(replication_ticks)
+        if len(ticks) % report_every == 0 or len(ticks) == replications:
+            yield MonteCarloSummary(ticks, confidence)
+
+
+def compare_strategies(aircraft, strategies=None, replications: int = 100, workers: int = 1, seed: int = 0,
+                       engine: str = "objects", confidence: float = 0.95):
+    """
+    Runs several boarding strategies on the same sold-seat manifests. Replication `i` of every
+    strategy uses the seed `seed + i`, and seats are sold before the strategy draws anything,
+    so all strategies board the same passengers with the same seats and baggage.
+
+    Args:
+        aircraft (Aircraft): The aircraft to simulate.
+        strategies (iterable, optional): The strategies or their names. Defaults to all built-in strategies.
+        replications (int): The number of manifests each strategy boards.
+        workers (int): The number of worker processes.
+        seed (int): The seed of the first replication.
+        engine (str): The boarding engine passed to `Flight.run_headless`.
+        confidence (float): The confidence level of the interval of the mean.
+
+    Returns:
+        dict: A mapping of strategy names to their MonteCarloSummary, fastest mean first.
+    """
+    strategies = [get_strategy(strategy) for strategy in (strategies or STRATEGIES)]
+    summaries = {}
+    for strategy in strategies:
+        ticks = [
+            replication_ticks
+            for _, replication_ticks in simulate_replications(aircraft, replications, workers, seed, engine, strategy)
+        ]
+        summaries[strategy.name or repr(strategy)] = MonteCarloSummary(ticks, confidence)
+    return dict(sorted(summaries.items(), key=lambda item: item[1].mean))
+
+
+def compare_doors(aircraft, door_sets, replications: int = 100, workers: int = 1, seed: int = 0,
+                  engine: str = "objects", strategy=None, confidence: float = 0.95):
+    """
+    Boards the same sold-seat manifests through several sets of doors, to measure the
+    throughput gain of multi-door boarding. Replication `i` of every door set uses the seed
+    `seed + i`, so every door set boards the same passengers with the same seats and baggage.
+
+    Args:
+        aircraft (Aircraft): The aircraft to simulate.
+        door_sets (iterable): The door rows (1-based) of each configuration, e.g. [[1], [1, 30]].
+        replications (int): The number of manifests each door set boards.
+        workers (int): The number of worker processes.
+        seed (int): The seed of the first replication.
+        engine (str): The boarding engine passed to `Flight.run_headless`.
+        strategy (BoardingStrategy | str, optional): The boarding strategy passed to `Flight.run_headless`.
+        confidence (float): The confidence level of the interval of the mean.
+
+    Returns:
+        dict: A mapping of door sets (tuples) to their MonteCarloSummary, in the given order.
+    """
+    summaries = {}
+    for doors in door_sets:
+        ticks = [
+            replication_ticks
+            for _, replication_ticks in simulate_replications(aircraft, replications, workers, seed, engine, strategy, list(doors))
+        ]
+        summaries[tuple(doors)] = MonteCarloSummary(ticks, confidence)
+    return summaries
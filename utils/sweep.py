@@ -0,0 +1,201 @@
+import argparse
+import hashlib
+import itertools
+import json
+import random
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from models.aircraft import Aircraft
+from models.flight import Flight
+from utils.run import MonteCarloSummary
+
+# Parameters of a sweep point and their default values (those of `Flight` and `Aircraft(30, 6)`)
+DEFAULTS = {
+    "rows": 30,
+    "columns": 6,
+    "strategy": "random",
+    "min_load": 0.95,
+    "max_load": 1.03,
+    "baggage_probability": 0.7,
+    "stow_ticks": 1,
+}
+
+DEFAULT_CACHE_DIR = Path(".sweep_cache")
+
+# Aircraft built by the current worker process, by (rows, columns)
+_worker_aircraft = {}
+
+
+def grid(**axes):
+    """
+    Builds the points of a full grid over parameter values.
+
+    Args:
+        **axes: A list of values for each parameter of DEFAULTS to vary.
+
+    Returns:
+        list: One parameter dict per combination, the other parameters keeping their default.
+    """
+    names = list(axes)
+    return [dict(DEFAULTS, **dict(zip(names, values))) for values in itertools.product(*axes.values())]
+
+
+def random_sample(count: int, seed: int = 0, **axes):
+    """
+    Draws random points from parameter ranges.
+
+    Args:
+        count (int): The number of points to draw.
+        seed (int): The seed of the draw.
+        **axes: For each parameter to vary, a list of values to pick from, or a (low, high)
+            tuple to draw from uniformly (integers when both bounds are integers). The drawn
+            "min_load" and "max_load" are swapped when needed to keep a valid load range.
+
+    Returns:
+        list: The parameter dicts.
+    """
+    rng = random.Random(seed)
+    points = []
+    for _ in range(count):
+        point = dict(DEFAULTS)
+        for name, values in axes.items():
+            if isinstance(values, tuple):
+                low, high = values
+                point[name] = rng.randint(low, high) if isinstance(low, int) and isinstance(high, int) else rng.uniform(low, high)
+            else:
+                point[name] = rng.choice(values)
+        if point["min_load"] > point["max_load"]:
+            point["min_load"], point["max_load"] = point["max_load"], point["min_load"]
+        points.append(point)
+    return points
+
+
+def point_key(point: dict, replications: int, seed: int, engine: str):
+    """
+    Returns the cache key of a sweep point: a hash of its parameters and of the replications run.
+    """
+    description = json.dumps({"point": point, "replications": replications, "seed": seed, "engine": engine}, sort_keys=True)
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+def simulate_point(point: dict, seed: int, engine: str = "objects"):
+    """
+    Runs one headless boarding of a sweep point.
+
+    Args:
+        point (dict): The parameters of the point.
+        seed (int): The seed of the flight.
+        engine (str): The boarding engine passed to `Flight.run_headless`.
+
+    Returns:
+        int: The number of boarding ticks.
+    """
+    shape = (point["rows"], point["columns"])
+    if shape not in _worker_aircraft:
+        _worker_aircraft[shape] = Aircraft(*shape)
+    flight = Flight(
+        _worker_aircraft[shape],
+        seed=seed,
+        load_factor=(point["min_load"], point["max_load"]),
+        baggage_probability=point["baggage_probability"],
+        stow_ticks=point["stow_ticks"],
+    )
+    return flight.run_headless(engine, point["strategy"]).ticks
+
+
+def _simulate_task(task):
+    """
+    Runs one (point, seed, engine) task in a worker process.
+    """
+    return simulate_point(*task)
+
+
+def run_sweep(points, replications: int = 100, workers: int = 1, seed: int = 0, engine: str = "objects",
+              cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Evaluates every point of a sweep, replication `i` using the seed `seed + i`. Points already
+    evaluated with the same replications are read from the cache instead of simulated.
+
+    Args:
+        points (list): The parameter dicts (see `grid` and `random_sample`).
+        replications (int): The number of simulations per point.
+        workers (int): The number of worker processes.
+        seed (int): The seed of the first replication.
+        engine (str): The boarding engine passed to `Flight.run_headless`.
+        cache_dir (Path, optional): The directory of the cached results, None to disable the cache.
+
+    Returns:
+        list: For each point, in order, a dict with its parameters and the statistics of its
+        boarding ticks (count, mean, stdev, p5, p50, p95, ci_low, ci_high).
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else None
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    results = [None] * len(points)
+    pending = []  # Indices of the points to simulate
+    for index, point in enumerate(points):
+        point = dict(DEFAULTS, **point)
+        cached = cache_dir / f"{point_key(point, replications, seed, engine)}.json" if cache_dir is not None else None
+        if cached is not None and cached.exists():
+            results[index] = json.loads(cached.read_text())
+        else:
+            pending.append(index)
+
+    tasks = [(dict(DEFAULTS, **points[index]), seed + replication, engine)
+             for index in pending for replication in range(replications)]
+    if workers <= 1:
+        ticks = list(map(_simulate_task, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            ticks = list(executor.map(_simulate_task, tasks, chunksize=max(1, len(tasks) // (workers * 8))))
+
+    for position, index in enumerate(pending):
+        point = dict(DEFAULTS, **points[index])
+        summary = MonteCarloSummary(ticks[position * replications:(position + 1) * replications])
+        results[index] = dict(
+            point,
+            count=summary.count,
+            mean=summary.mean,
+            stdev=summary.stdev,
+            p5=summary.percentiles[5],
+            p50=summary.percentiles[50],
+            p95=summary.percentiles[95],
+            ci_low=summary.confidence_interval[0],
+            ci_high=summary.confidence_interval[1],
+        )
+        if cache_dir is not None:
+            (cache_dir / f"{point_key(point, replications, seed, engine)}.json").write_text(json.dumps(results[index]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweeps boarding parameters and reports the mean boarding ticks.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[DEFAULTS["rows"]], help="numbers of rows")
+    parser.add_argument("--columns", type=int, nargs="+", default=[DEFAULTS["columns"]], help="numbers of seats per row")
+    parser.add_argument("--strategy", nargs="+", default=[DEFAULTS["strategy"]], help="boarding strategies")
+    parser.add_argument("--baggage-probability", type=float, nargs="+", default=[DEFAULTS["baggage_probability"]])
+    parser.add_argument("--stow-ticks", type=int, nargs="+", default=[DEFAULTS["stow_ticks"]])
+    parser.add_argument("--runs", type=int, default=100, help="replications per point")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first replication")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="directory of the cached results")
+    args = parser.parse_args()
+
+    points = grid(
+        rows=args.rows,
+        columns=args.columns,
+        strategy=args.strategy,
+        baggage_probability=args.baggage_probability,
+        stow_ticks=args.stow_ticks,
+    )
+    for result in sorted(run_sweep(points, args.runs, args.workers, args.seed, cache_dir=args.cache_dir), key=lambda r: r["mean"]):
+        print(
+            f"{result['rows']:>4}x{result['columns']:<3} {result['strategy']:>16} | baggage {result['baggage_probability']:.2f} "
+            f"| stow {result['stow_ticks']} | mean {result['mean']:8.2f} [{result['ci_low']:.2f}, {result['ci_high']:.2f}]"
+        )
+
+
+if __name__ == "__main__":
+    main()